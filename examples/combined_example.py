@@ -12,20 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nvidia_clara.jobs_client import JobsClient
-from nvidia_clara.pipelines_client import PipelinesClient
-from nvidia_clara.payloads_client import PayloadsClient
+from nvidia_clara.clara_session import ClaraSession
+from nvidia_clara.job_watcher import JobWatcher
 import nvidia_clara.pipeline_types as pipeline_types
 import os
 from pathlib import Path
 
-# Clients creation
+# Clients creation, sharing a single connection to the server
 clara_ip_address = "10.0.0.1"
 clara_port = "30031"
 
-jobs_client = JobsClient(target=clara_ip_address, port=clara_port)
-payloads_client = PayloadsClient(target=clara_ip_address, port=clara_port)
-pipeline_client = PipelinesClient(target=clara_ip_address, port=clara_port)
+session = ClaraSession(target=clara_ip_address, port=clara_port)
+
+jobs_client = session.jobs_client()
+payloads_client = session.payloads_client()
+pipeline_client = session.pipelines_client()
 
 # Create list of pipeline_types.PipelineDefinition with local path to pipeline .yaml
 file_path = "../spleen_pipeline.yaml"
@@ -54,29 +55,17 @@ job_list = jobs_client.list_jobs()
 # Start Job
 job_token = jobs_client.start_job(job_id=job_id)
 
-# Loop until job completes
-job_status = jobs_client.get_status(job_id=job_id)
-while job_status.job_state != 3:
-    job_status = jobs_client.get_status(job_id=job_id)
-
-# Get Payload Details - Used to get list of payload files
-payload_details = payloads_client.get_details(payload_id=payload_id)
-
-# Download files from payload if pertaining to output payload directory (ex. "/operators)
-for file in payload_details.file_details:
-
-    # Get file path on Server (ex. /operators/dicom-reader/example_file.raw")
-    file_name = file.name
+# Wait until job completes, refreshing the jobs watched with a single list call per interval
+with JobWatcher(jobs_client) as job_watcher:
+    job_info = job_watcher.wait([job_id])[0]
 
-    # Split file path name (ex. ['','operators','dicom-reader','example_file.raw']
-    name = file_name.split('/')
-
-    # Check if file pertains to output directory (ex. "/operators)
-    if name[1] == 'operators':
-
-        # Download file to a local results directory to a file with same name on server (ex. example_file.raw)
-        with open("./results/"+name[-1], 'wb+') as wb:
-            payloads_client.download_from(payload_id=payload_id, blob_name="."+file_name, dest_obj=wb)
+# Download the output files of the operators (ex. "/operators/dicom-reader/example_file.raw") to a local results
+# directory, keeping their layout (ex. "./results/operators/dicom-reader/example_file.raw"), over concurrent streams
+download_stats = payloads_client.download_all(payload_id=payload_id, dest_dir="./results", include="operators/*")
+print("Downloaded", download_stats.total_bytes, "bytes at", download_stats.bytes_per_second, "bytes/sec")
 
 # Gets list of operator logs from job
 jobs_logs = jobs_client.job_logs(job_id=job_id, operator_name="dicom-reader")
+
+# Close the connection shared by the clients
+session.close()
@@ -13,11 +13,15 @@
 # limitations under the License.
 
 from nvidia_clara.jobs_client import JobsClient
+from nvidia_clara.job_submitter import JobSubmitter
+from nvidia_clara.job_watcher import JobWatcher
 from nvidia_clara.pipelines_client import PipelinesClient
 from nvidia_clara.payloads_client import PayloadsClient
 from nvidia_clara.models_client import ModelsClient
-from nvidia_clara.base_client import BaseClient
+from nvidia_clara.base_client import BaseClient, ChannelOptions
 from nvidia_clara.clara_client import ClaraClient
+from nvidia_clara.clara_session import ClaraSession
+from nvidia_clara.payload_registry import PayloadRegistry
 import nvidia_clara.pipeline_types as PipelineTypes
 import nvidia_clara.job_types as JobTypes
 import nvidia_clara.payload_types as PayloadTypes
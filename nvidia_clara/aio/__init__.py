@@ -0,0 +1,21 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from nvidia_clara.aio.base_client import AsyncBaseClient
+from nvidia_clara.aio.jobs_client import JobsClient
+from nvidia_clara.aio.pipelines_client import PipelinesClient
+from nvidia_clara.aio.payloads_client import PayloadsClient
+from nvidia_clara.aio.models_client import ModelsClient
+from nvidia_clara.aio.clara_client import ClaraClient
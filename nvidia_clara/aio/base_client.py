@@ -0,0 +1,126 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Any, List, Tuple
+import grpc
+import grpc.aio
+from nvidia_clara.base_client import BaseClient, ChannelOptions
+
+
+class AsyncBaseClient(BaseClient):
+    """
+    Base of the asyncio clients.
+
+    Calls are issued over a "grpc.aio" channel, so any number of calls can be in flight on a single event loop without
+    a thread per call. The owning client, or the channel passed in, must be used from the event loop it was created on.
+    """
+
+    # Generated stub class wrapped by the client
+    stub_class = None
+
+    def __init__(self, target: str, port: str = None, stub=None, channel: grpc.aio.Channel = None,
+                 channel_options: ChannelOptions = None):
+        """
+        Args:
+            target (str): ipv4 address of clara instance
+            port (str): if specified, port will be appended to the target with a ":"
+            channel (grpc.aio.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
+        """
+        if target is None:
+            raise Exception("Target must be initialized to a non-null value")
+
+        self._connection = target
+
+        if port is not None:
+            self._connection += ":" + port
+
+        self._channel_options = channel_options
+
+        if channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+        else:
+            self._channel = channel
+            self._owns_channel = False
+
+        if stub is None:
+            self._stub = self.stub_class(self._channel)
+        else:
+            self._stub = stub
+
+    @staticmethod
+    def create_channel(connection: str, channel_options: ChannelOptions = None,
+                       options: List[Tuple[str, Any]] = None) -> grpc.aio.Channel:
+        """
+        Opens an insecure asyncio channel to "connection"
+
+        Args:
+            connection (str): Address of the clara instance, including port
+            channel_options (ChannelOptions): if specified, options applied to the channel
+            options (List[Tuple[str, Any]]): if specified, additional raw gRPC channel arguments
+
+        Returns:
+            grpc.aio.Channel to the clara instance
+        """
+        grpc_options = []
+        compression = None
+
+        if channel_options is not None:
+            grpc_options.extend(channel_options.to_grpc_options())
+            compression = channel_options.compression
+
+        if options is not None:
+            grpc_options.extend(options)
+
+        return grpc.aio.insecure_channel(connection, options=grpc_options, compression=compression)
+
+    async def close(self):
+        """
+        Close connection
+        """
+        if self._channel:
+            if self._owns_channel:
+                await self._channel.close()
+            self._channel = None
+            self._stub = None
+        else:
+            print("Connection for client already closed")
+
+    def reconnect(self, channel_options: ChannelOptions = None):
+        """
+        Re-open connection with existing channel
+
+        Args:
+            channel_options (ChannelOptions): if specified, replaces the options applied to the channel
+        """
+        if channel_options is not None:
+            self._channel_options = channel_options
+
+        if self._channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+            self._stub = self.stub_class(self._channel)
+        else:
+            print("Connection for client already open")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._channel is not None:
+            await self.close()
+        return False
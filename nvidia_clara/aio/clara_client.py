@@ -0,0 +1,87 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import AsyncIterator, List
+from nvidia_clara.grpc import clara_pb2, clara_pb2_grpc
+from nvidia_clara.aio.base_client import AsyncBaseClient
+from nvidia_clara.clara_client import ClaraClient as SyncClaraClient
+import nvidia_clara.clara_types as clara_types
+
+
+class ClaraClient(AsyncBaseClient):
+    """
+    Asyncio equivalent of nvidia_clara.ClaraClient; every call is a coroutine and "stream_utilization" an asynchronous
+    iterator. Results are converted exactly as by the blocking client.
+    """
+
+    stub_class = clara_pb2_grpc.ClaraStub
+
+    async def stop(self, timeout=None):
+        """Sends stop request to instance of Pipeline Services and Triton"""
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = clara_pb2.ClaraStopRequest(header=self.get_request_header())
+
+        response = await self._stub.Stop(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def list_utilization(self, timeout=None) -> List[clara_types.ClaraUtilizationDetails]:
+        """
+        Method for aquiring snapshot of GPU utilization information of Clara in a list
+
+        Returns:
+            List[clara_types.ClaraUtilizationDetails] with snapshot of GPU Utilization details for Clara GPUs
+        """
+        return [details async for details in self._utilization(watch=False, timeout=timeout)]
+
+    def stream_utilization(self, timeout=None) -> AsyncIterator[clara_types.ClaraUtilizationDetails]:
+        """
+        Method for aquiring stream of GPU utilization information of Clara
+
+        Returns:
+            AsyncIterator[clara_types.ClaraUtilizationDetails] with stream of GPU Utilization details for Clara GPUs
+        """
+        return self._utilization(watch=True, timeout=timeout)
+
+    async def _utilization(self, watch: bool, timeout=None) -> AsyncIterator[clara_types.ClaraUtilizationDetails]:
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = clara_pb2.ClaraUtilizationRequest(header=self.get_request_header(), watch=watch)
+
+        header_check = False
+
+        async for resp in self._stub.Utilization(request, timeout=timeout):
+
+            if not header_check:
+                self.check_response_header(header=resp.header)
+                header_check = True
+
+            yield SyncClaraClient.get_utilization_details(resp)
+
+    async def version(self, timeout=None) -> clara_types.ClaraVersionInfo:
+        """Get Clara Version"""
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = clara_pb2.ClaraVersionRequest(header=self.get_request_header())
+
+        response = await self._stub.Version(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return SyncClaraClient.get_version_info(response)
@@ -0,0 +1,335 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import AsyncIterator, List, Mapping
+from nvidia_clara.grpc import jobs_pb2, jobs_pb2_grpc
+from nvidia_clara.aio.base_client import AsyncBaseClient
+from nvidia_clara.jobs_client import JobsClient as SyncJobsClient
+import nvidia_clara.job_types as job_types
+import nvidia_clara.pipeline_types as pipeline_types
+import nvidia_clara.payload_types as payload_types
+
+
+class JobsClient(AsyncBaseClient):
+    """
+    Asyncio equivalent of nvidia_clara.JobsClient; every call is a coroutine and "stream_jobs" an asynchronous
+    iterator. Requests and results are converted exactly as by the blocking client.
+    """
+
+    stub_class = jobs_pb2_grpc.JobsStub
+
+    async def cancel_job(self, job_id: job_types.JobId, reason=None, timeout=None) -> job_types.JobToken:
+        """
+        Cancels a pipeline job, preventing it from being executed.
+
+        Has no affect on executing or terminated jobs.
+
+        Args:
+            job_id (job_types.JobId): Unique identity of the job to be cancelled.
+            reason: Optional reason as to why the job was cancelled.
+
+        Returns:
+            job_types.JobToken of cancelled job
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (job_id.value is None) or (job_id.value == ""):
+            raise Exception("Job identifier must have instantiated value")
+
+        request = jobs_pb2.JobsCancelRequest(header=self.get_request_header(), job_id=job_id.to_grpc_value(),
+                                             reason=reason)
+
+        response = await self._stub.Cancel(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return job_types.JobToken(
+            job_id=job_types.JobId(response.job_id.value),
+            job_state=response.job_state,
+            job_status=response.job_status
+        )
+
+    async def create_job(self, pipeline_id: pipeline_types.PipelineId, job_name: str,
+                         input_payloads: List[payload_types.PayloadId] = None,
+                         job_priority: job_types.JobPriority = job_types.JobPriority.Normal,
+                         metadata: Mapping[str, str] = None, timeout=None) -> job_types.JobInfo:
+        """
+        Creates a new pipeline job record and associate storage payload.
+
+        Jobs are created in a "JobState.Pending" state.
+
+        Args:
+            pipeline_id (pipeline_types.PipelineId): Unique identifier of the pipeline which the job should
+                be instances from.
+            job_name (str): Human readable name of the job.
+            input_payloads (List[payload_types.PayloadId]): [Optional Paramater] List of static payloads to
+                include as input for the job.
+            job_priority (job_types.JobPriority): Optional Priority of the job.
+                Affects how and when the server will schedule the job.
+            metadata (Mapping[str, str]): [Optional Parameter] Metadata (set of key/value pairs) associated with the
+                job
+
+        Returns:
+            job_types.JobInfo about the newly created pipeline job.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if pipeline_id.value is None:
+            raise Exception("Pipeline identifier must have instantiated non-null instance")
+
+        if (job_name is None) or (job_name == ""):
+            raise Exception("Job name must be initialized to non-null/non-empty string")
+
+        if (job_priority.value < job_types.JobPriority.Minimum.value) or (
+                job_priority.value > job_types.JobPriority.Maximum.value):
+            raise Exception("Job priority must contain valid value between minimum and maximum job priority bounds")
+
+        input_payloads_identifiers = None
+
+        if input_payloads is not None:
+            input_payloads_identifiers = [pay_id.to_grpc_value() for pay_id in input_payloads]
+
+        request = jobs_pb2.JobsCreateRequest(
+            header=self.get_request_header(),
+            name=job_name,
+            pipeline_id=pipeline_id.to_grpc_value(),
+            priority=job_priority.value,
+            input_payloads=input_payloads_identifiers
+        )
+
+        if metadata is not None:
+            request.metadata.update(metadata)
+
+        response = await self._stub.Create(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return job_types.JobInfo(
+            job_id=job_types.JobId(response.job_id.value),
+            job_priority=job_priority,
+            job_state=job_types.JobState.Pending,
+            job_status=job_types.JobStatus.Healthy,
+            name=job_name,
+            payload_id=payload_types.PayloadId(value=response.payload_id.value),
+            pipeline_id=pipeline_id,
+            metadata=metadata
+        )
+
+    async def get_status(self, job_id: job_types.JobId, timeout=None) -> job_types.JobDetails:
+        """
+        Get status of a job
+
+        Args:
+            job_id (job_types.JobId): job_id Unique identifier of the job to get the status of.
+
+        Returns:
+            job_types.JobDetails including the status of a known job
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if job_id.value is None:
+            raise Exception("Job identifier must have instantiated non-null instance")
+
+        request = jobs_pb2.JobsStatusRequest(header=self.get_request_header(), job_id=job_id.to_grpc_value())
+
+        response = await self._stub.Status(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return SyncJobsClient.get_job_details(response)
+
+    async def list_jobs(self, job_filter: job_types.JobFilter = None, timeout=None) -> List[job_types.JobInfo]:
+        """
+        Provides list of current jobs on platform
+
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
+
+        Returns:
+            list of job_types.JobInfo with known pipeline job details from the server.
+        """
+        return [info async for info in self.stream_jobs(job_filter=job_filter, timeout=timeout)]
+
+    async def stream_jobs(self, job_filter: job_types.JobFilter = None,
+                          timeout=None) -> AsyncIterator[job_types.JobInfo]:
+        """
+        Provides asynchronous iterator to stream current jobs on platform
+
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
+
+        Returns:
+            AsyncIterator of job_types.JobInfo with known pipeline job details from the server.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = SyncJobsClient.create_list_request(job_filter)
+
+        check_header = True
+
+        async for item in self._stub.List(request, timeout=timeout):
+
+            if check_header:
+                self.check_response_header(header=item.header)
+                check_header = False
+
+            if (item.job_details is None) or (item.job_details.job_id.value == ''):
+                continue
+
+            yield SyncJobsClient.get_job_info(item.job_details)
+
+    async def start_job(self, job_id: job_types.JobId, named_values: Mapping[str, str] = None,
+                        timeout=None) -> job_types.JobToken:
+        """
+        Starts a "JobState.Pending" job.
+
+        Once started, a job's payload becomes readonly.
+
+        Args:
+            job_id (job_types.JobId): Unique identifier of the job to start.
+            named_values: Collection of name/value pairs used to populate pipeline
+        variables.
+
+        Returns:
+            A job_types.JobToken with information on started job
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (job_id.value is None) or (job_id.value == ""):
+            raise Exception("Job identifier must have instantiated value")
+
+        request = jobs_pb2.JobsStartRequest(
+            header=self.get_request_header(),
+            job_id=job_id.to_grpc_value()
+        )
+
+        if named_values is not None:
+            for item in named_values.keys():
+                request.Variables.append(jobs_pb2.JobsStartRequest.NamedValue(
+                    name=item,
+                    value=named_values.get(item)
+                ))
+
+        response = await self._stub.Start(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return job_types.JobToken(
+            job_id=job_id,
+            job_priority=response.priority,
+            job_state=response.state,
+            job_status=response.status
+        )
+
+    async def job_logs(self, job_id: job_types.JobId, operator_name: str, timeout=None) -> List[str]:
+        """
+        Retrieve logs of operator specified with "operator_name" with job associated with "job_id"
+
+        Args:
+            job_id (job_types.JobId): Unique identifier of the job to retrieve logs from
+            operator_name (str): Operator to retrieve logs from
+
+        Returns:
+            List of operator logs
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (job_id.value is None) or (job_id.value == ""):
+            raise Exception("Job identifier must have instantiated value")
+
+        if (operator_name is None) or (operator_name.strip() == ""):
+            raise Exception("Operator must have valid instantiated value")
+
+        request = jobs_pb2.JobsReadLogsRequest(
+            header=self.get_request_header(),
+            job_id=job_id.to_grpc_value(),
+            operator_name=operator_name
+        )
+
+        logs_list = []
+
+        async for resp in self._stub.ReadLogs(request, timeout=timeout):
+            logs_list.extend(resp.logs)
+
+        return logs_list
+
+    async def add_metadata(self, job_id: job_types.JobId, metadata: Mapping[str, str],
+                           timeout=None) -> Mapping[str, str]:
+        """
+        Requests the addition of metadata to a job.
+
+        Args:
+            job_id (job_types.JobId): Unique identifier of the job whose metadata is to be appended.
+            metadata(Mapping[str, str]): Set of key/value pairs to be appended to the job metadata.
+
+        Returns:
+            A Mapping[str, str] object containing the appended metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (job_id.value is None) or (job_id.value == ""):
+            raise Exception("Job identifier must have instantiated value")
+
+        if metadata is None:
+            raise Exception("Metadata must be an instantiated map")
+
+        request = jobs_pb2.JobsAddMetadataRequest(header=self.get_request_header(), job_id=job_id.to_grpc_value())
+
+        request.metadata.update(metadata)
+
+        response = await self._stub.AddMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
+
+    async def remove_metadata(self, job_id: job_types.JobId, keys: List[str], timeout=None) -> Mapping[str, str]:
+        """
+        Requests the removal of metadata from a job.
+
+        Args:
+            job_id: Unique identifier of the job whose metadata is to be removed.
+            keys: List of keys to be removed from the job metadata.
+
+        Returns:
+            A Mapping[str, str] object containing the updated set of metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (job_id.value is None) or (job_id.value == ""):
+            raise Exception("Job identifier must have instantiated value")
+
+        if keys is None:
+            raise Exception("Keys paramater must be valid list of metadata keys")
+
+        request = jobs_pb2.JobsRemoveMetadataRequest(header=self.get_request_header(), job_id=job_id.to_grpc_value())
+
+        request.keys.extend(keys)
+
+        response = await self._stub.RemoveMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
@@ -0,0 +1,447 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import AsyncIterator, List, Mapping
+import grpc.aio
+from nvidia_clara.grpc import models_pb2, models_pb2_grpc
+from nvidia_clara.base_client import ChannelOptions
+from nvidia_clara.aio.base_client import AsyncBaseClient
+from nvidia_clara.models_client import ModelsClient as SyncModelsClient
+import nvidia_clara.model_types as model_types
+import nvidia_clara.aio.transfer_tools as transfer_tools
+
+
+class ModelsClient(AsyncBaseClient):
+    """
+    Asyncio equivalent of nvidia_clara.ModelsClient; every call is a coroutine and model downloads are available as
+    asynchronous iterators. Requests and results are converted exactly as by the blocking client.
+    """
+
+    stub_class = models_pb2_grpc.ModelsStub
+
+    def __init__(self, target: str, port: str = None, stub=None, chunk_size: int = None,
+                 channel: grpc.aio.Channel = None, channel_options: ChannelOptions = None):
+        """
+        Models Client Creation
+
+        Args:
+            target (str): ipv4 address of clara instance
+            port (str): if specified, port will be appended to the target with a ":"
+            chunk_size (int): Size, in bytes, of the data chunk carried by each upload message. If not specified, the
+                value of the "GRPC_CHUNK_SIZE" environment variable or "GrpcChunkSizeDefault" is used.
+            channel (grpc.aio.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
+        """
+        self._chunk_size = self.get_chunk_size(chunk_size)
+
+        super().__init__(target=target, port=port, stub=stub, channel=channel, channel_options=channel_options)
+
+    async def create_catalog(self, timeout=None) -> model_types.CatalogId:
+        """
+        Creates a new inference model catalog.
+
+        Returns:
+            model_types.CatalogId of the unique identity of the new catalog.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsCreateCatalogRequest(header=self.get_request_header())
+
+        response = await self._stub.CreateCatalog(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return model_types.CatalogId(value=response.catalog_id.value)
+
+    async def create_instance(self, timeout=None) -> model_types.InstanceId:
+        """
+        Creates a new inference model catalog instance.
+
+        Returns:
+            model_types.InstanceId of the unique identity of the new instance.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsCreateInstanceRequest(header=self.get_request_header())
+
+        response = await self._stub.CreateInstance(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return model_types.InstanceId(value=response.instance_id.value)
+
+    async def delete_catalog(self, catalog_id: model_types.CatalogId, timeout=None):
+        """
+        Deletes the inference catalog associated with "catalog_id"
+
+        Args:
+            catalog_id (model_types.CatalogId): Unique identifier for the inference model catalog to be deleted
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (catalog_id.value is None) or (catalog_id.value == ""):
+            raise Exception("Catalog identifier must be initialized to non-null instance of model_types.CatalogId")
+
+        request = models_pb2.ModelsDeleteCatalogRequest(
+            catalog_id=catalog_id.to_grpc_value(),
+            header=self.get_request_header()
+        )
+
+        response = await self._stub.DeleteCatalog(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def delete_instance(self, instance_id: model_types.InstanceId, timeout=None):
+        """
+        Deletes the inference model catalog instance associated with "instance_id"
+
+        Args:
+            instance_id (model_types.InstanceId): Unique identifier for the inference model catalog instance to be deleted.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (instance_id.value is None) or (instance_id.value == ""):
+            raise Exception("Instance identifier must be initialized to non-null instance of model_types.InstanceId")
+
+        request = models_pb2.ModelsDeleteInstanceRequest(
+            instance_id=instance_id.to_grpc_value(),
+            header=self.get_request_header()
+        )
+
+        response = await self._stub.DeleteInstance(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def delete_model(self, model_id: model_types.ModelId, timeout=None):
+        """
+        Deletes the inference model associated with "model_id"
+
+        Args:
+            model_id (model_types.ModelId): Unique identifier of the inference model to be deleted.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (model_id.value is None) or (model_id.value == ""):
+            raise Exception("Model identifier must be initialized to non-null instance of model_types.ModelId")
+
+        request = models_pb2.ModelsDeleteModelRequest(
+            model_id=model_id.to_grpc_value(),
+            header=self.get_request_header()
+        )
+
+        response = await self._stub.DeleteModel(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def iter_download_model(self, model_id: model_types.ModelId, timeout=None) -> AsyncIterator[bytes]:
+        """
+        Downloads the model associated with "model_id" as an asynchronous iterator of data chunks in the order received
+
+        Args:
+            model_id (model_types.ModelId): Unique identifier of the model to download.
+
+        Returns:
+            AsyncIterator of bytes chunks of the raw model data
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (model_id.value is None) or (model_id.value == ""):
+            raise Exception("Model identifier must be initialized to non-null instance of model_types.ModelId")
+
+        request = models_pb2.ModelsDownloadModelRequest(
+            header=self.get_request_header(),
+            model_id=model_id.to_grpc_value()
+        )
+
+        check_header = True
+
+        async for resp in self._stub.DownloadModel(request, timeout=timeout):
+            if check_header:
+                self.check_response_header(header=resp.header)
+                check_header = False
+
+            yield resp.data
+
+    async def download_model(self, model_id: model_types.ModelId, output_stream,
+                             timeout=None) -> model_types.ModelDetails:
+        """
+        Downloads the model associated with "model_id" to "output_stream"
+
+        Args:
+            model_id (model_types.ModelId): Unique identifier of the model to download.
+            output_stream: Writable stream use to write the raw model data to; either a BinaryIO object, written on the
+                default executor, or an object whose "write(data)" is a coroutine function
+
+        Returns:
+            model_types.ModelDetails with details of the downloaded model.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (model_id.value is None) or (model_id.value == ""):
+            raise Exception("Model identifier must be initialized to non-null instance of model_types.ModelId")
+
+        request = models_pb2.ModelsDownloadModelRequest(
+            header=self.get_request_header(),
+            model_id=model_id.to_grpc_value()
+        )
+
+        result = None
+
+        async for resp in self._stub.DownloadModel(request, timeout=timeout):
+            if result is None:
+                self.check_response_header(header=resp.header)
+
+                result = SyncModelsClient.get_model_details(resp.details)
+
+            await transfer_tools.write(output_stream, resp.data)
+
+        return result
+
+    async def _read_models(self, call) -> List[model_types.ModelDetails]:
+        result = None
+
+        async for resp in call:
+            if result is None:
+                self.check_response_header(header=resp.header)
+                result = []
+
+            result.extend(SyncModelsClient.get_model_details(details) for details in resp.models)
+
+        return result
+
+    async def list_models(self, timeout=None) -> List[model_types.ModelDetails]:
+        """
+        Returns details of all inference models known to the server.
+
+        Returns:
+            List[model_types.ModelDetails] with details of all inference models known to the server
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsListModelsRequest(header=self.get_request_header())
+
+        return await self._read_models(self._stub.ListModels(request, timeout=timeout))
+
+    async def read_catalog(self, catalog_id: model_types.CatalogId, timeout=None) -> List[model_types.ModelDetails]:
+        """
+        Returns details of all inference models included in the catalog associated with "catalog_id"
+
+        Args:
+            catalog_id (model_types.CatalogId): Unique identifier of the inference catalog to read.
+
+        Returns:
+            List[model_types.ModelDetails] with details of all inference models associated with catalog
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsReadCatalogRequest(
+            catalog_id=catalog_id.to_grpc_value(),
+            header=self.get_request_header()
+        )
+
+        return await self._read_models(self._stub.ReadCatalog(request, timeout=timeout))
+
+    async def read_instance(self, instance_id: model_types.InstanceId,
+                            timeout=None) -> List[model_types.ModelDetails]:
+        """
+        Returns details of all inference models included in the catalog instance associated with "instance_id"
+
+        Args:
+            instance_id (model_types.InstanceId): Unique identifier of the inference catalog instance to read.
+
+        Returns:
+            List[model_types.ModelDetails] with details of all inference models associated with Instance
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsReadInstanceRequest(
+            instance_id=instance_id.to_grpc_value(),
+            header=self.get_request_header()
+        )
+
+        return await self._read_models(self._stub.ReadInstance(request, timeout=timeout))
+
+    async def update_catalog(self, catalog_id: model_types.CatalogId, model_ids: List[model_types.ModelId],
+                             timeout=None):
+        """
+        Updates the inference model catalog associated with "catalog_id" and sets its set of included models in "model_ids"
+
+        Args:
+            catalog_id (model_types.CatalogId): Unique identifier of the inference model catalog to update.
+            model_ids: List of inference model identifiers to replace any existing list with.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsUpdateCatalogRequest(
+            catalog_id=catalog_id.to_grpc_value(),
+            header=self.get_request_header(),
+            model_ids=[model_id.to_grpc_value() for model_id in model_ids]
+        )
+
+        response = await self._stub.UpdateCatalog(iter([request]), timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def update_instance(self, instance_id: model_types.InstanceId, model_ids: List[model_types.ModelId],
+                              timeout=None):
+        """
+        Updates the inference model catalog instance associated with "instance_id" and sets its set of included models to "model_ids"
+
+        Args:
+            instance_id (model_types.InstanceId): Unique identifier of the inference model catalog instance to update.
+            model_ids: List of inference model identifiers to replace any existing list with.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = models_pb2.ModelsUpdateInstanceRequest(
+            instance_id=instance_id.to_grpc_value(),
+            header=self.get_request_header(),
+            model_ids=[model_id.to_grpc_value() for model_id in model_ids]
+        )
+
+        response = await self._stub.UpdateInstance(iter([request]), timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def upload_request_iterator(self, details: models_pb2.ModelDetails, source_object, chunk_size: int = None):
+        """
+        Creates asynchronous generator of upload requests with data read from "source_object"
+
+        Args:
+            details (models_pb2.ModelDetails): details of specified model
+            source_object: Source to read from; see "nvidia_clara.aio.transfer_tools.read_chunks"
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+        """
+        chunk_size = self._chunk_size if chunk_size is None else self.get_chunk_size(chunk_size)
+
+        header = self.get_request_header()
+
+        async for data in transfer_tools.read_chunks(source_object, chunk_size=chunk_size):
+            yield models_pb2.ModelsUploadModelRequest(header=header, details=details, data=data)
+
+    async def upload_model(self, details: model_types.ModelDetails, input_stream=None, timeout=None,
+                           chunk_size: int = None, file_path: str = None):
+        """
+        Uploads an inference model to the model repository.
+
+        If a model with the same name exists, it will be overwritten by this operation.
+
+        Args:
+            details (model_types.ModelDetails): provides details, including the name of the model.
+            input_stream: Raw model data is read from this source; either a BinaryIO object, read on the default
+                executor, or an asynchronous source whose "read(size)" is a coroutine function
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+            file_path (str): Alternative to passing in a source object for upload, and rather passing in path for a file
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        file_path_used = False
+
+        if input_stream is None:
+            if file_path is None:
+                raise Exception("Input stream of model for upload must be initialized with non-null BinaryIO object")
+            else:
+                input_stream = open(file_path, 'rb')
+                file_path_used = True
+
+        try:
+            response = await self._stub.UploadModel(
+                self.upload_request_iterator(details=SyncModelsClient.create_model_details(details),
+                                             source_object=input_stream, chunk_size=chunk_size),
+                timeout=timeout
+            )
+        finally:
+            if file_path_used:
+                input_stream.close()
+
+        self.check_response_header(header=response.header)
+
+    async def add_metadata(self, model_id: model_types.ModelId, metadata: Mapping[str, str],
+                           timeout=None) -> Mapping[str, str]:
+        """
+        Requests the addition of metadata to a model.
+
+        Args:
+            model_id (model_types.ModelId): Unique identifier of the model whose metadata is to be appended.
+            metadata(Mapping[str, str]): Set of key/value pairs to be appended to the model metadata.
+
+        Returns:
+            A Mapping[str, str] containing the appended metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (model_id.value is None) or (model_id.value == ""):
+            raise Exception("Model identifier must have instantiated value")
+
+        if metadata is None:
+            raise Exception("Metadata must be an instantiated map")
+
+        request = models_pb2.ModelsAddMetadataRequest(header=self.get_request_header(),
+                                                      model_id=model_id.to_grpc_value())
+
+        request.metadata.update(metadata)
+
+        response = await self._stub.AddMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
+
+    async def remove_metadata(self, model_id: model_types.ModelId, keys: List[str],
+                              timeout=None) -> Mapping[str, str]:
+        """
+        Requests the removal of metadata from a model.
+
+        Args:
+            model_id: Unique identifier of the model whose metadata is to be removed.
+            keys: List of keys to be removed from the model metadata.
+
+        Returns:
+            A Mapping[str, str] containing the updated set of metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (model_id.value is None) or (model_id.value == ""):
+            raise Exception("Model identifier must have instantiated value")
+
+        if keys is None:
+            raise Exception("Keys paramater must be valid list of metadata keys")
+
+        request = models_pb2.ModelsRemoveMetadataRequest(header=self.get_request_header(),
+                                                         model_id=model_id.to_grpc_value())
+
+        request.keys.extend(keys)
+
+        response = await self._stub.RemoveMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
@@ -0,0 +1,486 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import time
+from typing import AsyncIterator, List, Mapping
+import grpc.aio
+from nvidia_clara.grpc import payloads_pb2, payloads_pb2_grpc
+from nvidia_clara.base_client import ChannelOptions
+from nvidia_clara.aio.base_client import AsyncBaseClient
+from nvidia_clara.payloads_client import PayloadsClient as SyncPayloadsClient
+import nvidia_clara.payload_types as payload_types
+import nvidia_clara.aio.transfer_tools as transfer_tools
+
+
+class PayloadsClient(AsyncBaseClient):
+    """
+    Asyncio equivalent of nvidia_clara.PayloadsClient; every call is a coroutine and downloads are available as
+    asynchronous iterators. Requests and results are converted exactly as by the blocking client.
+    """
+
+    stub_class = payloads_pb2_grpc.PayloadsStub
+
+    def __init__(self, target: str, port: str = None, stub=None, chunk_size: int = None,
+                 channel: grpc.aio.Channel = None, channel_options: ChannelOptions = None):
+        """
+        Payloads Client Creation
+
+        Args:
+            target (str): ipv4 address of clara instance
+            port (str): if specified, port will be appended to the target with a ":"
+            chunk_size (int): Size, in bytes, of the data chunk carried by each upload message. If not specified, the
+                value of the "GRPC_CHUNK_SIZE" environment variable or "GrpcChunkSizeDefault" is used.
+            channel (grpc.aio.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
+        """
+        self._chunk_size = self.get_chunk_size(chunk_size)
+
+        super().__init__(target=target, port=port, stub=stub, channel=channel, channel_options=channel_options)
+
+    async def create_payload(self, metadata: Mapping[str, str] = None, timeout=None) -> payload_types.PayloadDetails:
+        """
+        Creates a static payload.
+
+        Payloads created using this API are created with a type of "PayloadType.Reusable"
+
+        Returns:
+             the details of newly created payload.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = payloads_pb2.PayloadsCreateRequest(header=self.get_request_header())
+
+        if metadata is not None:
+            request.metadata.update(metadata)
+
+        response = await self._stub.Create(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return payload_types.PayloadDetails(
+            file_details=[],
+            payload_id=payload_types.PayloadId(response.payload_id.value),
+            payload_type=response.type
+        )
+
+    async def delete_payload(self, payload_id: payload_types.PayloadId, timeout=None):
+        """
+        Requests the deletion of a payload, identified by "payload_id" from Clara.
+
+        Deleted payloads cannot be recovered.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload to delete.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        request = payloads_pb2.PayloadsDeleteRequest(
+            header=self.get_request_header(),
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        response = await self._stub.Delete(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def get_details(self, payload_id: payload_types.PayloadId, timeout=None) -> payload_types.PayloadDetails:
+        """
+        Requests the details of a payload, identified by "payload_id" from Clara.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+
+        Returns:
+            A payload_types.PayloadDetails instance containing payload details
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        request = payloads_pb2.PayloadsDetailsRequest(
+            header=self.get_request_header(),
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        responses = [resp async for resp in self._stub.Details(request, timeout=timeout)]
+
+        if len(responses) > 0:
+            self.check_response_header(header=responses[0].header)
+
+        return SyncPayloadsClient.get_payload_details(responses)
+
+    async def iter_download(self, payload_id: payload_types.PayloadId, blob_name: str,
+                            timeout=None) -> AsyncIterator[bytes]:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara, as an
+        asynchronous iterator of data chunks in the order received.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+
+        Returns:
+            AsyncIterator of bytes chunks of the blob
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of source blob must be initialized with non-null string")
+
+        request = payloads_pb2.PayloadsDownloadRequest(
+            header=self.get_request_header(),
+            name=blob_name,
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        check_header = True
+
+        async for resp in self._stub.Download(request, timeout=timeout):
+            if check_header:
+                self.check_response_header(header=resp.header)
+                check_header = False
+
+            yield resp.data
+
+    async def download_from(self, payload_id: payload_types.PayloadId, blob_name: str, dest_obj=None,
+                            dest_path: str = None, timeout=None) -> payload_types.PayloadFileDetails:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            dest_obj: Target stream object to write to; either a BinaryIO object with write privileges, written on the
+                default executor, or an object whose "write(data)" is a coroutine function
+            dest_path (str): Alternative to passing in a stream object to download to, and rather passing in path for a
+                file
+
+        Returns:
+            payload_types.PayloadFileDetails of the downloaded blob
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of source blob must be initialized with non-null string")
+
+        file_path_used = False
+
+        if dest_obj is None:
+            if dest_path is None:
+                raise Exception("Destination object for upload must be initialized with non-null BinaryIO object")
+            else:
+                dest_obj = open(dest_path, 'wb')
+                file_path_used = True
+
+        request = payloads_pb2.PayloadsDownloadRequest(
+            header=self.get_request_header(),
+            name=blob_name,
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        result = None
+
+        try:
+            async for resp in self._stub.Download(request, timeout=timeout):
+                if result is None:
+                    self.check_response_header(header=resp.header)
+
+                    result = SyncPayloadsClient.get_file_details(resp.details)
+
+                await transfer_tools.write(dest_obj, resp.data)
+        finally:
+            if file_path_used:
+                dest_obj.close()
+
+        return result
+
+    async def remove_from(self, payload_id: payload_types.PayloadId, blob_name: str, timeout=None):
+        """
+        Removes a blob from the payload.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload from which to remove the blob.
+            blob_name (str): The name, or path, of the blob in the payload.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of blob to remove must be initialized with non-null string")
+
+        request = payloads_pb2.PayloadsRemoveRequest(
+            header=self.get_request_header(),
+            name=blob_name,
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        response = await self._stub.Remove(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def upload_request_iterator(self, payload_id: payload_types.PayloadId, file_name: str, source_object,
+                                      mode: int = 0, chunk_size: int = None):
+        """
+        Creates asynchronous generator of upload requests with data read from "source_object"
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            file_name (str): Name of the blob in the payload
+            source_object: Source to read from; see "nvidia_clara.aio.transfer_tools.read_chunks"
+            mode (int): Privilege level
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+        """
+        chunk_size = self._chunk_size if chunk_size is None else self.get_chunk_size(chunk_size)
+
+        header = self.get_request_header()
+        grpc_payload_id = payload_id.to_grpc_value()
+
+        async for data in transfer_tools.read_chunks(source_object, chunk_size=chunk_size):
+            yield payloads_pb2.PayloadsUploadRequest(
+                header=header,
+                payload_id=grpc_payload_id,
+                details=payloads_pb2.PayloadFileDetails(mode=mode, name=file_name, size=len(data)),
+                data=data
+            )
+
+    async def upload(self, payload_id: payload_types.PayloadId, blob_name: str, file_object=None,
+                     file_path: str = None, timeout=None, chunk_size: int = None) -> payload_types.PayloadFileDetails:
+        """
+        Uploads a blob from "file_object", to a Clara Payload identified by "payload_id".
+
+        Each uploaded blob must be have a unique "blob_name" value within a given payload.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            file_object: Source to read from and upload; either a BinaryIO object with read privileges, read on the
+                default executor, or an asynchronous source whose "read(size)" is a coroutine function
+            file_path (str): Alternative to passing in a source object for upload, and rather passing in path for a file
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+
+        Returns:
+            payload_types.PayloadFileDetails of the uploaded blob
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of destination blob must be initialized with non-null string")
+
+        file_path_used = False
+
+        if file_object is None:
+            if file_path is None:
+                raise Exception("File_object of file for upload must be initialized with non-null BinaryIO object")
+            else:
+                file_object = open(file_path, 'rb')
+                file_path_used = True
+
+        try:
+            response = await self._stub.Upload(
+                self.upload_request_iterator(payload_id=payload_id, file_name=blob_name, source_object=file_object,
+                                             chunk_size=chunk_size),
+                timeout=timeout
+            )
+        finally:
+            if file_path_used:
+                file_object.close()
+
+        self.check_response_header(header=response.header)
+
+        return payload_types.PayloadFileDetails(other=response.details)
+
+    async def upload_stream(self, payload_id: payload_types.PayloadId, blob_name: str, chunks, timeout=None,
+                            chunk_size: int = None) -> payload_types.PayloadFileDetails:
+        """
+        Uploads a blob from "chunks", data produced in memory, to a Clara Payload identified by "payload_id", without
+        writing it to a file first.
+
+        Pieces of data are coalesced or split into messages of "chunk_size" bytes as they are produced, so producers can
+        yield data of any size.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            chunks: Asynchronous iterable, or regular iterable, of bytes-like objects; each object must not be modified
+                once yielded
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+
+        Returns:
+            payload_types.PayloadFileDetails of the uploaded blob
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of destination blob must be initialized with non-null string")
+
+        if chunks is None:
+            raise Exception("Chunks must be initialized with a non-null iterable of bytes-like objects")
+
+        chunk_size = self._chunk_size if chunk_size is None else self.get_chunk_size(chunk_size)
+
+        header = self.get_request_header()
+        grpc_payload_id = payload_id.to_grpc_value()
+
+        async def requests():
+            async for data in transfer_tools.rechunk(chunks, chunk_size=chunk_size):
+                yield payloads_pb2.PayloadsUploadRequest(
+                    header=header,
+                    payload_id=grpc_payload_id,
+                    details=payloads_pb2.PayloadFileDetails(mode=0, name=blob_name, size=len(data)),
+                    data=data
+                )
+
+        response = await self._stub.Upload(requests(), timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return payload_types.PayloadFileDetails(other=response.details)
+
+    async def upload_many(self, payload_id: payload_types.PayloadId, files: Mapping[str, str],
+                          parallel_streams: int = None, timeout=None) -> payload_types.PayloadTransferStats:
+        """
+        Uploads a set of local files to a Clara Payload identified by "payload_id" over concurrent upload streams.
+
+        Each file is uploaded over its own "Upload" stream, with at most "parallel_streams" streams in flight at once.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            files (Mapping[str, str]): Mapping of blob names, within the payload, to paths of the local files to upload.
+            parallel_streams (int): Number of concurrent upload streams. If not specified, the value of the
+                "GRPC_PARALLEL_STREAMS" environment variable or "GrpcParallelStreamsDefault" is used.
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each uploaded blob and aggregate throughput
+        """
+        if files is None:
+            raise Exception("Files must be an instantiated map of blob names to file paths")
+
+        parallel_streams = min(self.get_parallel_streams(parallel_streams), max(len(files), 1))
+        semaphore = asyncio.Semaphore(parallel_streams)
+
+        async def upload_file(blob_name: str, file_path: str) -> payload_types.PayloadFileDetails:
+            async with semaphore:
+                return await self.upload(payload_id=payload_id, blob_name=blob_name, file_path=file_path,
+                                         timeout=timeout)
+
+        start = time.perf_counter()
+
+        uploads = [asyncio.ensure_future(upload_file(blob_name, file_path)) for blob_name, file_path in files.items()]
+
+        try:
+            file_details = await asyncio.gather(*uploads)
+        except Exception:
+            for upload in uploads:
+                upload.cancel()
+            raise
+
+        return payload_types.PayloadTransferStats(
+            file_details=list(file_details),
+            total_bytes=sum(details.size for details in file_details),
+            elapsed_seconds=time.perf_counter() - start,
+            parallel_streams=parallel_streams
+        )
+
+    async def add_metadata(self, payload_id: payload_types.PayloadId, metadata: Mapping[str, str],
+                           timeout=None) -> Mapping[str, str]:
+        """
+        Requests the addition of metadata to a payload.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload whose metadata is to be appended.
+            metadata(Mapping[str, str]): Set of key/value pairs to be appended to the payload metadata.
+
+        Returns:
+            A Mapping[str, str] containing the appended metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier must have instantiated value")
+
+        if metadata is None:
+            raise Exception("Metadata must be an instantiated map")
+
+        request = payloads_pb2.PayloadsAddMetadataRequest(header=self.get_request_header(),
+                                                          payload_id=payload_id.to_grpc_value())
+
+        request.metadata.update(metadata)
+
+        response = await self._stub.AddMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
+
+    async def remove_metadata(self, payload_id: payload_types.PayloadId, keys: List[str],
+                              timeout=None) -> Mapping[str, str]:
+        """
+        Requests the removal of metadata from a payload.
+
+        Args:
+            payload_id: Unique identifier of the payload whose metadata is to be removed.
+            keys: List of keys to be removed from the payload metadata.
+
+        Returns:
+            A Mapping[str, str] containing the updated set of metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier must have instantiated value")
+
+        if keys is None:
+            raise Exception("Keys paramater must be valid list of metadata keys")
+
+        request = payloads_pb2.PayloadsRemoveMetadataRequest(header=self.get_request_header(),
+                                                             payload_id=payload_id.to_grpc_value())
+
+        request.keys.extend(keys)
+
+        response = await self._stub.RemoveMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
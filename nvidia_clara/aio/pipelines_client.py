@@ -0,0 +1,238 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import AsyncIterator, List, Mapping
+from nvidia_clara.grpc import pipelines_pb2, pipelines_pb2_grpc
+from nvidia_clara.aio.base_client import AsyncBaseClient
+from nvidia_clara.pipelines_client import PipelinesClient as SyncPipelinesClient
+import nvidia_clara.pipeline_types as pipeline_types
+
+
+class PipelinesClient(AsyncBaseClient):
+    """
+    Asyncio equivalent of nvidia_clara.PipelinesClient; every call is a coroutine. Requests and results are converted
+    exactly as by the blocking client.
+    """
+
+    stub_class = pipelines_pb2_grpc.PipelinesStub
+
+    async def create_pipeline(self, definition: List[pipeline_types.PipelineDefinition],
+                              pipeline_id: pipeline_types.PipelineId = None, metadata: Mapping[str, str] = None,
+                              timeout=None) -> pipeline_types.PipelineId:
+        """
+        Requests the creation of a new pipeline by Clara.
+
+        Args:
+            definition(List[pipeline_types.PipelineDefinition]): Definition from which to create the new pipeline.
+            pipeline_id:  Optional argument to force a specific pipeline identifier when replicating deployments.
+            metadata(Mapping[str, str]): Set of key/value pairs to be appended to the pipeline metadata.
+
+        Returns:
+            pipeline_types.PipelineId of newly created pipeline
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if definition is None:
+            raise Exception("Argument 'definition' must be initialized to a non-null list instance")
+
+        request_list = SyncPipelinesClient.create_pipeline_requests(definition, pipeline_id=pipeline_id,
+                                                                    metadata=metadata)
+
+        response = await self._stub.Create(iter(request_list), timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return pipeline_types.PipelineId(response.pipeline_id.value)
+
+    async def list_pipelines(self, timeout=None) -> List[pipeline_types.PipelineInfo]:
+        """
+        Requests a list of pipelines from Clara.
+
+        Returns:
+            List of pipeline_types.PipelineInfo with running pipeline information
+        """
+        return [info async for info in self.stream_pipelines(timeout=timeout)]
+
+    async def stream_pipelines(self, timeout=None) -> AsyncIterator[pipeline_types.PipelineInfo]:
+        """
+        Requests a list of pipelines from Clara, as an asynchronous iterator.
+
+        Returns:
+            AsyncIterator of pipeline_types.PipelineInfo with running pipeline information
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        request = pipelines_pb2.PipelinesListRequest(header=self.get_request_header())
+
+        async for item in self._stub.List(request, timeout=timeout):
+            if (item.details is None) or (item.details.pipeline_id.value == ''):
+                continue
+
+            yield SyncPipelinesClient.get_pipeline_info(item.details)
+
+    async def pipeline_details(self, pipeline_id: pipeline_types.PipelineId,
+                               timeout=None) -> pipeline_types.PipelineDetails:
+        """
+        Requests details of a pipeline, identified by pipeline_types.PipelineId, from Clara.
+
+        Args:
+            pipeline_id (pipeline_types.PipelineId): Unique identifier of the pipeline.
+
+        Return:
+            A pipeline_types.PipelineDetails instance with details on the pipeline specified by 'pipeline_id'
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if pipeline_id.value is None or pipeline_id.value == "":
+            raise Exception("Pipeline identifier argument must be initialized with non-null instance")
+
+        request = pipelines_pb2.PipelinesDetailsRequest(
+            header=self.get_request_header(),
+            pipeline_id=pipeline_id.to_grpc_value(),
+        )
+
+        responses = [resp async for resp in self._stub.Details(request, timeout=timeout)]
+
+        if len(responses) > 0:
+            self.check_response_header(header=responses[0].header)
+
+        return SyncPipelinesClient.get_pipeline_details(responses)
+
+    async def remove_pipeline(self, pipeline_id: pipeline_types.PipelineId, timeout=None):
+        """
+        Removes a pipeline, identified by "pipelineId", from Clara.
+
+        Args:
+            pipeline_id (pipeline_types.PipelineId): Unique identifier of the
+                pipeline
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if pipeline_id.value is None or pipeline_id.value == "":
+            raise Exception("Pipeline identifier argument must be initialized with non-null instance")
+
+        request = pipelines_pb2.PipelinesRemoveRequest(
+            header=self.get_request_header(),
+            pipeline_id=pipeline_id.to_grpc_value()
+        )
+
+        response = await self._stub.Remove(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def update_pipeline(self, pipeline_id: pipeline_types.PipelineId,
+                              definition: List[pipeline_types.PipelineDefinition], timeout=None):
+        """
+        Requests a pipeline, identified by "pipelineId", be updated by Clara.
+
+        Args:
+            pipeline_id (pipeline_types.PipelineId): Unique identifier of the
+                pipeline.
+            definition: Definition from which to update the pipeline.
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if pipeline_id.value is None or pipeline_id.value == "":
+            raise Exception("Pipeline identifier argument must be initialized with non-null instance")
+
+        if definition is None:
+            raise Exception(
+                "Pipeline definition argument must be initialized"
+                "with non-null instnace of List[pipeline_types.PipelineDefinition]")
+
+        header = self.get_request_header()
+        grpc_pipeline_id = pipeline_id.to_grpc_value()
+
+        request_list = [
+            pipelines_pb2.PipelinesUpdateRequest(
+                definition=pipelines_pb2.PipelineDefinitionFile(content=item.content, path=item.name),
+                header=header,
+                pipeline_id=grpc_pipeline_id
+            )
+            for item in definition
+        ]
+
+        response = await self._stub.Update(iter(request_list), timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+    async def add_metadata(self, pipeline_id: pipeline_types.PipelineId, metadata: Mapping[str, str],
+                           timeout=None) -> Mapping[str, str]:
+        """
+        Requests the addition of metadata to a pipeline.
+
+        Args:
+            pipeline_id (pipeline_types.PipelineId): Unique identifier of the pipeline whose metadata is to be appended.
+            metadata(Mapping[str, str]): Set of key/value pairs to be appended to the pipeline metadata.
+
+        Returns:
+            A Mapping[str, str] containing the appended metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (pipeline_id.value is None) or (pipeline_id.value == ""):
+            raise Exception("Pipeline identifier must have instantiated value")
+
+        if metadata is None:
+            raise Exception("Metadata must be an instantiated map")
+
+        request = pipelines_pb2.PipelinesAddMetadataRequest(header=self.get_request_header(),
+                                                            pipeline_id=pipeline_id.to_grpc_value())
+
+        request.metadata.update(metadata)
+
+        response = await self._stub.AddMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
+
+    async def remove_metadata(self, pipeline_id: pipeline_types.PipelineId, keys: List[str],
+                              timeout=None) -> Mapping[str, str]:
+        """
+        Requests the removal of specified metadata of a pipeline.
+
+        Args:
+            pipeline_id: Unique identifier of the pipeline whose metadata is to be removed.
+            keys: List of keys to be removed from the pipeline metadata.
+
+        Returns:
+            A Mapping[str, str] containing the updated set of metadata
+        """
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (pipeline_id.value is None) or (pipeline_id.value == ""):
+            raise Exception("Pipeline identifier must have instantiated value")
+
+        if keys is None:
+            raise Exception("Keys paramater must be valid list of metadata keys")
+
+        request = pipelines_pb2.PipelinesRemoveMetadataRequest(header=self.get_request_header(),
+                                                               pipeline_id=pipeline_id.to_grpc_value())
+
+        request.keys.extend(keys)
+
+        response = await self._stub.RemoveMetadata(request, timeout=timeout)
+
+        self.check_response_header(header=response.header)
+
+        return response.metadata
@@ -0,0 +1,89 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import inspect
+from typing import AsyncIterator
+import nvidia_clara.constants as constants
+import nvidia_clara.transfer_tools as sync_transfer_tools
+
+
+async def read_chunks(source_object, chunk_size: int = constants.GrpcChunkSizeDefault) -> AsyncIterator[bytes]:
+    """
+    Creates asynchronous generator of chunks read from "source_object"
+
+    Args:
+        source_object: Source to read from; either an object whose "read(size)" is a coroutine function (such as an
+            aiofiles file or an asyncio.StreamReader), or a regular BinaryIO stream, which is read on the default
+            executor so the event loop is not blocked on disk
+        chunk_size (int): Size, in bytes, of each chunk
+    """
+    if inspect.iscoroutinefunction(source_object.read):
+        while True:
+            data = await source_object.read(chunk_size)
+
+            if not data:
+                return
+
+            yield data
+    else:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            data = await loop.run_in_executor(None, source_object.read, chunk_size)
+
+            if not data:
+                return
+
+            yield data
+
+
+async def rechunk(chunks, chunk_size: int = constants.GrpcChunkSizeDefault) -> AsyncIterator[bytes]:
+    """
+    Creates asynchronous generator of chunks of "chunk_size" bytes, the last one possibly smaller, from pieces of data
+    of any size
+
+    Args:
+        chunks: Asynchronous iterable, or regular iterable, of bytes-like objects
+        chunk_size (int): Size, in bytes, of each chunk
+    """
+    buffer = bytearray()
+
+    if hasattr(chunks, '__aiter__'):
+        async for data in chunks:
+            for chunk in sync_transfer_tools.fill_chunks(buffer, data, chunk_size):
+                yield chunk
+    else:
+        for data in chunks:
+            for chunk in sync_transfer_tools.fill_chunks(buffer, data, chunk_size):
+                yield chunk
+
+    if len(buffer) > 0:
+        yield bytes(buffer)
+
+
+async def write(dest_object, data: bytes):
+    """
+    Writes "data" to "dest_object"
+
+    Args:
+        dest_object: Destination to write to; either an object whose "write(data)" is a coroutine function, or a
+            regular BinaryIO stream, which is written on the default executor
+        data (bytes): Data to write
+    """
+    if inspect.iscoroutinefunction(dest_object.write):
+        await dest_object.write(data)
+    else:
+        await asyncio.get_running_loop().run_in_executor(None, dest_object.write, data)
@@ -13,11 +13,186 @@
 # limitations under the License.
 
 
+import os
 from enum import Enum
+from typing import Any, List, Tuple
+import grpc
 from nvidia_clara.grpc import common_pb2, jobs_pb2
 import nvidia_clara.constants as constants
 
 
+class ChannelOptions:
+
+    def __init__(self, max_send_message_length: int = None, max_receive_message_length: int = None,
+                 keepalive_time_ms: int = None, keepalive_timeout_ms: int = None,
+                 keepalive_permit_without_calls: bool = None, http2_max_pings_without_data: int = None,
+                 http2_max_frame_size: int = None, http2_bdp_probe: bool = None, http2_lookahead_bytes: int = None,
+                 compression: grpc.Compression = None, options: List[Tuple[str, Any]] = None):
+        """
+        Options applied to the gRPC channel opened by a client.
+
+        Options left as None keep the gRPC defaults.
+
+        Args:
+            max_send_message_length (int): Maximum size, in bytes, of a message sent by the client
+            max_receive_message_length (int): Maximum size, in bytes, of a message received by the client
+            keepalive_time_ms (int): Interval, in milliseconds, between keepalive pings
+            keepalive_timeout_ms (int): Time, in milliseconds, to wait for a keepalive ping acknowledgement
+            keepalive_permit_without_calls (bool): Whether keepalive pings are sent while no call is in flight
+            http2_max_pings_without_data (int): Maximum number of pings sent without data frames; 0 for no limit
+            http2_max_frame_size (int): Maximum size, in bytes, of HTTP/2 frames the client is willing to receive
+            http2_bdp_probe (bool): Whether bandwidth-delay product probing is used to size HTTP/2 flow control windows
+            http2_lookahead_bytes (int): Initial HTTP/2 stream flow control window, in bytes
+            compression (grpc.Compression): Default compression algorithm of calls issued over the channel
+            options (List[Tuple[str, Any]]): Additional raw gRPC channel arguments
+        """
+        if options is None:
+            options = []
+
+        self._max_send_message_length = max_send_message_length
+        self._max_receive_message_length = max_receive_message_length
+        self._keepalive_time_ms = keepalive_time_ms
+        self._keepalive_timeout_ms = keepalive_timeout_ms
+        self._keepalive_permit_without_calls = keepalive_permit_without_calls
+        self._http2_max_pings_without_data = http2_max_pings_without_data
+        self._http2_max_frame_size = http2_max_frame_size
+        self._http2_bdp_probe = http2_bdp_probe
+        self._http2_lookahead_bytes = http2_lookahead_bytes
+        self._compression = compression
+        self._options = options
+
+    @property
+    def max_send_message_length(self) -> int:
+        """Maximum size, in bytes, of a message sent by the client."""
+        return self._max_send_message_length
+
+    @max_send_message_length.setter
+    def max_send_message_length(self, max_send_message_length: int):
+        """Maximum size, in bytes, of a message sent by the client."""
+        self._max_send_message_length = max_send_message_length
+
+    @property
+    def max_receive_message_length(self) -> int:
+        """Maximum size, in bytes, of a message received by the client."""
+        return self._max_receive_message_length
+
+    @max_receive_message_length.setter
+    def max_receive_message_length(self, max_receive_message_length: int):
+        """Maximum size, in bytes, of a message received by the client."""
+        self._max_receive_message_length = max_receive_message_length
+
+    @property
+    def keepalive_time_ms(self) -> int:
+        """Interval, in milliseconds, between keepalive pings."""
+        return self._keepalive_time_ms
+
+    @keepalive_time_ms.setter
+    def keepalive_time_ms(self, keepalive_time_ms: int):
+        """Interval, in milliseconds, between keepalive pings."""
+        self._keepalive_time_ms = keepalive_time_ms
+
+    @property
+    def keepalive_timeout_ms(self) -> int:
+        """Time, in milliseconds, to wait for a keepalive ping acknowledgement."""
+        return self._keepalive_timeout_ms
+
+    @keepalive_timeout_ms.setter
+    def keepalive_timeout_ms(self, keepalive_timeout_ms: int):
+        """Time, in milliseconds, to wait for a keepalive ping acknowledgement."""
+        self._keepalive_timeout_ms = keepalive_timeout_ms
+
+    @property
+    def keepalive_permit_without_calls(self) -> bool:
+        """Whether keepalive pings are sent while no call is in flight."""
+        return self._keepalive_permit_without_calls
+
+    @keepalive_permit_without_calls.setter
+    def keepalive_permit_without_calls(self, keepalive_permit_without_calls: bool):
+        """Whether keepalive pings are sent while no call is in flight."""
+        self._keepalive_permit_without_calls = keepalive_permit_without_calls
+
+    @property
+    def http2_max_pings_without_data(self) -> int:
+        """Maximum number of pings sent without data frames; 0 for no limit."""
+        return self._http2_max_pings_without_data
+
+    @http2_max_pings_without_data.setter
+    def http2_max_pings_without_data(self, http2_max_pings_without_data: int):
+        """Maximum number of pings sent without data frames; 0 for no limit."""
+        self._http2_max_pings_without_data = http2_max_pings_without_data
+
+    @property
+    def http2_max_frame_size(self) -> int:
+        """Maximum size, in bytes, of HTTP/2 frames the client is willing to receive."""
+        return self._http2_max_frame_size
+
+    @http2_max_frame_size.setter
+    def http2_max_frame_size(self, http2_max_frame_size: int):
+        """Maximum size, in bytes, of HTTP/2 frames the client is willing to receive."""
+        self._http2_max_frame_size = http2_max_frame_size
+
+    @property
+    def http2_bdp_probe(self) -> bool:
+        """Whether bandwidth-delay product probing is used to size HTTP/2 flow control windows."""
+        return self._http2_bdp_probe
+
+    @http2_bdp_probe.setter
+    def http2_bdp_probe(self, http2_bdp_probe: bool):
+        """Whether bandwidth-delay product probing is used to size HTTP/2 flow control windows."""
+        self._http2_bdp_probe = http2_bdp_probe
+
+    @property
+    def http2_lookahead_bytes(self) -> int:
+        """Initial HTTP/2 stream flow control window, in bytes."""
+        return self._http2_lookahead_bytes
+
+    @http2_lookahead_bytes.setter
+    def http2_lookahead_bytes(self, http2_lookahead_bytes: int):
+        """Initial HTTP/2 stream flow control window, in bytes."""
+        self._http2_lookahead_bytes = http2_lookahead_bytes
+
+    @property
+    def compression(self) -> grpc.Compression:
+        """Default compression algorithm of calls issued over the channel."""
+        return self._compression
+
+    @compression.setter
+    def compression(self, compression: grpc.Compression):
+        """Default compression algorithm of calls issued over the channel."""
+        self._compression = compression
+
+    @property
+    def options(self) -> List[Tuple[str, Any]]:
+        """Additional raw gRPC channel arguments."""
+        return self._options
+
+    @options.setter
+    def options(self, options: List[Tuple[str, Any]]):
+        """Additional raw gRPC channel arguments."""
+        self._options = options
+
+    def to_grpc_options(self) -> List[Tuple[str, Any]]:
+        """
+        Returns the options as gRPC channel arguments
+        """
+        named_options = [
+            ('grpc.max_send_message_length', self._max_send_message_length),
+            ('grpc.max_receive_message_length', self._max_receive_message_length),
+            ('grpc.keepalive_time_ms', self._keepalive_time_ms),
+            ('grpc.keepalive_timeout_ms', self._keepalive_timeout_ms),
+            ('grpc.keepalive_permit_without_calls', self._keepalive_permit_without_calls),
+            ('grpc.http2.max_pings_without_data', self._http2_max_pings_without_data),
+            ('grpc.http2.max_frame_size', self._http2_max_frame_size),
+            ('grpc.http2.bdp_probe', self._http2_bdp_probe),
+            ('grpc.http2.lookahead_bytes', self._http2_lookahead_bytes),
+        ]
+
+        result = [(name, int(value)) for name, value in named_options if value is not None]
+        result.extend(self._options)
+
+        return result
+
+
 class BaseClient:
 
     @staticmethod
@@ -42,7 +217,33 @@ class BaseClient:
                 raise Exception("Internal Server Error " + str(header.code))
 
     @staticmethod
-    def get_request_header() -> common_pb2.RequestHeader:
+    def create_channel(connection: str, channel_options: ChannelOptions = None,
+                       options: List[Tuple[str, Any]] = None) -> grpc.Channel:
+        """
+        Opens an insecure channel to "connection"
+
+        Args:
+            connection (str): Address of the clara instance, including port
+            channel_options (ChannelOptions): if specified, options applied to the channel
+            options (List[Tuple[str, Any]]): if specified, additional raw gRPC channel arguments
+
+        Returns:
+            grpc.Channel to the clara instance
+        """
+        grpc_options = []
+        compression = None
+
+        if channel_options is not None:
+            grpc_options.extend(channel_options.to_grpc_options())
+            compression = channel_options.compression
+
+        if options is not None:
+            grpc_options.extend(options)
+
+        return grpc.insecure_channel(connection, options=grpc_options, compression=compression)
+
+    @staticmethod
+    def create_request_header() -> common_pb2.RequestHeader:
 
         header = common_pb2.RequestHeader(api_version=common_pb2.Version(
             major=constants.ClaraVersionMajor,
@@ -52,6 +253,103 @@ class BaseClient:
 
         return header
 
+    @staticmethod
+    def get_request_header() -> common_pb2.RequestHeader:
+        """
+        Request header sent with every request.
+
+        The header is built once and shared by all clients and messages, so it must not be modified; use
+        "create_request_header()" to obtain a private instance.
+        """
+        return _REQUEST_HEADER
+
+    @staticmethod
+    def get_parallel_streams(parallel_streams: int = None) -> int:
+        """
+        Resolves the number of concurrent gRPC streams to use for a transfer
+
+        Args:
+            parallel_streams (int): Requested number of streams. If not specified, the value of the
+                "GRPC_PARALLEL_STREAMS" environment variable is used, falling back to "GrpcParallelStreamsDefault"
+
+        Returns:
+            Number of streams, validated against "GrpcParallelStreamsMinimum" and "GrpcParallelStreamsMaximum"
+        """
+        if parallel_streams is None:
+            parallel_streams = os.environ.get(constants.GrpcParallelStreamsName,
+                                              constants.GrpcParallelStreamsDefault)
+
+        try:
+            parallel_streams = int(parallel_streams)
+        except ValueError:
+            raise Exception("Parallel streams must be an integer, found: " + str(parallel_streams))
+
+        if (parallel_streams < constants.GrpcParallelStreamsMinimum) or (
+                parallel_streams > constants.GrpcParallelStreamsMaximum):
+            raise Exception("Parallel streams must be within " + str(constants.GrpcParallelStreamsMinimum) + " and " +
+                            str(constants.GrpcParallelStreamsMaximum) + ", found: " + str(parallel_streams))
+
+        return parallel_streams
+
+    @staticmethod
+    def get_chunk_size(chunk_size: int = None) -> int:
+        """
+        Resolves the size of the data chunk carried by each message of an upload stream
+
+        Args:
+            chunk_size (int): Requested chunk size, in bytes. If not specified, the value of the "GRPC_CHUNK_SIZE"
+                environment variable is used, falling back to "GrpcChunkSizeDefault"
+
+        Returns:
+            Chunk size, validated against "GrpcChunkSizeMinimum" and "GrpcChunkSizeMaximum"
+        """
+        if chunk_size is None:
+            chunk_size = os.environ.get(constants.GrpcChunkSizeName, constants.GrpcChunkSizeDefault)
+
+        try:
+            chunk_size = int(chunk_size)
+        except ValueError:
+            raise Exception("Chunk size must be an integer, found: " + str(chunk_size))
+
+        if (chunk_size < constants.GrpcChunkSizeMinimum) or (chunk_size > constants.GrpcChunkSizeMaximum):
+            raise Exception("Chunk size must be within " + str(constants.GrpcChunkSizeMinimum) + " and " +
+                            str(constants.GrpcChunkSizeMaximum) + ", found: " + str(chunk_size))
+
+        return chunk_size
+
+    @staticmethod
+    def get_compression(compression: grpc.Compression = None, size: int = None,
+                        threshold: int = None) -> grpc.Compression:
+        """
+        Resolves the compression algorithm of a call transferring "size" bytes
+
+        Compressing small messages costs more in CPU time than it saves on the wire, so transfers smaller than
+        "threshold" bytes are sent uncompressed.
+
+        Args:
+            compression (grpc.Compression): Requested compression algorithm. If not specified, the default of the
+                channel applies
+            size (int): Size, in bytes, of the data transferred by the call; if not known, the threshold is not applied
+            threshold (int): Minimum size, in bytes, of a compressed transfer. If not specified,
+                "GrpcCompressionThresholdDefault" is used
+
+        Returns:
+            Compression algorithm of the call, or None to keep the default of the channel
+        """
+        if compression is None:
+            return None
+
+        if threshold is None:
+            threshold = constants.GrpcCompressionThresholdDefault
+
+        if (size is not None) and (size < threshold):
+            return grpc.Compression.NoCompression
+
+        return compression
+
+
+_REQUEST_HEADER = BaseClient.create_request_header()
+
 
 class RequestIterator(object):
 
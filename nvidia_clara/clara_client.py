@@ -16,20 +16,25 @@ import datetime
 from typing import List, Mapping, Iterator
 import grpc
 from nvidia_clara.grpc import common_pb2, clara_pb2, clara_pb2_grpc
-from nvidia_clara.base_client import BaseClient
+from nvidia_clara.base_client import BaseClient, ChannelOptions
 import nvidia_clara.clara_types as clara_types
 import nvidia_clara.job_types as job_types
+import nvidia_clara.timestamp_codec as timestamp_codec
 
 
 class ClaraClient(BaseClient):
 
-    def __init__(self, target: str, port: str = None, stub=None):
+    def __init__(self, target: str, port: str = None, stub=None, channel: grpc.Channel = None,
+                 channel_options: ChannelOptions = None):
         """
         Clara Client Creation
 
         Args:
             target (str): ipv4 address of clara instance
             port (str): if specified, port will be appended to the target with a ":"
+            channel (grpc.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
         """
         if target is None:
             raise Exception("Target must be initialized to a non-null value")
@@ -39,13 +44,56 @@ class ClaraClient(BaseClient):
         if port is not None:
             self._connection += ":" + port
 
-        self._channel = grpc.insecure_channel(self._connection)
+        self._channel_options = channel_options
+
+        if channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+        else:
+            self._channel = channel
+            self._owns_channel = False
 
         if stub is None:
             self._stub = clara_pb2_grpc.ClaraStub(self._channel)
         else:
             self._stub = stub
 
+    def close(self):
+        """
+        Close connection
+        """
+        if self._channel:
+            if self._owns_channel:
+                self._channel.close()
+            self._channel = None
+        else:
+            print("Connection for client already closed")
+
+    def reconnect(self, channel_options: ChannelOptions = None):
+        """
+        Re-open connection with existing channel
+
+        Args:
+            channel_options (ChannelOptions): if specified, replaces the options applied to the channel
+        """
+        if channel_options is not None:
+            self._channel_options = channel_options
+
+        if self._channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+            self._stub = clara_pb2_grpc.ClaraStub(self._channel)
+        else:
+            print("Connection for client already open")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._channel is not None:
+            self.close()
+        return False
+
     @staticmethod
     def get_timestamp(seconds_since_year_one: str) -> datetime.datetime:
         """
@@ -55,24 +103,65 @@ class ClaraClient(BaseClient):
             seconds_since_year_one(str): date to parse
 
         Returns:
-            datetime.datetime object
+            datetime.datetime object, naive in local time
         """
-        if (seconds_since_year_one is None) or (seconds_since_year_one == ""):
-            return None
+        return timestamp_codec.CLARA.decode(seconds_since_year_one)
+
+    @staticmethod
+    def get_utilization_details(response: clara_pb2.ClaraUtilizationResponse) -> clara_types.ClaraUtilizationDetails:
+        """
+        Creates clara_types.ClaraUtilizationDetails from a utilization response
+
+        Args:
+            response (clara_pb2.ClaraUtilizationResponse): utilization response to convert
+
+        Returns:
+            clara_types.ClaraUtilizationDetails
+        """
+        clara_utilization_details = clara_types.ClaraUtilizationDetails()
+
+        for item in response.gpu_metrics:
+            gpu_utilization = clara_types.ClaraGpuUtilization(
+                node_id=item.node_id,
+                pcie_id=item.pcie_id,
+                compute_utilization=item.compute_utilization,
+                memory_free=item.memory_free,
+                memory_used=item.memory_used,
+                memory_utilization=item.memory_utilization,
+                timestamp=ClaraClient.get_timestamp(item.timestamp),
+            )
+
+            for proc_info in item.process_details:
+                process_details = clara_types.ClaraProcessDetails(
+                    name=proc_info.name,
+                )
+
+                if proc_info.job_id.value:
+                    process_details.job_id = job_types.JobId(proc_info.job_id.value)
+
+                gpu_utilization.process_details.append((process_details))
 
-        try:
-            # Check to see if in form of seconds since year one
-            seconds_int = float(seconds_since_year_one.value) - 62167219200
-        except:
-            # Otherwise parse timestamp
-            return datetime.datetime.strptime(seconds_since_year_one, "%Y-%m-%d %H:%M:%SZ")
+            clara_utilization_details.gpu_metrics.append((gpu_utilization))
 
-        if seconds_int < 0:
-            return None
+        return clara_utilization_details
 
-        result_date = datetime.datetime.fromtimestamp(seconds_int)
+    @staticmethod
+    def get_version_info(response: clara_pb2.ClaraVersionResponse) -> clara_types.ClaraVersionInfo:
+        """
+        Creates clara_types.ClaraVersionInfo from a version response
+
+        Args:
+            response (clara_pb2.ClaraVersionResponse): version response to convert
 
-        return result_date
+        Returns:
+            clara_types.ClaraVersionInfo
+        """
+        return clara_types.ClaraVersionInfo(
+            major=response.version.major,
+            minor=response.version.minor,
+            patch=response.version.patch,
+            label=response.version.label
+        )
 
     def stop(self, timeout=None):
         """Sends stop request to instance of Pipeline Services and Triton"""
@@ -111,32 +200,7 @@ class ClaraClient(BaseClient):
                 self.check_response_header(header=resp.header)
                 header_check = True
 
-            metrics = resp.gpu_metrics
-            clara_utilization_details = clara_types.ClaraUtilizationDetails()
-            for item in metrics:
-                gpu_utilization = clara_types.ClaraGpuUtilization(
-                    node_id=item.node_id,
-                    pcie_id=item.pcie_id,
-                    compute_utilization=item.compute_utilization,
-                    memory_free=item.memory_free,
-                    memory_used=item.memory_used,
-                    memory_utilization=item.memory_utilization,
-                    timestamp=self.get_timestamp(item.timestamp),
-                )
-
-                for proc_info in item.process_details:
-                    process_details = clara_types.ClaraProcessDetails(
-                        name=proc_info.name,
-                    )
-
-                    if proc_info.job_id.value:
-                        process_details.job_id = job_types.JobId(proc_info.job_id.value)
-
-                    gpu_utilization.process_details.append((process_details))
-
-                clara_utilization_details.gpu_metrics.append((gpu_utilization))
-
-            utilization_list.append(clara_utilization_details)
+            utilization_list.append(self.get_utilization_details(resp))
 
         return utilization_list
 
@@ -163,29 +227,7 @@ class ClaraClient(BaseClient):
                 self.check_response_header(header=resp.header)
                 header_check = True
 
-            metrics = resp.gpu_metrics
-            clara_utilization_details = clara_types.ClaraUtilizationDetails()
-            for item in metrics:
-                gpu_utilization = clara_types.ClaraGpuUtilization(
-                    node_id=item.node_id,
-                    pcie_id=item.pcie_id,
-                    compute_utilization=item.compute_utilization,
-                    memory_free=item.memory_free,
-                    memory_used=item.memory_used,
-                    memory_utilization=item.memory_utilization,
-                    timestamp=self.get_timestamp(item.timestamp),
-                )
-
-                for proc_info in item.process_details:
-                    process_details = clara_types.ClaraProcessDetails(
-                        name=proc_info.name,
-                        job_id=job_types.JobId(proc_info.job_id.value)
-                    )
-                    gpu_utilization.process_details.append((process_details))
-
-                clara_utilization_details.gpu_metrics.append((gpu_utilization))
-
-            yield clara_utilization_details
+            yield self.get_utilization_details(resp)
 
     def version(self, timeout=None):
         """Get Clara Version"""
@@ -196,11 +238,4 @@ class ClaraClient(BaseClient):
 
         self.check_response_header(header=response.header)
 
-        result = clara_types.ClaraVersionInfo(
-            major=response.version.major,
-            minor=response.version.minor,
-            patch=response.version.patch,
-            label=response.version.label
-        )
-
-        return result
+        return self.get_version_info(response)
@@ -0,0 +1,139 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import grpc
+from nvidia_clara.base_client import BaseClient, ChannelOptions
+from nvidia_clara.jobs_client import JobsClient
+from nvidia_clara.payloads_client import PayloadsClient
+from nvidia_clara.pipelines_client import PipelinesClient
+from nvidia_clara.models_client import ModelsClient
+from nvidia_clara.clara_client import ClaraClient
+
+
+class ClaraSession:
+
+    def __init__(self, target: str, port: str = None, pool_size: int = 1, chunk_size: int = None,
+                 adaptive_chunk_size: bool = False, channel_options: ChannelOptions = None):
+        """
+        Clara Session Creation
+
+        A session owns a pool of channels to a Clara instance and hands out clients which issue their calls over those
+        channels, so any number of clients share "pool_size" HTTP/2 connections. Channels are assigned to clients
+        round-robin.
+
+        Args:
+            target (str): ipv4 address of clara instance
+            port (str): if specified, port will be appended to the target with a ":"
+            pool_size (int): number of channels, and so connections, in the pool
+            chunk_size (int): default upload chunk size of the payloads and models clients handed out
+            adaptive_chunk_size (bool): default adaptive chunk size setting of the payloads and models clients handed out
+            channel_options (ChannelOptions): if specified, options applied to the channels of the pool, and to the
+                channels the clients handed out open when reconnected
+        """
+        if target is None:
+            raise Exception("Target must be initialized to a non-null value")
+
+        if (pool_size is None) or (pool_size < 1):
+            raise Exception("Pool size must be at least 1, found: " + str(pool_size))
+
+        self._connection = target
+
+        if port is not None:
+            self._connection += ":" + port
+
+        self._target = target
+        self._port = port
+        self._chunk_size = chunk_size
+        self._adaptive_chunk_size = adaptive_chunk_size
+        self._channel_options = channel_options
+
+        # Channels with identical arguments share their underlying connections; a local subchannel pool gives each
+        # channel of the session its own connection
+        options = [('grpc.use_local_subchannel_pool', 1)] if pool_size > 1 else None
+
+        self._channels = [BaseClient.create_channel(self._connection, self._channel_options, options=options)
+                          for _ in range(pool_size)]
+        self._next_channel = itertools.cycle(self._channels)
+
+    @property
+    def pool_size(self) -> int:
+        """Number of channels in the pool."""
+        return len(self._channels)
+
+    def get_channel(self) -> grpc.Channel:
+        """
+        Returns the next channel of the pool, round-robin
+        """
+        if self._channels is None:
+            raise Exception("Session is closed")
+
+        return next(self._next_channel)
+
+    def jobs_client(self) -> JobsClient:
+        """
+        Creates a jobs client issuing its calls over the next channel of the pool
+        """
+        return JobsClient(target=self._target, port=self._port, channel=self.get_channel(),
+                          channel_options=self._channel_options)
+
+    def payloads_client(self) -> PayloadsClient:
+        """
+        Creates a payloads client issuing its calls over the next channel of the pool
+        """
+        return PayloadsClient(target=self._target, port=self._port, chunk_size=self._chunk_size,
+                              adaptive_chunk_size=self._adaptive_chunk_size, channel=self.get_channel(),
+                              channel_options=self._channel_options)
+
+    def pipelines_client(self) -> PipelinesClient:
+        """
+        Creates a pipelines client issuing its calls over the next channel of the pool
+        """
+        return PipelinesClient(target=self._target, port=self._port, channel=self.get_channel(),
+                               channel_options=self._channel_options)
+
+    def models_client(self) -> ModelsClient:
+        """
+        Creates a models client issuing its calls over the next channel of the pool
+        """
+        return ModelsClient(target=self._target, port=self._port, chunk_size=self._chunk_size,
+                            adaptive_chunk_size=self._adaptive_chunk_size, channel=self.get_channel(),
+                            channel_options=self._channel_options)
+
+    def clara_client(self) -> ClaraClient:
+        """
+        Creates a clara client issuing its calls over the next channel of the pool
+        """
+        return ClaraClient(target=self._target, port=self._port, channel=self.get_channel(),
+                           channel_options=self._channel_options)
+
+    def close(self):
+        """
+        Close all channels of the pool; clients handed out by the session can no longer issue calls
+        """
+        if self._channels is not None:
+            for channel in self._channels:
+                channel.close()
+            self._channels = None
+            self._next_channel = None
+        else:
+            print("Session already closed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._channels is not None:
+            self.close()
+        return False
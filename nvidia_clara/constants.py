@@ -20,9 +20,27 @@ GrpcChunkSizeDefault = 1024 * 1024
 GrpcChunkSizeMaximum = 4 * 1024 * 1024 - 512
 GrpcChunkSizeMinimum = 1024
 GrpcChunkSizeName = "GRPC_CHUNK_SIZE"
+GrpcCompressionThresholdDefault = 64 * 1024
 GrpcParallelStreamsDefault = 8
 GrpcParallelStreamsMaximum = 64
 GrpcParallelStreamsMinimum = 1
 GrpcParallelStreamsName = "GRPC_PARALLEL_STREAMS"
+GrpcReadAheadBytesMaximum = 64 * 1024 * 1024
+GrpcWriteBehindBytesMaximum = 64 * 1024 * 1024
 GrpcChannelProviderUnavailable = "GRPC Channel provider is unavailable."
 GrpcClientProviderUnavailable = "GRPC client provider is unavailable."
+JobSubmitRpcConcurrencyDefault = 8
+JobSubmitUploadConcurrencyDefault = 2
+JobWatcherCreatedMarginSeconds = 300
+JobWatcherErrorsMaximum = 5
+JobWatcherIntervalMaximumSeconds = 10.0
+JobWatcherIntervalMinimumSeconds = 0.5
+MetadataKeySizeMaximum = 128
+MetadataValueSizeMaximum = 256
+PayloadSyncMetadataKeyPrefix = "nvidia-clara-sync-"
+TimestampFormat = "%Y-%m-%d %H:%M:%SZ"
+TimestampOffsetYearOne = 62135596800
+TimestampOffsetYearZero = 62167219200
+TimestampParseCacheSize = 4096
+TransferCheckpointBytesInterval = 64 * 1024 * 1024
+TransferProgressIntervalSeconds = 0.5
@@ -0,0 +1,170 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import itertools
+import queue
+import threading
+import time
+from typing import Iterator, List, Mapping
+
+import nvidia_clara.constants as constants
+import nvidia_clara.job_types as job_types
+
+
+class JobSubmitter:
+    """
+    Submits many jobs, overlapping the three dependent steps of each submission across jobs: creating the job,
+    uploading its input files to its payload, and starting it.
+
+    Each stage has its own worker threads, so the RPC-bound create and start stages and the bandwidth-bound upload
+    stage are limited separately. Every stage takes the highest priority job waiting for it first.
+    """
+
+    STAGE_CREATE = "create"
+    STAGE_UPLOAD = "upload"
+    STAGE_START = "start"
+
+    def __init__(self, jobs_client, payloads_client, create_concurrency: int = None, upload_concurrency: int = None,
+                 start_concurrency: int = None, parallel_streams: int = None):
+        """
+        Args:
+            jobs_client (JobsClient): Client creating and starting the jobs
+            payloads_client (PayloadsClient): Client uploading the input files of the jobs
+            create_concurrency (int): Number of jobs created concurrently
+            upload_concurrency (int): Number of jobs whose input files are uploaded concurrently
+            start_concurrency (int): Number of jobs started concurrently
+            parallel_streams (int): Number of concurrent upload streams for the input files of each job
+        """
+        if (jobs_client is None) or (payloads_client is None):
+            raise Exception("Jobs and payloads clients must be initialized to non-null values")
+
+        concurrency = {
+            self.STAGE_CREATE: constants.JobSubmitRpcConcurrencyDefault if create_concurrency is None
+            else create_concurrency,
+            self.STAGE_UPLOAD: constants.JobSubmitUploadConcurrencyDefault if upload_concurrency is None
+            else upload_concurrency,
+            self.STAGE_START: constants.JobSubmitRpcConcurrencyDefault if start_concurrency is None
+            else start_concurrency,
+        }
+
+        for stage, count in concurrency.items():
+            if count < 1:
+                raise Exception("Concurrency of the " + stage + " stage must be at least 1, found: " + str(count))
+
+        self._jobs_client = jobs_client
+        self._payloads_client = payloads_client
+        self._concurrency = concurrency
+        self._parallel_streams = parallel_streams
+        self._stage_stats = {}
+
+    @property
+    def stage_stats(self) -> Mapping[str, job_types.JobStageStats]:
+        """Latencies of each stage of the last submission, by stage name; updated while jobs are submitted."""
+        return self._stage_stats
+
+    def submit_many(self, submissions: List[job_types.JobSubmission], timeout=None) -> Iterator[job_types.JobToken]:
+        """
+        Creates, uploads the input files of and starts every submitted job
+
+        Stages start when iteration begins. Once a stage fails for a job, no further stage is started and the failure
+        is raised after the stages in progress complete; jobs already created are left as they are.
+
+        Args:
+            submissions (List[job_types.JobSubmission]): Jobs to submit
+            timeout (float): If specified, timeout of each call
+
+        Returns:
+            Iterator of job_types.JobToken of the started jobs, in the order the jobs are started
+        """
+        stages = [self.STAGE_CREATE, self.STAGE_UPLOAD, self.STAGE_START]
+        queues = {stage: queue.PriorityQueue() for stage in stages}
+        results = queue.Queue()
+        sequence = itertools.count()
+        stopped = threading.Event()
+
+        self._stage_stats = {stage: job_types.JobStageStats(stage, concurrency=self._concurrency[stage])
+                             for stage in stages}
+
+        def put(stage, submission, job_info):
+            # Higher priorities first, then submission order
+            queues[stage].put((-submission.job_priority.value, next(sequence), submission, job_info))
+
+        def work(stage):
+            while True:
+                priority, index, submission, job_info = queues[stage].get()
+
+                if submission is None:
+                    return
+
+                if stopped.is_set():
+                    continue
+
+                start = time.perf_counter()
+
+                try:
+                    if stage == self.STAGE_CREATE:
+                        job_info = self._jobs_client.create_job(
+                            pipeline_id=submission.pipeline_id, job_name=submission.job_name,
+                            input_payloads=submission.input_payloads, job_priority=submission.job_priority,
+                            metadata=submission.metadata, timeout=timeout)
+                    elif stage == self.STAGE_UPLOAD:
+                        self._payloads_client.upload_many(payload_id=job_info.payload_id,
+                                                          files=submission.input_files,
+                                                          parallel_streams=self._parallel_streams, timeout=timeout)
+                    else:
+                        job_token = self._jobs_client.start_job(job_id=job_info.job_id,
+                                                                named_values=submission.named_values, timeout=timeout)
+                except Exception as error:
+                    stopped.set()
+                    results.put((None, error))
+                    continue
+
+                self._stage_stats[stage].latencies.append(time.perf_counter() - start)
+
+                if stage == self.STAGE_CREATE:
+                    put(self.STAGE_UPLOAD if len(submission.input_files) > 0 else self.STAGE_START, submission,
+                        job_info)
+                elif stage == self.STAGE_UPLOAD:
+                    put(self.STAGE_START, submission, job_info)
+                else:
+                    results.put((job_token, None))
+
+        for submission in submissions:
+            put(self.STAGE_CREATE, submission, None)
+
+        threads = [threading.Thread(target=work, args=(stage,), daemon=True)
+                   for stage in stages for _ in range(self._concurrency[stage])]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for _ in range(len(submissions)):
+                job_token, error = results.get()
+
+                if error is not None:
+                    raise error
+
+                yield job_token
+        finally:
+            stopped.set()
+
+            # Sentinels sort after every job, workers skip the jobs left once stopped
+            for stage in stages:
+                for _ in range(self._concurrency[stage]):
+                    queues[stage].put((float('inf'), next(sequence), None, None))
+
+            for thread in threads:
+                thread.join()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 from datetime import datetime
 from enum import Enum
 from typing import List, Mapping, TypeVar
@@ -19,6 +20,11 @@ from nvidia_clara.grpc import common_pb2, jobs_pb2
 import nvidia_clara.payload_types as payload_types
 import nvidia_clara.pipeline_types as pipeline_types
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 T = TypeVar('T')
 
 
@@ -425,3 +431,324 @@ class JobDetails(JobInfo):
     def operator_details(self, operator_details: Mapping[str, Mapping[str, T]]):
         """Dictionary mapping operator names to operator details"""
         self._operator_details = operator_details
+
+
+class JobSubmission:
+
+    def __init__(self, pipeline_id: pipeline_types.PipelineId, job_name: str,
+                 job_priority: JobPriority = JobPriority.Normal, input_files: Mapping[str, str] = None,
+                 input_payloads: List[payload_types.PayloadId] = None, metadata: Mapping[str, str] = None,
+                 named_values: Mapping[str, str] = None):
+        """
+        Args:
+            pipeline_id(pipeline_types.PipelineId): Unique identifier of the pipeline the job is instanced from
+            job_name(str): Human readable name of the job
+            job_priority(JobPriority): Priority of the job
+            input_files(Mapping[str, str]): Mapping of blob names, within the payload of the job, to paths of the
+                local files to upload before the job is started
+            input_payloads(List[payload_types.PayloadId]): Static payloads to include as input of the job
+            metadata(Mapping[str, str]): Metadata associated with the job
+            named_values(Mapping[str, str]): Name/value pairs used to populate pipeline variables when the job starts
+        """
+        if input_files is None:
+            input_files = dict()
+
+        self._pipeline_id = pipeline_id
+        self._job_name = job_name
+        self._job_priority = job_priority
+        self._input_files = input_files
+        self._input_payloads = input_payloads
+        self._metadata = metadata
+        self._named_values = named_values
+
+    @property
+    def pipeline_id(self) -> pipeline_types.PipelineId:
+        """Unique identifier of the pipeline the job is instanced from."""
+        return self._pipeline_id
+
+    @pipeline_id.setter
+    def pipeline_id(self, pipeline_id: pipeline_types.PipelineId):
+        """Unique identifier of the pipeline the job is instanced from."""
+        self._pipeline_id = pipeline_id
+
+    @property
+    def job_name(self) -> str:
+        """Human readable name of the job."""
+        return self._job_name
+
+    @job_name.setter
+    def job_name(self, job_name: str):
+        """Human readable name of the job."""
+        self._job_name = job_name
+
+    @property
+    def job_priority(self) -> JobPriority:
+        """Priority of the job."""
+        return self._job_priority
+
+    @job_priority.setter
+    def job_priority(self, job_priority: JobPriority):
+        """Priority of the job."""
+        self._job_priority = job_priority
+
+    @property
+    def input_files(self) -> Mapping[str, str]:
+        """Mapping of blob names, within the payload of the job, to paths of the local files to upload."""
+        return self._input_files
+
+    @input_files.setter
+    def input_files(self, input_files: Mapping[str, str]):
+        """Mapping of blob names, within the payload of the job, to paths of the local files to upload."""
+        self._input_files = input_files
+
+    @property
+    def input_payloads(self) -> List[payload_types.PayloadId]:
+        """Static payloads to include as input of the job."""
+        return self._input_payloads
+
+    @input_payloads.setter
+    def input_payloads(self, input_payloads: List[payload_types.PayloadId]):
+        """Static payloads to include as input of the job."""
+        self._input_payloads = input_payloads
+
+    @property
+    def metadata(self) -> Mapping[str, str]:
+        """Metadata associated with the job."""
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Mapping[str, str]):
+        """Metadata associated with the job."""
+        self._metadata = metadata
+
+    @property
+    def named_values(self) -> Mapping[str, str]:
+        """Name/value pairs used to populate pipeline variables when the job starts."""
+        return self._named_values
+
+    @named_values.setter
+    def named_values(self, named_values: Mapping[str, str]):
+        """Name/value pairs used to populate pipeline variables when the job starts."""
+        self._named_values = named_values
+
+
+class JobStageStats:
+
+    def __init__(self, stage: str, concurrency: int = 1, latencies: List[float] = None):
+        """
+        Args:
+            stage(str): Name of the submission stage
+            concurrency(int): Number of jobs processed concurrently by the stage
+            latencies(List[float]): Seconds taken by the stage for each job, in completion order
+        """
+        if latencies is None:
+            latencies = []
+
+        self._stage = stage
+        self._concurrency = concurrency
+        self._latencies = latencies
+
+    @property
+    def stage(self) -> str:
+        """Name of the submission stage."""
+        return self._stage
+
+    @stage.setter
+    def stage(self, stage: str):
+        """Name of the submission stage."""
+        self._stage = stage
+
+    @property
+    def concurrency(self) -> int:
+        """Number of jobs processed concurrently by the stage."""
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, concurrency: int):
+        """Number of jobs processed concurrently by the stage."""
+        self._concurrency = concurrency
+
+    @property
+    def latencies(self) -> List[float]:
+        """Seconds taken by the stage for each job, in completion order."""
+        return self._latencies
+
+    @latencies.setter
+    def latencies(self, latencies: List[float]):
+        """Seconds taken by the stage for each job, in completion order."""
+        self._latencies = latencies
+
+    @property
+    def count(self) -> int:
+        """Number of jobs which completed the stage."""
+        return len(self._latencies)
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean seconds taken by the stage per job."""
+        if len(self._latencies) == 0:
+            return 0.0
+        return sum(self._latencies) / len(self._latencies)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Seconds taken by the stage for the given percentile of jobs, by nearest rank
+
+        Args:
+            percent(float): Percentile, between 0 and 100
+
+        Returns:
+            Seconds taken by the stage, 0.0 if no job completed it
+        """
+        if len(self._latencies) == 0:
+            return 0.0
+
+        latencies = sorted(self._latencies)
+        rank = min(max(int(-(-percent * len(latencies) // 100)), 1), len(latencies))
+
+        return latencies[rank - 1]
+
+
+class JobTable:
+    """
+    Columnar view of a list of jobs, one column per field, for vectorized analysis.
+
+    Columns are NumPy arrays when NumPy is installed; otherwise numeric columns are "array.array" and identifier
+    columns are lists. Creation, start and stop times are seconds since the epoch, in UTC, and NaN when not set.
+    """
+
+    COLUMNS = ['job_id', 'job_state', 'job_status', 'job_priority', 'pipeline_id', 'created', 'started', 'stopped']
+
+    def __init__(self, job_ids: List[str] = None, job_states: array.array = None, job_statuses: array.array = None,
+                 job_priorities: array.array = None, pipeline_ids: List[str] = None, created: array.array = None,
+                 started: array.array = None, stopped: array.array = None):
+        """
+        Args:
+            job_ids(List[str]): Unique identifiers of the jobs
+            job_states(array.array): "JobState" values of the jobs
+            job_statuses(array.array): "JobStatus" values of the jobs
+            job_priorities(array.array): "JobPriority" values of the jobs
+            pipeline_ids(List[str]): Unique identifiers of the pipelines of the jobs
+            created(array.array): Creation times of the jobs, as "array.array" or NumPy array
+            started(array.array): Start times of the jobs, as "array.array" or NumPy array
+            stopped(array.array): Stop times of the jobs, as "array.array" or NumPy array
+        """
+        self._columns = {
+            'job_id': [] if job_ids is None else job_ids,
+            'job_state': array.array('i') if job_states is None else job_states,
+            'job_status': array.array('i') if job_statuses is None else job_statuses,
+            'job_priority': array.array('i') if job_priorities is None else job_priorities,
+            'pipeline_id': [] if pipeline_ids is None else pipeline_ids,
+            'created': array.array('d') if created is None else created,
+            'started': array.array('d') if started is None else started,
+            'stopped': array.array('d') if stopped is None else stopped,
+        }
+        self._converted = {}
+
+    def __len__(self) -> int:
+        return len(self._columns['job_id'])
+
+    def column(self, name: str):
+        """
+        Returns a column of the table
+
+        Args:
+            name(str): Name of the column, one of "JobTable.COLUMNS"
+
+        Returns:
+            NumPy array when NumPy is installed, otherwise "array.array" or list
+        """
+        if name not in self._columns:
+            raise Exception("Column must be one of " + str(JobTable.COLUMNS) + ", found: " + str(name))
+
+        if numpy is None:
+            return self._columns[name]
+
+        if name not in self._converted:
+            values = self._columns[name]
+
+            if isinstance(values, numpy.ndarray):
+                self._converted[name] = values
+            elif isinstance(values, array.array):
+                self._converted[name] = numpy.frombuffer(values, dtype=values.typecode)
+            else:
+                self._converted[name] = numpy.array(values, dtype=str)
+
+        return self._converted[name]
+
+    @property
+    def job_ids(self):
+        """Unique identifiers of the jobs."""
+        return self.column('job_id')
+
+    @property
+    def job_states(self):
+        """"JobState" values of the jobs."""
+        return self.column('job_state')
+
+    @property
+    def job_statuses(self):
+        """"JobStatus" values of the jobs."""
+        return self.column('job_status')
+
+    @property
+    def job_priorities(self):
+        """"JobPriority" values of the jobs."""
+        return self.column('job_priority')
+
+    @property
+    def pipeline_ids(self):
+        """Unique identifiers of the pipelines of the jobs."""
+        return self.column('pipeline_id')
+
+    @property
+    def created(self):
+        """Creation times of the jobs, in seconds since the epoch, NaN when not set."""
+        return self.column('created')
+
+    @property
+    def started(self):
+        """Start times of the jobs, in seconds since the epoch, NaN when not set."""
+        return self.column('started')
+
+    @property
+    def stopped(self):
+        """Stop times of the jobs, in seconds since the epoch, NaN when not set."""
+        return self.column('stopped')
+
+    def to_dict(self) -> Mapping[str, object]:
+        """
+        Returns the columns of the table
+
+        Returns:
+            Mapping of column names, in the order of "JobTable.COLUMNS", to columns
+        """
+        return {name: self.column(name) for name in JobTable.COLUMNS}
+
+    def to_pandas(self):
+        """
+        Returns the table as a pandas.DataFrame; requires pandas
+
+        Returns:
+            pandas.DataFrame with one column per column of the table
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise Exception("pandas must be installed to convert a job table to a data frame")
+
+        return pandas.DataFrame(self.to_dict())
+
+    def to_arrow(self):
+        """
+        Returns the table as a pyarrow.Table; requires pyarrow
+
+        Returns:
+            pyarrow.Table with one column per column of the table
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise Exception("pyarrow must be installed to convert a job table to an Arrow table")
+
+        return pyarrow.table(self.to_dict())
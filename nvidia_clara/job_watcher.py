@@ -0,0 +1,315 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import datetime
+import threading
+from concurrent import futures
+from typing import Callable, List
+
+import nvidia_clara.constants as constants
+import nvidia_clara.job_types as job_types
+import nvidia_clara.pipeline_types as pipeline_types
+
+
+class JobWatcher:
+    """
+    Tracks the completion of many jobs at once.
+
+    Instead of one "Status" call per job, every watched job is refreshed by a single "List" call per interval, filtered
+    to stopped jobs of the watched pipelines. The interval starts at "interval_seconds", grows by "backoff_factor" after
+    each refresh which finds no job stopped or fails, up to "max_interval_seconds", and is reset whenever a job stops or
+    a job is added. Refreshes run on a background thread, started by the first watched job; "refresh" may also be
+    called directly.
+
+    A failed list call leaves the jobs watched; their futures are only resolved with the error once "max_errors" list
+    calls in a row have failed, or when the watcher is closed.
+    """
+
+    def __init__(self, jobs_client, pipeline_ids: List[pipeline_types.PipelineId] = None,
+                 created_after: datetime.datetime = None, interval_seconds: float = None,
+                 max_interval_seconds: float = None, backoff_factor: float = 2.0, max_errors: int = None):
+        """
+        Args:
+            jobs_client (JobsClient): Client issuing the list calls
+            pipeline_ids (List[pipeline_types.PipelineId]): If specified, pipelines the list calls are limited to;
+                otherwise the pipelines of the watched jobs are used, when all of them are known
+            created_after (datetime.datetime): If specified, only jobs created after this date are listed; otherwise,
+                when the creation dates of all the watched jobs are known, only jobs created at most
+                "JobWatcherCreatedMarginSeconds" before the earliest of them. Either bounds the number of stopped jobs
+                returned on servers keeping a long history; without them every stopped job is listed
+            interval_seconds (float): Shortest interval between list calls
+            max_interval_seconds (float): Longest interval between list calls
+            backoff_factor (float): Factor the interval grows by after each list call finding no job stopped
+            max_errors (int): Number of list calls in a row failing before the futures of the watched jobs are
+                resolved with the error
+        """
+        if jobs_client is None:
+            raise Exception("Jobs client must be initialized to a non-null value")
+
+        if interval_seconds is None:
+            interval_seconds = constants.JobWatcherIntervalMinimumSeconds
+
+        if max_interval_seconds is None:
+            max_interval_seconds = max(interval_seconds, constants.JobWatcherIntervalMaximumSeconds)
+
+        if (interval_seconds <= 0) or (max_interval_seconds < interval_seconds):
+            raise Exception("Intervals must be positive, with the maximum interval not below the minimum interval, "
+                            "found: " + str(interval_seconds) + " and " + str(max_interval_seconds))
+
+        if backoff_factor < 1:
+            raise Exception("Backoff factor must be at least 1, found: " + str(backoff_factor))
+
+        if max_errors is None:
+            max_errors = constants.JobWatcherErrorsMaximum
+
+        if max_errors < 1:
+            raise Exception("Maximum number of errors must be at least 1, found: " + str(max_errors))
+
+        self._jobs_client = jobs_client
+        self._pipeline_ids = pipeline_ids
+        self._created_after = created_after
+        self._min_interval_seconds = interval_seconds
+        self._max_interval_seconds = max_interval_seconds
+        self._backoff_factor = backoff_factor
+        self._max_errors = max_errors
+        self._errors = 0
+        self._interval_seconds = interval_seconds
+        self._condition = threading.Condition()
+        self._jobs = {}
+        self._thread = None
+        self._closed = False
+
+    @property
+    def interval_seconds(self) -> float:
+        """Current interval between list calls."""
+        return self._interval_seconds
+
+    @property
+    def watched_jobs(self) -> List[job_types.JobId]:
+        """Identifiers of the jobs watched and not yet stopped."""
+        with self._condition:
+            return list(self._jobs.keys())
+
+    def watch(self, job_id: job_types.JobId, pipeline_id: pipeline_types.PipelineId = None,
+              callback: Callable[[job_types.JobInfo], None] = None,
+              date_created: datetime.datetime = None) -> futures.Future:
+        """
+        Watches a job until it stops
+
+        Args:
+            job_id (job_types.JobId): Unique identifier of the job
+            pipeline_id (pipeline_types.PipelineId): If specified, pipeline of the job, used to filter the list calls
+            callback (Callable[[job_types.JobInfo], None]): If specified, called with the job_types.JobInfo of the job
+                once stopped, on the thread of the watcher
+            date_created (datetime.datetime): If specified, creation date of the job, in UTC, as given by
+                "JobsClient.job_details"; used to bound the jobs listed when the watcher has no "created_after"
+
+        Returns:
+            concurrent.futures.Future resolved with the job_types.JobInfo of the job once stopped; once list calls
+            fail "max_errors" times in a row, the futures of all the jobs watched at that time are resolved with the
+            last error
+        """
+        if job_id is None:
+            raise Exception("Job identifier must be initialized to a non-null value")
+
+        with self._condition:
+            if self._closed:
+                raise Exception("Job watcher is closed")
+
+            if job_id in self._jobs:
+                future = self._jobs[job_id][0]
+            else:
+                future = futures.Future()
+                future.set_running_or_notify_cancel()
+
+                self._jobs[job_id] = (future, pipeline_id, date_created)
+                self._interval_seconds = self._min_interval_seconds
+
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+                # Wake up the thread when idle; a thread waiting for the next list call keeps its interval
+                if len(self._jobs) == 1:
+                    self._condition.notify()
+
+        if callback is not None:
+            future.add_done_callback(lambda done: callback(done.result()) if done.exception() is None else None)
+
+        return future
+
+    def wait(self, job_ids: List[job_types.JobId], timeout: float = None) -> List[job_types.JobInfo]:
+        """
+        Waits until all the given jobs are stopped, watching the jobs not yet watched
+
+        Args:
+            job_ids (List[job_types.JobId]): Unique identifiers of the jobs
+            timeout (float): If specified, maximum number of seconds to wait
+
+        Returns:
+            List of job_types.JobInfo of the stopped jobs, in the order of "job_ids"
+        """
+        watched = [self.watch(job_id) for job_id in job_ids]
+
+        done, not_done = futures.wait(watched, timeout=timeout)
+
+        if len(not_done) > 0:
+            raise Exception("Timed out waiting for jobs to stop, " + str(len(not_done)) + " of " + str(len(watched)) +
+                            " jobs not stopped")
+
+        return [future.result() for future in watched]
+
+    def create_job_filter(self, pipeline_ids: List[pipeline_types.PipelineId],
+                          dates_created: List[datetime.datetime] = None) -> job_types.JobFilter:
+        """
+        Creates the filter of a list call refreshing jobs of the given pipelines
+
+        Args:
+            pipeline_ids (List[pipeline_types.PipelineId]): Pipelines of the watched jobs, None where unknown
+            dates_created (List[datetime.datetime]): Creation dates of the watched jobs, None where unknown; bounding
+                the jobs listed when the watcher has no "created_after" and all of them are known
+
+        Returns:
+            job_types.JobFilter limited to stopped jobs
+        """
+        if self._pipeline_ids is not None:
+            pipeline_ids = self._pipeline_ids
+        elif any(pipeline_id is None for pipeline_id in pipeline_ids):
+            pipeline_ids = []
+        else:
+            pipeline_ids = list(dict.fromkeys(pipeline_ids))
+
+        created_after = self._created_after
+
+        # A job created before the bound would never be listed, so no bound is derived unless every date is known
+        if (created_after is None) and dates_created and all(date is not None for date in dates_created):
+            created_after = min(dates_created) - datetime.timedelta(seconds=constants.JobWatcherCreatedMarginSeconds)
+
+        return job_types.JobFilter(created_after=created_after, has_job_state=[job_types.JobState.Stopped],
+                                   pipeline_ids=pipeline_ids)
+
+    def refresh(self, timeout=None) -> int:
+        """
+        Refreshes all the watched jobs with a single list call, resolving the futures of the stopped ones
+
+        Args:
+            timeout (float): If specified, timeout of the list call
+
+        Returns:
+            Number of watched jobs found stopped; errors of the list call are raised
+        """
+        with self._condition:
+            pending = dict(self._jobs)
+
+        if len(pending) == 0:
+            return 0
+
+        job_filter = self.create_job_filter([pipeline_id for future, pipeline_id, date_created in pending.values()],
+                                            [date_created for future, pipeline_id, date_created in pending.values()])
+        stopped = {}
+
+        try:
+            for job_info in self._jobs_client.stream_jobs(job_filter=job_filter, timeout=timeout):
+                if job_info.job_id in pending:
+                    stopped[job_info.job_id] = job_info
+        except Exception as error:
+            failed = {}
+
+            with self._condition:
+                # The jobs stay watched through transient errors, the next list call following a longer interval
+                self._errors += 1
+                self._interval_seconds = min(self._interval_seconds * self._backoff_factor,
+                                             self._max_interval_seconds)
+
+                if self._errors >= self._max_errors:
+                    self._errors = 0
+                    for job_id in pending:
+                        if job_id in self._jobs:
+                            failed[job_id] = self._jobs.pop(job_id)
+
+            # Only the futures removed by this call are resolved here, others are resolved by "close"
+            for future, pipeline_id, date_created in failed.values():
+                if not future.done():
+                    future.set_exception(error)
+
+            raise
+
+        resolved = {}
+
+        with self._condition:
+            self._errors = 0
+
+            # Jobs removed meanwhile by "close" or by a concurrent refresh are left to them
+            for job_id in stopped:
+                if job_id in self._jobs:
+                    resolved[job_id] = self._jobs.pop(job_id)
+
+            if len(stopped) > 0:
+                self._interval_seconds = self._min_interval_seconds
+            else:
+                self._interval_seconds = min(self._interval_seconds * self._backoff_factor,
+                                             self._max_interval_seconds)
+
+        for job_id, (future, pipeline_id, date_created) in resolved.items():
+            if not future.done():
+                future.set_result(stopped[job_id])
+
+        return len(resolved)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while (not self._closed) and (len(self._jobs) == 0):
+                    self._condition.wait()
+
+                # Jobs just watched are seldom already stopped, each list call follows an interval
+                if not self._closed:
+                    self._condition.wait(self._interval_seconds)
+
+                if self._closed:
+                    return
+
+            try:
+                self.refresh()
+            except Exception:
+                # Raised to the futures of the jobs watched once list calls keep failing
+                pass
+
+    def close(self):
+        """
+        Stops watching; the futures of the jobs not yet stopped are resolved with an exception
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            self._closed = True
+            pending = dict(self._jobs)
+            self._jobs.clear()
+            self._condition.notify_all()
+
+        if (self._thread is not None) and (self._thread is not threading.current_thread()):
+            self._thread.join()
+
+        for future, pipeline_id, date_created in pending.values():
+            if not future.done():
+                future.set_exception(Exception("Job watcher closed before the job stopped"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -12,16 +12,98 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import datetime
-from typing import List, Mapping
+from typing import List, Mapping, Sequence
 import grpc
 import itertools
 
 from nvidia_clara.grpc import common_pb2, jobs_pb2, jobs_pb2_grpc
-from nvidia_clara.base_client import BaseClient
+from nvidia_clara.base_client import BaseClient, ChannelOptions
 import nvidia_clara.job_types as job_types
 import nvidia_clara.pipeline_types as pipeline_types
 import nvidia_clara.payload_types as payload_types
+import nvidia_clara.timestamp_codec as timestamp_codec
+
+
+class JobList(Sequence):
+    """
+    Sequence of the jobs of a "List" stream, as job_types.JobInfo.
+
+    Messages are received from the stream as items are accessed, so the first job is available as soon as its message
+    is received; "len" and negative indexes receive the whole stream. The job details of each message are kept as
+    received, and converted to a job_types.JobInfo only when the job is first accessed.
+    """
+
+    def __init__(self, responses, check_response_header, get_job_info):
+        """
+        Args:
+            responses: Iterator of jobs_pb2.JobsListResponse messages, as returned by the "List" call
+            check_response_header: Callable checking the header of the first message
+            get_job_info: Callable converting the job details of a message to a job_types.JobInfo
+        """
+        self._responses = iter(responses)
+        self._check_response_header = check_response_header
+        self._get_job_info = get_job_info
+        self._job_details = []
+        self._jobs = []
+        self._received = False
+        self._complete = False
+
+    def _receive(self, count: int = None):
+        while (not self._complete) and ((count is None) or (len(self._job_details) < count)):
+            response = next(self._responses, None)
+
+            if response is None:
+                self._complete = True
+                break
+
+            if not self._received:
+                self._check_response_header(header=response.header)
+                self._received = True
+
+            if (response.job_details is None) or (response.job_details.job_id.value == ''):
+                continue
+
+            self._job_details.append(response.job_details)
+            self._jobs.append(None)
+
+    def _get_job(self, index: int) -> job_types.JobInfo:
+        job_info = self._jobs[index]
+
+        if job_info is None:
+            job_info = self._get_job_info(self._job_details[index])
+            self._jobs[index] = job_info
+
+        return job_info
+
+    def __len__(self) -> int:
+        self._receive()
+        return len(self._jobs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._receive()
+            return [self._get_job(position) for position in range(*index.indices(len(self._jobs)))]
+
+        if index < 0:
+            self._receive()
+        else:
+            self._receive(index + 1)
+
+        return self._get_job(index)
+
+    def __iter__(self):
+        index = 0
+
+        while True:
+            self._receive(index + 1)
+
+            if index >= len(self._jobs):
+                return
+
+            yield self._get_job(index)
+            index += 1
 
 
 class JobsClientStub:
@@ -92,6 +174,32 @@ class JobsClientStub:
         """
         pass
 
+    def list_jobs_lazy(self, job_filter: job_types.JobFilter = None) -> JobList:
+        """
+        Provides list of current jobs on platform, received and converted as the jobs are accessed
+
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
+
+        Returns:
+            JobList of job_types.JobInfo with known pipeline job details from the server.
+        """
+        pass
+
+    def list_jobs_table(self, job_filter: job_types.JobFilter = None) -> job_types.JobTable:
+        """
+        Provides the current jobs on platform as a columnar table
+
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
+
+        Returns:
+            job_types.JobTable with one column per job field
+        """
+        pass
+
     def start_job(self, job_id: job_types.JobId, named_values: Mapping[str, str] = None) -> job_types.JobToken:
         """
         Starts a "JobState.Pending" job.
@@ -155,13 +263,17 @@ class JobsClientStub:
 
 class JobsClient(BaseClient, JobsClientStub):
 
-    def __init__(self, target: str, port: str = None, stub=None):
+    def __init__(self, target: str, port: str = None, stub=None, channel: grpc.Channel = None,
+                 channel_options: ChannelOptions = None):
         """
         Jobs Client Creation
 
         Args:
             target (str): ipv4 address of clara instance
             port (str): if specified, port will be appended to the target with a ":"
+            channel (grpc.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
         """
         if target is None:
             raise Exception("Target must be initialized to a non-null value")
@@ -171,7 +283,14 @@ class JobsClient(BaseClient, JobsClientStub):
         if port is not None:
             self._connection += ":" + port
 
-        self._channel = grpc.insecure_channel(self._connection)
+        self._channel_options = channel_options
+
+        if channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+        else:
+            self._channel = channel
+            self._owns_channel = False
 
         if stub is None:
             self._stub = jobs_pb2_grpc.JobsStub(self._channel)
@@ -183,18 +302,26 @@ class JobsClient(BaseClient, JobsClientStub):
         Close connection
         """
         if self._channel:
-            self._channel.close()
+            if self._owns_channel:
+                self._channel.close()
             self._channel = None
             self._stub = None
         else:
             print("Connection for client already closed")
 
-    def reconnect(self):
+    def reconnect(self, channel_options: ChannelOptions = None):
         """
         Re-open connection with existing channel
+
+        Args:
+            channel_options (ChannelOptions): if specified, replaces the options applied to the channel
         """
+        if channel_options is not None:
+            self._channel_options = channel_options
+
         if self._channel is None:
-            self._channel = grpc.insecure_channel(self._connection)
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
             self._stub = jobs_pb2_grpc.JobsStub(self._channel)
         else:
             print("Connection for client already open")
@@ -216,24 +343,137 @@ class JobsClient(BaseClient, JobsClientStub):
             seconds_since_year_one(str): date to parse
 
         Returns:
-            datetime.datetime object
+            datetime.datetime object, in UTC
+        """
+        return timestamp_codec.JOBS.decode(seconds_since_year_one)
+
+    @staticmethod
+    def get_epoch_seconds(timestamp: common_pb2.Timestamp) -> float:
+        """
+        Converts a timestamp, in seconds since year one, to seconds since the epoch
+
+        Args:
+            timestamp (common_pb2.Timestamp): timestamp to convert
+
+        Returns:
+            seconds since the epoch, in UTC, or NaN if the timestamp is not set
         """
-        if (seconds_since_year_one is None) or (seconds_since_year_one == ""):
-            return None
+        return timestamp_codec.JOBS.to_epoch_seconds(timestamp)
 
-        try:
-            # Check to see if in form of seconds since year one
-            seconds_int = float(seconds_since_year_one.value) - 62135596800
-        except:
-            # Otherwise parse timestamp
-            return datetime.datetime.strptime(seconds_since_year_one, "%Y-%m-%d %H:%M:%SZ").astimezone(datetime.timezone.utc)
+    @staticmethod
+    def create_list_request(job_filter: job_types.JobFilter = None) -> jobs_pb2.JobsListRequest:
+        """
+        Creates the request of a list call, applying "job_filter"
 
-        if seconds_int < 0:
-            return None
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
 
-        result_date = datetime.datetime.fromtimestamp(seconds_int).astimezone(datetime.timezone.utc)
+        Returns:
+            jobs_pb2.JobsListRequest
+        """
+        empty = job_types.JobFilter()
 
-        return result_date
+        request = jobs_pb2.JobsListRequest(
+            header=BaseClient.get_request_header()
+        )
+
+        if job_filter != empty and job_filter is not None:
+            if job_filter.completed_before is not None:
+                request.filter.completed_before.value = timestamp_codec.JOBS.encode(job_filter.completed_before)
+
+            if job_filter.created_after is not None:
+                request.filter.created_after.value = timestamp_codec.JOBS.encode(job_filter.created_after)
+
+            if job_filter.has_job_state is not None:
+                if len(job_filter.has_job_state) > 0:
+                    for state in job_filter.has_job_state:
+                        if (state.value < job_types.JobState.Minimum.value) or (
+                                state.value > job_types.JobState.Maximum.value):
+                            raise Exception("Job states in filter must be within " + str(
+                                job_types.JobState.Minimum) + " and " + str(
+                                job_types.JobState.Maximum) + ", found:" + str(state))
+
+                        request.filter.has_state.append(state.value)
+
+            if job_filter.has_job_status is not None:
+                if len(job_filter.has_job_status) > 0:
+                    for status in job_filter.has_job_status:
+                        if (status.value < job_types.JobStatus.Minimum.value) or (
+                                status.value > job_types.JobStatus.Maximum.value):
+                            raise Exception("Job status in filter must be within " + str(
+                                job_types.JobStatus.Minimum) + " and " + str(
+                                job_types.JobStatus.Maximum) + ", found:" + str(status))
+
+                        request.filter.has_status.append(status.value)
+
+            if job_filter.pipeline_ids is not None:
+                if len(job_filter.pipeline_ids) > 0:
+                    for pipe_id in job_filter.pipeline_ids:
+                        request.filter.pipeline_id.append(pipe_id.to_grpc_value())
+
+        return request
+
+    @staticmethod
+    def get_job_info(job_details: jobs_pb2.JobsListResponse.JobDetails) -> job_types.JobInfo:
+        """
+        Creates job_types.JobInfo from the job details of a list response
+
+        Args:
+            job_details (jobs_pb2.JobsListResponse.JobDetails): job details to convert
+
+        Returns:
+            job_types.JobInfo
+        """
+        return job_types.JobInfo(
+            job_id=job_types.JobId(job_details.job_id.value),
+            job_priority=job_details.priority,
+            job_state=job_details.state,
+            job_status=job_details.status,
+            name=job_details.job_name,
+            payload_id=payload_types.PayloadId(job_details.payload_id.value),
+            pipeline_id=pipeline_types.PipelineId(job_details.pipeline_id.value),
+            date_created=JobsClient.get_timestamp(job_details.created),
+            date_started=JobsClient.get_timestamp(job_details.started),
+            date_stopped=JobsClient.get_timestamp(job_details.stopped),
+            metadata=job_details.metadata
+        )
+
+    @staticmethod
+    def get_job_details(response: jobs_pb2.JobsStatusResponse) -> job_types.JobDetails:
+        """
+        Creates job_types.JobDetails from a status response
+
+        Args:
+            response (jobs_pb2.JobsStatusResponse): status response to convert
+
+        Returns:
+            job_types.JobDetails
+        """
+        operator_details = {}
+
+        for item in response.operator_details:
+            operator_details[item.name] = {}
+            operator_details[item.name]["created"] = item.created
+            operator_details[item.name]["started"] = item.started
+            operator_details[item.name]["stopped"] = item.stopped
+            operator_details[item.name]["status"] = item.status
+
+        return job_types.JobDetails(
+            job_id=job_types.JobId(response.job_id.value),
+            job_priority=response.priority,
+            job_state=response.state,
+            job_status=response.status,
+            name=response.name,
+            payload_id=payload_types.PayloadId(response.payload_id.value),
+            pipeline_id=pipeline_types.PipelineId(response.pipeline_id.value),
+            date_created=JobsClient.get_timestamp(response.created),
+            date_started=JobsClient.get_timestamp(response.started),
+            date_stopped=JobsClient.get_timestamp(response.stopped),
+            operator_details=operator_details,
+            messages=response.messages,
+            metadata=response.metadata
+        )
 
     def cancel_job(self, job_id: job_types.JobId, reason=None, timeout=None) -> job_types.JobToken:
         """
@@ -367,33 +607,7 @@ class JobsClient(BaseClient, JobsClientStub):
 
         self.check_response_header(header=response.header)
 
-        resp_operator_details = response.operator_details
-        operator_details = {}
-
-        for item in resp_operator_details:
-            operator_details[item.name] = {}
-            operator_details[item.name]["created"] = item.created
-            operator_details[item.name]["started"] = item.started
-            operator_details[item.name]["stopped"] = item.stopped
-            operator_details[item.name]["status"] = item.status
-
-        result = job_types.JobDetails(
-            job_id=job_types.JobId(response.job_id.value),
-            job_priority=response.priority,
-            job_state=response.state,
-            job_status=response.status,
-            name=response.name,
-            payload_id=payload_types.PayloadId(response.payload_id.value),
-            pipeline_id=pipeline_types.PipelineId(response.pipeline_id.value),
-            date_created=self.get_timestamp(response.created),
-            date_started=self.get_timestamp(response.started),
-            date_stopped=self.get_timestamp(response.stopped),
-            operator_details=operator_details,
-            messages=response.messages,
-            metadata=response.metadata
-        )
-
-        return result
+        return self.get_job_details(response)
 
     def list_jobs(self, job_filter: job_types.JobFilter = None, timeout=None) -> List[job_types.JobInfo]:
         """
@@ -406,68 +620,29 @@ class JobsClient(BaseClient, JobsClientStub):
         Returns:
             list of job_types.JobInfo with known pipeline job details from the server.
         """
+        return list(self.stream_jobs(job_filter=job_filter, timeout=timeout))
 
-        if (self._channel is None) or (self._stub is None):
-            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
-
-        empty = job_types.JobFilter()
-
-        request = jobs_pb2.JobsListRequest(
-            header=self.get_request_header()
-        )
-
-        if job_filter != empty and job_filter is not None:
-            request_filter = jobs_pb2.JobsListRequest.JobFilter
-
-            if job_filter.completed_before is not None:
-                day_one = datetime.datetime(1, 1, 1)
-                if job_filter.completed_before.tzinfo is not None \
-                        and job_filter.completed_before.tzinfo.utcoffset(job_filter.completed_before) is not None:
-                    day_one = datetime.datetime(1, 1, 1, tzinfo=job_filter.completed_before.tzinfo)
-
-                seconds = (job_filter.completed_before - day_one).total_seconds()
-                request.filter.completed_before.value = int(seconds)
-
-            if job_filter.created_after is not None:
-                day_one = datetime.datetime(1, 1, 1)
-                if job_filter.created_after.tzinfo is not None \
-                        and job_filter.created_after.tzinfo.utcoffset(job_filter.created_after) is not None:
-                    day_one = datetime.datetime(1, 1, 1, tzinfo=job_filter.created_after.tzinfo)
-
-                seconds = (job_filter.created_after - day_one).total_seconds()
-                request.filter.created_after.value = int(seconds)
-
-            if job_filter.has_job_state is not None:
-                if len(job_filter.has_job_state) > 0:
-                    for state in job_filter.has_job_state:
-                        if (state.value < job_types.JobState.Minimum.value) or (
-                                state.value > job_types.JobState.Maximum.value):
-                            raise Exception("Job states in filter must be within " + str(
-                                job_types.JobState.Minimum) + " and " + str(
-                                job_types.JobState.Maximum) + ", found:" + str(state))
+    def stream_jobs(self, job_filter: job_types.JobFilter = None, timeout=None):
+        """
+        Provides generator to stream current jobs on platform
 
-                        request.filter.has_state.append(state.value)
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
 
-            if job_filter.has_job_status is not None:
-                if len(job_filter.has_job_status) > 0:
-                    for status in job_filter.has_job_status:
-                        if (status.value < job_types.JobStatus.Minimum.value) or (
-                                status.value > job_types.JobStatus.Maximum.value):
-                            raise Exception("Job status in filter must be within " + str(
-                                job_types.JobStatus.Minimum) + " and " + str(
-                                job_types.JobStatus.Maximum) + ", found:" + str(status))
+        Returns:
+            list of job_types.JobInfo with known pipeline job details from the server.
+        """
 
-                        request.filter.has_status.append(status.value)
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
 
-            if job_filter.pipeline_ids is not None:
-                if len(job_filter.pipeline_ids) > 0:
-                    for pipe_id in job_filter.pipeline_ids:
-                        request.filter.pipeline_id.append(pipe_id.to_grpc_value())
+        request = self.create_list_request(job_filter)
 
         response = self._stub.List(request, timeout=timeout)
 
         check_header = True
-        result = []
+
         for item in response:
 
             if check_header:
@@ -477,96 +652,64 @@ class JobsClient(BaseClient, JobsClientStub):
             if (item.job_details is None) or (item.job_details.job_id.value == ''):
                 continue
 
-            info = job_types.JobInfo(
-                job_id=job_types.JobId(item.job_details.job_id.value),
-                job_priority=item.job_details.priority,
-                job_state=item.job_details.state,
-                job_status=item.job_details.status,
-                name=item.job_details.job_name,
-                payload_id=payload_types.PayloadId(item.job_details.payload_id.value),
-                pipeline_id=pipeline_types.PipelineId(item.job_details.pipeline_id.value),
-                date_created=self.get_timestamp(item.job_details.created),
-                date_started=self.get_timestamp(item.job_details.started),
-                date_stopped=self.get_timestamp(item.job_details.stopped),
-                metadata=item.job_details.metadata
-            )
-
-            result.append(info)
+            yield self.get_job_info(item.job_details)
 
-        return result
-
-
-    def stream_jobs(self, job_filter: job_types.JobFilter = None, timeout=None):
+    def list_jobs_lazy(self, job_filter: job_types.JobFilter = None, timeout=None) -> JobList:
         """
-        Provides generator to stream current jobs on platform
+        Provides list of current jobs on platform, received and converted as the jobs are accessed
+
+        Unlike "list_jobs", no job_types.JobInfo is built up front: the "List" stream is received as the jobs are
+        accessed, and the job details of each message are converted to a job_types.JobInfo when the job is first
+        accessed.
 
         Args:
             job_filter (job_types.JobFilter): Optional filter used to limit the number of
             pipeline job records return
 
         Returns:
-            list of job_types.JobInfo with known pipeline job details from the server.
+            JobList of job_types.JobInfo with known pipeline job details from the server.
         """
 
         if (self._channel is None) or (self._stub is None):
             raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
 
-        empty = job_types.JobFilter()
-
-        request = jobs_pb2.JobsListRequest(
-            header=self.get_request_header()
-        )
-
-        if job_filter != empty and job_filter is not None:
-            request_filter = jobs_pb2.JobsListRequest.JobFilter
+        request = self.create_list_request(job_filter)
 
-            if job_filter.completed_before is not None:
-                day_one = datetime.datetime(1, 1, 1)
-                if job_filter.completed_before.tzinfo is not None \
-                        and job_filter.completed_before.tzinfo.utcoffset(job_filter.completed_before) is not None:
-                    day_one = datetime.datetime(1, 1, 1, tzinfo=job_filter.completed_before.tzinfo)
+        response = self._stub.List(request, timeout=timeout)
 
-                seconds = (job_filter.completed_before - day_one).total_seconds()
-                request.filter.completed_before.value = int(seconds)
+        return JobList(response, self.check_response_header, self.get_job_info)
 
-            if job_filter.created_after is not None:
-                day_one = datetime.datetime(1, 1, 1)
-                if job_filter.created_after.tzinfo is not None \
-                        and job_filter.created_after.tzinfo.utcoffset(job_filter.created_after) is not None:
-                    day_one = datetime.datetime(1, 1, 1, tzinfo=job_filter.created_after.tzinfo)
+    def list_jobs_table(self, job_filter: job_types.JobFilter = None, timeout=None) -> job_types.JobTable:
+        """
+        Provides the current jobs on platform as a columnar table
 
-                seconds = (job_filter.created_after - day_one).total_seconds()
-                request.filter.created_after.value = int(seconds)
+        The table is built in a single pass over the "List" stream, appending the fields of each job to typed columns
+        without creating any job_types.JobInfo, so reports over many jobs can be computed on whole columns.
 
-            if job_filter.has_job_state is not None:
-                if len(job_filter.has_job_state) > 0:
-                    for state in job_filter.has_job_state:
-                        if (state.value < job_types.JobState.Minimum.value) or (
-                                state.value > job_types.JobState.Maximum.value):
-                            raise Exception("Job states in filter must be within " + str(
-                                job_types.JobState.Minimum) + " and " + str(
-                                job_types.JobState.Maximum) + ", found:" + str(state))
-
-                        request.filter.has_state.append(state.value)
+        Args:
+            job_filter (job_types.JobFilter): Optional filter used to limit the number of
+            pipeline job records return
 
-            if job_filter.has_job_status is not None:
-                if len(job_filter.has_job_status) > 0:
-                    for status in job_filter.has_job_status:
-                        if (status.value < job_types.JobStatus.Minimum.value) or (
-                                status.value > job_types.JobStatus.Maximum.value):
-                            raise Exception("Job status in filter must be within " + str(
-                                job_types.JobStatus.Minimum) + " and " + str(
-                                job_types.JobStatus.Maximum) + ", found:" + str(status))
+        Returns:
+            job_types.JobTable with one column per job field
+        """
 
-                        request.filter.has_status.append(status.value)
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
 
-            if job_filter.pipeline_ids is not None:
-                if len(job_filter.pipeline_ids) > 0:
-                    for pipe_id in job_filter.pipeline_ids:
-                        request.filter.pipeline_id.append(pipe_id.to_grpc_value())
+        request = self.create_list_request(job_filter)
 
         response = self._stub.List(request, timeout=timeout)
 
+        job_ids = []
+        job_states = array.array('i')
+        job_statuses = array.array('i')
+        job_priorities = array.array('i')
+        pipeline_ids = []
+        created = array.array('q')
+        started = array.array('q')
+        stopped = array.array('q')
+
         check_header = True
 
         for item in response:
@@ -575,25 +718,28 @@ class JobsClient(BaseClient, JobsClientStub):
                 self.check_response_header(header=item.header)
                 check_header = False
 
-            if (item.job_details is None) or (item.job_details.job_id.value == ''):
-                continue
+            job_details = item.job_details
 
-            info = job_types.JobInfo(
-                job_id=job_types.JobId(item.job_details.job_id.value),
-                job_priority=item.job_details.priority,
-                job_state=item.job_details.state,
-                job_status=item.job_details.status,
-                name=item.job_details.job_name,
-                payload_id=payload_types.PayloadId(item.job_details.payload_id.value),
-                pipeline_id=pipeline_types.PipelineId(item.job_details.pipeline_id.value),
-                date_created=self.get_timestamp(item.job_details.created),
-                date_started=self.get_timestamp(item.job_details.started),
-                date_stopped=self.get_timestamp(item.job_details.stopped),
-                metadata=item.job_details.metadata
-            )
-
-            yield info
+            if (job_details is None) or (job_details.job_id.value == ''):
+                continue
 
+            job_ids.append(job_details.job_id.value)
+            job_states.append(job_details.state)
+            job_statuses.append(job_details.status)
+            job_priorities.append(job_details.priority)
+            pipeline_ids.append(job_details.pipeline_id.value)
+            created.append(job_details.created.value)
+            started.append(job_details.started.value)
+            stopped.append(job_details.stopped.value)
+
+        # Times are converted per column rather than per job
+        codec = timestamp_codec.JOBS
+
+        return job_types.JobTable(job_ids=job_ids, job_states=job_states, job_statuses=job_statuses,
+                                  job_priorities=job_priorities, pipeline_ids=pipeline_ids,
+                                  created=codec.to_epoch_seconds_many(created),
+                                  started=codec.to_epoch_seconds_many(started),
+                                  stopped=codec.to_epoch_seconds_many(stopped))
 
     def start_job(self, job_id: job_types.JobId, named_values: Mapping[str, str] = None,
                   timeout=None) -> job_types.JobToken:
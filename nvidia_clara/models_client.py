@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from typing import BinaryIO, List, Mapping
 import grpc
 from nvidia_clara.grpc import models_pb2, models_pb2_grpc
-from nvidia_clara.base_client import BaseClient
+from nvidia_clara.base_client import BaseClient, ChannelOptions
 import nvidia_clara.model_types as model_types
+import nvidia_clara.transfer_tools as transfer_tools
 
 
 class ModelsClientStub:
@@ -77,13 +79,16 @@ class ModelsClientStub:
         """
         pass
 
-    def download_model(self, model_id: model_types.ModelId, output_stream: BinaryIO) -> model_types.ModelDetails:
+    def download_model(self, model_id: model_types.ModelId, output_stream: BinaryIO, write_behind: int = None,
+                       progress: transfer_tools.ProgressCallback = None) -> model_types.ModelDetails:
         """
         Downloads the model associated with "model_id" to an "output_stream" BinaryIO object
 
         Args:
             model_id (model_types.ModelId): Unique identifier of the model to download.
             output_stream (BinaryIO): Writable stream use to write the raw model data to.
+            write_behind (int): If specified, number of chunks to queue for writing on a background thread
+            progress (transfer_tools.ProgressCallback): If specified, called with the sampled progress of the download
 
         Returns:
             model_types.ModelDetails with details of the downloaded model.
@@ -195,23 +200,41 @@ class ModelsClientStub:
 
 class ModelsClient(ModelsClientStub, BaseClient):
 
-    def __init__(self, target: str, port: str = None, stub=None):
+    def __init__(self, target: str, port: str = None, stub=None, chunk_size: int = None,
+                 adaptive_chunk_size: bool = False, channel: grpc.Channel = None,
+                 channel_options: ChannelOptions = None):
         """
         Models Client Creation
 
         Args:
             target (str): ipv4 address of clara instance
             port (str): if specified, port will be appended to the target with a ":"
+            chunk_size (int): default size, in bytes, of the data chunk carried by each upload message. If not
+                specified, the value of the "GRPC_CHUNK_SIZE" environment variable or "GrpcChunkSizeDefault" is used
+            adaptive_chunk_size (bool): if True, uploads grow the chunk size until throughput stops improving
+            channel (grpc.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
         """
         if target is None:
             raise Exception("Target must be initialized to a non-null value")
 
+        self._chunk_size = self.get_chunk_size(chunk_size)
+        self._adaptive_chunk_size = adaptive_chunk_size
+
         self._connection = target
 
         if port is not None:
             self._connection += ":" + port
 
-        self._channel = grpc.insecure_channel(self._connection)
+        self._channel_options = channel_options
+
+        if channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+        else:
+            self._channel = channel
+            self._owns_channel = False
 
         if stub is None:
             self._stub = models_pb2_grpc.ModelsStub(self._channel)
@@ -221,16 +244,26 @@ class ModelsClient(ModelsClientStub, BaseClient):
     def close(self):
         """Close connection"""
         if self._channel:
-            self._channel.close()
+            if self._owns_channel:
+                self._channel.close()
             self._channel = None
             self._stub = None
         else:
             print("Connection for client already closed")
 
-    def reconnect(self):
-        """Re-open connection with existing channel"""
+    def reconnect(self, channel_options: ChannelOptions = None):
+        """
+        Re-open connection with existing channel
+
+        Args:
+            channel_options (ChannelOptions): if specified, replaces the options applied to the channel
+        """
+        if channel_options is not None:
+            self._channel_options = channel_options
+
         if self._channel is None:
-            self._channel = grpc.insecure_channel(self._connection)
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
             self._stub = models_pb2_grpc.ModelsStub(self._channel)
         else:
             print("Connection for client already open")
@@ -243,6 +276,50 @@ class ModelsClient(ModelsClientStub, BaseClient):
             self.close()
         return False
 
+    @staticmethod
+    def create_model_details(details: model_types.ModelDetails) -> models_pb2.ModelDetails:
+        """
+        Creates the models_pb2.ModelDetails message sent ahead of the data of an uploaded model
+
+        Args:
+            details (model_types.ModelDetails): details of the model
+
+        Returns:
+            models_pb2.ModelDetails
+        """
+        model_type = details.model_type
+
+        request_details = models_pb2.ModelDetails(
+            model_id=details.model_id.to_grpc_value() if details.model_id is not None else None,
+            name=details.name,
+            type=model_type.value if isinstance(model_type, model_types.ModelType) else model_type
+        )
+
+        if details.metadata is not None:
+            request_details.metadata.update(details.metadata)
+
+        return request_details
+
+    @staticmethod
+    def get_model_details(details: models_pb2.ModelDetails) -> model_types.ModelDetails:
+        """
+        Creates model_types.ModelDetails from the model details of a response
+
+        Args:
+            details (models_pb2.ModelDetails): model details to convert
+
+        Returns:
+            model_types.ModelDetails
+        """
+        model_id = model_types.ModelId(details.model_id.value) if details.model_id.value else None
+
+        return model_types.ModelDetails(
+            model_id=model_id,
+            name=details.name,
+            model_type=model_types.ModelType(details.type),
+            metadata=dict(details.metadata)
+        )
+
     def create_catalog(self, timeout=None) -> model_types.CatalogId:
         """
         Creates a new inference model catalog.
@@ -373,14 +450,19 @@ class ModelsClient(ModelsClientStub, BaseClient):
 
         self.check_response_header(header=response.header)
 
-    def download_model(self, model_id: model_types.ModelId, output_stream: BinaryIO,
-                       timeout=None) -> model_types.ModelDetails:
+    def download_model(self, model_id: model_types.ModelId, output_stream: BinaryIO, write_behind: int = None,
+                       progress: transfer_tools.ProgressCallback = None, timeout=None) -> model_types.ModelDetails:
         """
         Downloads the model associated with "model_id" to an "output_stream" BinaryIO object
 
         Args:
             model_id (model_types.ModelId): Unique identifier of the model to download.
             output_stream (BinaryIO): Writable stream use to write the raw model data to.
+            write_behind (int): If specified, number of chunks to queue for writing on a background thread so
+                receiving the stream overlaps with writing "output_stream"; buffering is capped at
+                "GrpcWriteBehindBytesMaximum" bytes and errors raised by the stream are re-raised
+            progress (transfer_tools.ProgressCallback): If specified, called with the progress of the download, sampled
+                every "TransferProgressIntervalSeconds" and once more on completion
 
         Returns:
             model_types.ModelDetails with details of the downloaded model.
@@ -397,17 +479,32 @@ class ModelsClient(ModelsClientStub, BaseClient):
             model_id=model_id.to_grpc_value()
         )
 
-        responses = self._stub.Download(request, timeout=timeout)
+        responses = self._stub.DownloadModel(request, timeout=timeout)
 
         result = None
+        monitor = None
+        sink = transfer_tools.WriteBehindWriter(output_stream, depth=write_behind) if write_behind else output_stream
 
-        for resp in responses:
-            if result is None:
-                self.check_response_header(header=resp.header)
+        try:
+            for resp in responses:
+                if result is None:
+                    self.check_response_header(header=resp.header)
 
-                result = model_types.ModelDetails(other=resp.details)
+                    result = self.get_model_details(resp.details)
 
-            output_stream.write(resp.data)
+                    if progress is not None:
+                        monitor = transfer_tools.ProgressMonitor(progress, result.name)
+
+                sink.write(resp.data)
+
+                if monitor is not None:
+                    monitor.update(len(resp.data))
+        finally:
+            if write_behind:
+                sink.close()
+
+        if monitor is not None:
+            monitor.finish()
 
         return result
 
@@ -572,35 +669,50 @@ class ModelsClient(ModelsClientStub, BaseClient):
 
         self.check_response_header(header=response.header)
 
-    def upload_request_iterator(self, details: models_pb2.ModelDetails, source_object: BinaryIO = None):
+    def upload_request_iterator(self, details: models_pb2.ModelDetails, source_object: BinaryIO = None,
+                                chunk_size: int = None, adaptive_chunk_size: bool = None,
+                                monitor: transfer_tools.ProgressMonitor = None):
         """
         Helper method for uplaod model that creates generator of requests
 
         Args:
             details (models_pb2.ModelDetails): details of specified model
             source_object (BinaryIO): model source file to read data from
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+            adaptive_chunk_size (bool): If True, grow the chunk size until throughput stops improving; defaults to the
+                client setting
+            monitor (transfer_tools.ProgressMonitor): If specified, counts each chunk read
         """
 
         if source_object is None:
             raise Exception("Source object must be initialized with a non-null BinaryIO instance")
 
-        chunk_size = 64 * 1024
+        chunk_size = self._chunk_size if chunk_size is None else self.get_chunk_size(chunk_size)
+
+        if adaptive_chunk_size is None:
+            adaptive_chunk_size = self._adaptive_chunk_size
+
+        adaptive = transfer_tools.AdaptiveChunkSize(initial_size=chunk_size) if adaptive_chunk_size else None
 
-        while True:
-            data = source_object.read(chunk_size)
+        header = self.get_request_header()
 
-            if not data:
-                return
+        chunks = transfer_tools.read_chunks(source_object, chunk_size=chunk_size, adaptive=adaptive)
 
+        if monitor is not None:
+            chunks = monitor.track(chunks)
+
+        for data in chunks:
             request = models_pb2.ModelsUploadModelRequest(
-                header=self.get_request_header(),
+                header=header,
                 details=details,
                 data=data
             )
 
             yield request
 
-    def upload_model(self, details: model_types.ModelDetails, input_stream: BinaryIO, timeout=None):
+    def upload_model(self, details: model_types.ModelDetails, input_stream: BinaryIO = None, timeout=None,
+                     chunk_size: int = None, adaptive_chunk_size: bool = None, file_path: str = None,
+                     read_ahead: int = None, progress: transfer_tools.ProgressCallback = None):
         """
         Uploads an inference model to the model repository.
 
@@ -609,21 +721,60 @@ class ModelsClient(ModelsClientStub, BaseClient):
         Args:
             details (model_types.ModelDetails): provides details, including the name of the model.
             input_stream (BinaryIO): Raw model data is read from this stream and persisted into storage by the model repository.
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+            adaptive_chunk_size (bool): If True, grow the chunk size until throughput stops improving; defaults to the
+                client setting
+            file_path (str): Alternative to passing in BinaryIO object for upload, and rather passing in path for a file
+            read_ahead (int): If specified, number of chunks to prefetch on a background thread so reading the source
+                overlaps with sending; buffering is capped at "GrpcReadAheadBytesMaximum" bytes
+            progress (transfer_tools.ProgressCallback): If specified, called with the progress of the upload, counting
+                bytes handed to gRPC, sampled every "TransferProgressIntervalSeconds" and once more on completion;
+                called on a gRPC thread
         """
 
         if (self._channel is None) or (self._stub is None):
             raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
 
-        details = models_pb2.ModelDetails(model_id=details.model_id.to_grpc_value(), name=details.name,
-                                          tags=details.tags, model_type=details.model_type)
+        file_path_used = False
 
-        response = self._stub.UploadModel(
-            self.upload_request_iterator(details=details, source_object=input_stream),
-            timeout=timeout
-        )
+        if input_stream is None:
+            if file_path is None:
+                raise Exception("Input stream of model for upload must be initialized with non-null BinaryIO object")
+            else:
+                input_stream = open(file_path, 'rb')
+                file_path_used = True
+
+        monitor = None
+
+        if progress is not None:
+            total_bytes = os.path.getsize(file_path) if file_path_used else None
+            monitor = transfer_tools.ProgressMonitor(progress, details.name, total_bytes=total_bytes)
+
+        details = self.create_model_details(details)
+
+        source_object = input_stream
+
+        if read_ahead:
+            source_object = transfer_tools.ReadAheadReader(input_stream, depth=read_ahead)
+
+        try:
+            response = self._stub.UploadModel(
+                self.upload_request_iterator(details=details, source_object=source_object, chunk_size=chunk_size,
+                                             adaptive_chunk_size=adaptive_chunk_size, monitor=monitor),
+                timeout=timeout
+            )
+        finally:
+            if read_ahead:
+                source_object.close()
+
+            if file_path_used:
+                input_stream.close()
 
         self.check_response_header(header=response.header)
 
+        if monitor is not None:
+            monitor.finish()
+
     def add_metadata(self, model_id: model_types.ModelId, metadata: Mapping[str, str], timeout=None) -> Mapping[
         str, str]:
         """
@@ -0,0 +1,240 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent import futures
+from typing import List, Tuple
+import grpc
+import nvidia_clara.payload_types as payload_types
+import nvidia_clara.transfer_tools as transfer_tools
+
+
+class PayloadRegistry:
+    """
+    File-backed index mapping the content digest of a dataset, a file or a directory tree, to the reusable payload
+    holding a copy of it.
+
+    Datasets registered once are attached to later jobs by payload identifier instead of being uploaded again. Files
+    are hashed on a process pool, and the digest of each file is cached against its size and modification time, so
+    datasets that did not change are not read again.
+    """
+
+    def __init__(self, database_path: str, max_workers: int = None):
+        """
+        Args:
+            database_path (str): Path of the SQLite database holding the registry; created if it does not exist
+            max_workers (int): Number of processes hashing files; defaults to the number of processors
+        """
+        if database_path is None:
+            raise Exception("Database path must be initialized to a non-null value")
+
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS payloads (digest TEXT PRIMARY KEY, payload_id TEXT NOT NULL, "
+                "registered REAL NOT NULL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_digests (path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "modified INTEGER NOT NULL, digest TEXT NOT NULL)")
+
+    @staticmethod
+    def list_dataset(dataset_path: str) -> List[Tuple[str, str]]:
+        """
+        Lists the files of a dataset
+
+        Args:
+            dataset_path (str): Path of a file or a directory
+
+        Returns:
+            List of (relative path, path) tuples, sorted by relative path; the relative path uses "/" as separator and
+            is the file name for a single file
+        """
+        if os.path.isfile(dataset_path):
+            return [(os.path.basename(dataset_path), dataset_path)]
+
+        if not os.path.isdir(dataset_path):
+            raise Exception("Dataset path must be the path of an existing file or directory, found: " +
+                            str(dataset_path))
+
+        files = []
+
+        for root, dirs, file_names in os.walk(dataset_path):
+            for file_name in file_names:
+                file_path = os.path.join(root, file_name)
+                files.append((os.path.relpath(file_path, dataset_path).replace(os.sep, "/"), file_path))
+
+        return sorted(files)
+
+    def hash_dataset(self, dataset_path: str) -> str:
+        """
+        Computes the digest of a dataset
+
+        The digest covers the relative path, size and content of every file, so renaming, adding or changing any file
+        changes it. Files whose size and modification time match the cache are not read again.
+
+        Args:
+            dataset_path (str): Path of a file or a directory
+
+        Returns:
+            Hexadecimal SHA-256 digest of the dataset
+        """
+        files = self.list_dataset(dataset_path)
+
+        stats = {}
+        digests = {}
+
+        with self._lock:
+            for relative_path, file_path in files:
+                stat = os.stat(file_path)
+                absolute_path = os.path.abspath(file_path)
+                stats[file_path] = (absolute_path, stat.st_size, stat.st_mtime_ns)
+
+                row = self._connection.execute(
+                    "SELECT digest FROM file_digests WHERE path = ? AND size = ? AND modified = ?",
+                    stats[file_path]).fetchone()
+
+                if row is not None:
+                    digests[file_path] = row[0]
+
+        pending = [file_path for relative_path, file_path in files if file_path not in digests]
+
+        if len(pending) == 1:
+            digests[pending[0]] = transfer_tools.hash_file(pending[0])
+        elif len(pending) > 1:
+            with futures.ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                for file_path, digest in zip(pending, executor.map(transfer_tools.hash_file, pending)):
+                    digests[file_path] = digest
+
+        if len(pending) > 0:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO file_digests (path, size, modified, digest) VALUES (?, ?, ?, ?)",
+                    [stats[file_path] + (digests[file_path],) for file_path in pending])
+
+        dataset_digest = hashlib.sha256()
+
+        for relative_path, file_path in files:
+            dataset_digest.update(relative_path.encode('utf-8') + b'\0')
+            dataset_digest.update(str(stats[file_path][1]).encode('utf-8') + b'\0')
+            dataset_digest.update(digests[file_path].encode('utf-8') + b'\0')
+
+        return dataset_digest.hexdigest()
+
+    def lookup(self, digest: str) -> payload_types.PayloadId:
+        """
+        Returns the payload registered for a dataset digest
+
+        Args:
+            digest (str): Digest of the dataset, as computed by "hash_dataset"
+
+        Returns:
+            payload_types.PayloadId of the registered payload, or None if the digest is not registered
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT payload_id FROM payloads WHERE digest = ?", (digest,)).fetchone()
+
+        return None if row is None else payload_types.PayloadId(row[0])
+
+    def register(self, digest: str, payload_id: payload_types.PayloadId):
+        """
+        Registers the payload holding a dataset, replacing any payload registered for the same digest
+
+        Args:
+            digest (str): Digest of the dataset, as computed by "hash_dataset"
+            payload_id (payload_types.PayloadId): Unique identifier of the reusable payload holding the dataset
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO payloads (digest, payload_id, registered) VALUES (?, ?, ?)",
+                (digest, payload_id.value, time.time()))
+
+    def unregister(self, digest: str):
+        """
+        Removes the payload registered for a dataset digest, if any
+
+        Args:
+            digest (str): Digest of the dataset, as computed by "hash_dataset"
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM payloads WHERE digest = ?", (digest,))
+
+    def get_or_upload(self, payloads_client, dataset_path: str, verify: bool = True,
+                      parallel_streams: int = None) -> payload_types.PayloadId:
+        """
+        Returns the reusable payload holding a dataset, uploading the dataset to a new payload if none is registered
+
+        Args:
+            payloads_client (PayloadsClient): Client used to verify, create and upload payloads
+            dataset_path (str): Path of a file or a directory
+            verify (bool): If True, a registered payload is checked to still exist on the server, by receiving the
+                first file of its details, before it is reused; payloads the server reports as not found are
+                unregistered and the dataset is uploaded again, other errors are raised
+            parallel_streams (int): Number of concurrent upload streams
+
+        Returns:
+            payload_types.PayloadId of the payload holding the dataset, to be passed as an input payload of a job
+        """
+        digest = self.hash_dataset(dataset_path)
+        payload_id = self.lookup(digest)
+
+        if payload_id is not None:
+            if not verify:
+                return payload_id
+
+            try:
+                next(iter(payloads_client.iter_details(payload_id=payload_id)), None)
+                return payload_id
+            except grpc.RpcError as error:
+                if error.code() != grpc.StatusCode.NOT_FOUND:
+                    raise
+
+            self.unregister(digest)
+
+        files = {relative_path: file_path for relative_path, file_path in self.list_dataset(dataset_path)}
+
+        payload_id = payloads_client.create_payload().payload_id
+
+        try:
+            payloads_client.upload_many(payload_id=payload_id, files=files, parallel_streams=parallel_streams)
+        except Exception:
+            # The payload is not registered, it would otherwise be left partially uploaded on the server
+            payloads_client.delete_payload(payload_id)
+            raise
+
+        self.register(digest, payload_id)
+
+        return payload_id
+
+    def close(self):
+        """
+        Close the registry database
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -196,3 +196,122 @@ class PayloadDetails:
         Metadata (set of key/value pairs) associated with the payload
         """
         self._metadata = metadata
+
+
+class PayloadTransferStats:
+
+    def __init__(self, file_details: List[PayloadFileDetails] = None, total_bytes: int = 0,
+                 elapsed_seconds: float = 0.0, parallel_streams: int = 1):
+        """
+        Args:
+            file_details(List[PayloadFileDetails]): Details of each blob transferred
+            total_bytes(int): Number of bytes transferred across all blobs
+            elapsed_seconds(float): Wall time, in seconds, taken by the transfer
+            parallel_streams(int): Number of concurrent streams used for the transfer
+        """
+        if file_details is None:
+            file_details = []
+
+        self._file_details = file_details
+        self._total_bytes = total_bytes
+        self._elapsed_seconds = elapsed_seconds
+        self._parallel_streams = parallel_streams
+
+    @property
+    def file_details(self) -> List[PayloadFileDetails]:
+        """Details of each blob transferred, in the order the blobs were requested."""
+        return self._file_details
+
+    @file_details.setter
+    def file_details(self, file_details: List[PayloadFileDetails]):
+        """Details of each blob transferred, in the order the blobs were requested."""
+        self._file_details = file_details
+
+    @property
+    def total_bytes(self) -> int:
+        """Number of bytes transferred across all blobs."""
+        return self._total_bytes
+
+    @total_bytes.setter
+    def total_bytes(self, total_bytes: int):
+        """Number of bytes transferred across all blobs."""
+        self._total_bytes = total_bytes
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Wall time, in seconds, taken by the transfer."""
+        return self._elapsed_seconds
+
+    @elapsed_seconds.setter
+    def elapsed_seconds(self, elapsed_seconds: float):
+        """Wall time, in seconds, taken by the transfer."""
+        self._elapsed_seconds = elapsed_seconds
+
+    @property
+    def parallel_streams(self) -> int:
+        """Number of concurrent streams used for the transfer."""
+        return self._parallel_streams
+
+    @parallel_streams.setter
+    def parallel_streams(self, parallel_streams: int):
+        """Number of concurrent streams used for the transfer."""
+        self._parallel_streams = parallel_streams
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Aggregate throughput of the transfer, in bytes per second."""
+        if self._elapsed_seconds <= 0:
+            return 0.0
+        return self._total_bytes / self._elapsed_seconds
+
+
+class PayloadSyncResult:
+
+    def __init__(self, uploaded: PayloadTransferStats = None, removed: List[str] = None,
+                 unchanged: List[str] = None):
+        """
+        Args:
+            uploaded(PayloadTransferStats): Transfer details of the blobs uploaded because they were new or changed
+            removed(List[str]): Names of the blobs removed because their local file no longer exists
+            unchanged(List[str]): Names of the blobs left as they were
+        """
+        if uploaded is None:
+            uploaded = PayloadTransferStats()
+        if removed is None:
+            removed = []
+        if unchanged is None:
+            unchanged = []
+
+        self._uploaded = uploaded
+        self._removed = removed
+        self._unchanged = unchanged
+
+    @property
+    def uploaded(self) -> PayloadTransferStats:
+        """Transfer details of the blobs uploaded because they were new or changed."""
+        return self._uploaded
+
+    @uploaded.setter
+    def uploaded(self, uploaded: PayloadTransferStats):
+        """Transfer details of the blobs uploaded because they were new or changed."""
+        self._uploaded = uploaded
+
+    @property
+    def removed(self) -> List[str]:
+        """Names of the blobs removed because their local file no longer exists."""
+        return self._removed
+
+    @removed.setter
+    def removed(self, removed: List[str]):
+        """Names of the blobs removed because their local file no longer exists."""
+        self._removed = removed
+
+    @property
+    def unchanged(self) -> List[str]:
+        """Names of the blobs left as they were."""
+        return self._unchanged
+
+    @unchanged.setter
+    def unchanged(self, unchanged: List[str]):
+        """Names of the blobs left as they were."""
+        self._unchanged = unchanged
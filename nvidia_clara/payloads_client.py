@@ -12,11 +12,90 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import fnmatch
+import hashlib
+import os
+import posixpath
+import time
+from concurrent import futures
 import grpc
-from typing import BinaryIO, Mapping, List
+from typing import BinaryIO, Iterable, Iterator, Mapping, List
 from nvidia_clara.grpc import payloads_pb2, payloads_pb2_grpc
-from nvidia_clara.base_client import BaseClient
+from nvidia_clara.base_client import BaseClient, ChannelOptions
+import nvidia_clara.constants as constants
 import nvidia_clara.payload_types as payload_types
+import nvidia_clara.transfer_tools as transfer_tools
+
+
+class PayloadDetailsIterator:
+    """
+    Iterator over the file details of a payload, yielding each payload_types.PayloadFileDetails as its message of the
+    "Details" stream is received, rather than once the whole stream has been received.
+
+    Payload level details (identifier, type and metadata) are carried by the first message of the stream; reading any
+    of them before iterating receives the first message, whose file is still yielded by the iterator. They are None if
+    the stream is empty.
+    """
+
+    def __init__(self, responses, check_response_header):
+        """
+        Args:
+            responses: Iterator of payloads_pb2.PayloadsDetailsResponse messages, as returned by the "Details" call
+            check_response_header: Callable checking the header of the first message
+        """
+        self._responses = iter(responses)
+        self._check_response_header = check_response_header
+        self._first = None
+        self._first_pending = False
+        self._received = False
+
+    def _receive_first(self):
+        if not self._received:
+            self._received = True
+
+            first = next(self._responses, None)
+
+            if first is not None:
+                self._check_response_header(header=first.header)
+                self._first = first
+                self._first_pending = True
+
+        return self._first
+
+    @property
+    def payload_id(self) -> payload_types.PayloadId:
+        """Unique identifier of the payload."""
+        first = self._receive_first()
+        return None if first is None else payload_types.PayloadId(first.payload_id.value)
+
+    @property
+    def payload_type(self) -> payloads_pb2.PayloadType:
+        """Type of the payload."""
+        first = self._receive_first()
+        return None if first is None else first.type
+
+    @property
+    def metadata(self) -> Mapping[str, str]:
+        """Metadata (set of key/value pairs) associated with the payload."""
+        first = self._receive_first()
+        return None if first is None else first.metadata
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> payload_types.PayloadFileDetails:
+        if self._first_pending or not self._received:
+            self._receive_first()
+
+            if self._first is None:
+                raise StopIteration
+
+            self._first_pending = False
+            item = self._first
+        else:
+            item = next(self._responses)
+
+        return PayloadsClient.get_file_details(item.file)
 
 
 class PayloadsClientStub:
@@ -54,8 +133,22 @@ class PayloadsClientStub:
         """
         pass
 
-    def download_from(self, payload_id: payload_types.PayloadId, blob_name: str,
-                      dest_obj: BinaryIO) -> payload_types.PayloadFileDetails:
+    def iter_details(self, payload_id: payload_types.PayloadId) -> PayloadDetailsIterator:
+        """
+        Requests the details of a payload, identified by "payload_id" from Clara, yielding the details of each file as
+        they are received.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+        Returns:
+            A PayloadDetailsIterator of payload_types.PayloadFileDetails, which also exposes the payload level details
+        """
+        pass
+
+    def download_from(self, payload_id: payload_types.PayloadId, blob_name: str, dest_obj: BinaryIO = None,
+                      dest_path: str = None, memory_map: bool = False, write_behind: int = None,
+                      checkpoint_path: str = None,
+                      progress: transfer_tools.ProgressCallback = None) -> payload_types.PayloadFileDetails:
         """
         Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara.
 
@@ -65,6 +158,79 @@ class PayloadsClientStub:
             payload_id (payload_types.PayloadId): Unique identifier of the payload.
             blob_name (str): The name, or path, of the blob in the payload.
             dest_obj (BinaryIO): Target stream object to write to
+            dest_path (str): Alternative to passing in BinaryIO object to download to, and rather passing in path for a file
+            memory_map (bool): If True, "dest_path" is preallocated to the size of the blob and written through a memory
+                map
+            write_behind (int): If specified, number of chunks to queue for writing on a background thread
+            checkpoint_path (str): If specified, path of a local checkpoint recording the progress of the download, so
+                an interrupted download of "dest_path" is resumed by a later call
+            progress (transfer_tools.ProgressCallback): If specified, called with the sampled progress of the download
+        """
+        pass
+
+    def download_resumable(self, payload_id: payload_types.PayloadId, blob_name: str, dest_path: str,
+                           checkpoint: transfer_tools.TransferCheckpoint) -> payload_types.PayloadFileDetails:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara, to
+        "dest_path", resuming from the progress recorded in "checkpoint".
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            dest_path (str): Path of the file to download to
+            checkpoint (transfer_tools.TransferCheckpoint): Checkpoint recording the progress of the download
+
+        Returns:
+            payload_types.PayloadFileDetails of the downloaded blob
+        """
+        pass
+
+    def download_all(self, payload_id: payload_types.PayloadId, dest_dir: str, include: str = None,
+                     parallelism: int = None, checkpoint_path: str = None) -> payload_types.PayloadTransferStats:
+        """
+        Downloads the blobs of a payload, identified by "payload_id", into "dest_dir" over concurrent download streams,
+        preserving the path layout of the blobs in the payload.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            dest_dir (str): Local directory to download to.
+            include (str): If specified, glob pattern a blob path, relative to the payload root, must match to be
+                downloaded (ex. "operators/*")
+            parallelism (int): Number of concurrent download streams.
+            checkpoint_path (str): If specified, path of a local checkpoint recording the progress of each download, so
+                an interrupted call is resumed by a later one
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each downloaded blob and aggregate throughput
+        """
+        pass
+
+    def iter_download(self, payload_id: payload_types.PayloadId, blob_name: str) -> Iterator[memoryview]:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara,
+        yielding the data of the blob in chunks as they are received.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+
+        Returns:
+            Iterator of memoryview chunks of the blob
+        """
+        pass
+
+    def download_into(self, payload_id: payload_types.PayloadId, blob_name: str, buffer=None) -> memoryview:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara, into a
+        preallocated writable buffer.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            buffer: Writable, contiguous buffer (ex. bytearray or numpy array) at least the size of the blob
+
+        Returns:
+            memoryview of the bytes of "buffer" holding the blob
         """
         pass
 
@@ -78,8 +244,9 @@ class PayloadsClientStub:
         """
         pass
 
-    def upload(self, payload_id: payload_types.PayloadId, blob_name: str,
-               file_object: BinaryIO = None) -> payload_types.PayloadFileDetails:
+    def upload(self, payload_id: payload_types.PayloadId, blob_name: str, file_object: BinaryIO = None,
+               compression: grpc.Compression = None, compression_threshold: int = None,
+               progress: transfer_tools.ProgressCallback = None) -> payload_types.PayloadFileDetails:
         """
         Uploads a blob from "file_object", to a Clara Payload identified by "payload_id".
 
@@ -89,6 +256,90 @@ class PayloadsClientStub:
             payload_id (payload_types.PayloadId): Unique identifier of the payload.
             blob_name (str): The name, or path, of the blob in the payload.
             file_object (BinaryIO): stream to read from and upload
+            compression (grpc.Compression): If specified, compression algorithm of the upload stream; downloads are
+                compressed at the discretion of the server
+            compression_threshold (int): Minimum size, in bytes, of a compressed blob; defaults to
+                "GrpcCompressionThresholdDefault"
+            progress (transfer_tools.ProgressCallback): If specified, called with the sampled progress of the upload
+        """
+        pass
+
+    def upload_stream(self, payload_id: payload_types.PayloadId, blob_name: str,
+                      chunks: Iterable) -> payload_types.PayloadFileDetails:
+        """
+        Uploads a blob from "chunks", data produced in memory, to a Clara Payload identified by "payload_id", without
+        writing it to a file first.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            chunks (Iterable): Iterable of bytes-like objects of any size, re-chunked to the configured chunk size
+
+        Returns:
+            payload_types.PayloadFileDetails of the uploaded blob
+        """
+        pass
+
+    def upload_many(self, payload_id: payload_types.PayloadId, files: Mapping[str, str],
+                    parallel_streams: int = None, checkpoint_path: str = None, compression: grpc.Compression = None,
+                    compression_threshold: int = None) -> payload_types.PayloadTransferStats:
+        """
+        Uploads a set of local files to a Clara Payload identified by "payload_id" over concurrent upload streams.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            files (Mapping[str, str]): Mapping of blob names, within the payload, to paths of the local files to upload.
+            parallel_streams (int): Number of concurrent upload streams.
+            checkpoint_path (str): If specified, path of a local checkpoint recording the uploaded blobs; blobs already
+                in the payload with the size of their file are skipped, so an interrupted call is resumed by a later one
+            compression (grpc.Compression): If specified, compression algorithm of the upload stream; downloads are
+                compressed at the discretion of the server
+            compression_threshold (int): Minimum size, in bytes, of a compressed blob; defaults to
+                "GrpcCompressionThresholdDefault"
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each uploaded blob and aggregate throughput
+        """
+        pass
+
+    def upload_directory(self, payload_id: payload_types.PayloadId, source_dir: str, blob_prefix: str = "",
+                         parallel_streams: int = None, checkpoint_path: str = None,
+                         compression: grpc.Compression = None,
+                         compression_threshold: int = None) -> payload_types.PayloadTransferStats:
+        """
+        Uploads every file under "source_dir" to a Clara Payload identified by "payload_id".
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            source_dir (str): Local directory to upload.
+            blob_prefix (str): Prefix prepended to the relative path of each file to form its blob name.
+            parallel_streams (int): Number of concurrent upload streams.
+            checkpoint_path (str): If specified, path of a local checkpoint recording the uploaded blobs
+            compression (grpc.Compression): If specified, compression algorithm of the upload stream; downloads are
+                compressed at the discretion of the server
+            compression_threshold (int): Minimum size, in bytes, of a compressed blob; defaults to
+                "GrpcCompressionThresholdDefault"
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each uploaded blob and aggregate throughput
+        """
+        pass
+
+    def sync_directory(self, payload_id: payload_types.PayloadId, local_dir: str, blob_prefix: str = "",
+                       content_hash: bool = False, parallel_streams: int = None) -> payload_types.PayloadSyncResult:
+        """
+        Makes the blobs of a Clara Payload identified by "payload_id" mirror the files under "local_dir", uploading only
+        new or changed files and removing blobs whose local file no longer exists.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            local_dir (str): Local directory to mirror.
+            blob_prefix (str): Prefix prepended to the relative path of each file to form its blob name.
+            content_hash (bool): If True, files are also compared by a content hash kept in the payload metadata.
+            parallel_streams (int): Number of concurrent upload streams.
+
+        Returns:
+            A payload_types.PayloadSyncResult with the uploaded, removed and unchanged blobs
         """
         pass
 
@@ -125,23 +376,41 @@ class PayloadsClientStub:
 
 
 class PayloadsClient(BaseClient, PayloadsClientStub):
-    def __init__(self, target: str, port: str = None, stub=None):
+    def __init__(self, target: str, port: str = None, stub=None, chunk_size: int = None,
+                 adaptive_chunk_size: bool = False, channel: grpc.Channel = None,
+                 channel_options: ChannelOptions = None):
         """
         Payloads Client Creation
 
         Args:
             target (str): ipv4 address of clara instance
             port (str): if specified, port will be appended to the target with a ":"
+            chunk_size (int): default size, in bytes, of the data chunk carried by each upload message. If not
+                specified, the value of the "GRPC_CHUNK_SIZE" environment variable or "GrpcChunkSizeDefault" is used
+            adaptive_chunk_size (bool): if True, uploads grow the chunk size until throughput stops improving
+            channel (grpc.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
         """
         if target is None:
             raise Exception("Target must be initialized to a non-null value")
 
+        self._chunk_size = self.get_chunk_size(chunk_size)
+        self._adaptive_chunk_size = adaptive_chunk_size
+
         self._connection = target
 
         if port is not None:
             self._connection += ":" + port
 
-        self._channel = grpc.insecure_channel(self._connection)
+        self._channel_options = channel_options
+
+        if channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+        else:
+            self._channel = channel
+            self._owns_channel = False
 
         if stub is None:
             self._stub = payloads_pb2_grpc.PayloadsStub(self._channel)
@@ -153,17 +422,25 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
         Close connection
         """
         if self._channel:
-            self._channel.close()
+            if self._owns_channel:
+                self._channel.close()
             self._channel = None
         else:
             print("Connection for client already closed")
 
-    def reconnect(self):
+    def reconnect(self, channel_options: ChannelOptions = None):
         """
         Re-open connection with existing channel
+
+        Args:
+            channel_options (ChannelOptions): if specified, replaces the options applied to the channel
         """
+        if channel_options is not None:
+            self._channel_options = channel_options
+
         if self._channel is None:
-            self._channel = grpc.insecure_channel(self._connection)
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
             self._stub = payloads_pb2_grpc.PayloadsStub(self._channel)
         else:
             print("Connection for client already open")
@@ -176,6 +453,53 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
             self.close()
         return False
 
+    @staticmethod
+    def get_file_details(details: payloads_pb2.PayloadFileDetails) -> payload_types.PayloadFileDetails:
+        """
+        Creates payload_types.PayloadFileDetails from the file details of a response
+
+        Args:
+            details (payloads_pb2.PayloadFileDetails): file details to convert
+
+        Returns:
+            payload_types.PayloadFileDetails
+        """
+        return payload_types.PayloadFileDetails(
+            mode=details.mode,
+            name=details.name,
+            size=details.size
+        )
+
+    @staticmethod
+    def get_payload_details(responses: List[payloads_pb2.PayloadsDetailsResponse]) -> payload_types.PayloadDetails:
+        """
+        Creates payload_types.PayloadDetails from the responses of a details call
+
+        Args:
+            responses (List[payloads_pb2.PayloadsDetailsResponse]): responses to convert, one per file
+
+        Returns:
+            payload_types.PayloadDetails, or None if "responses" is empty
+        """
+        if len(responses) == 0:
+            return None
+
+        file_details = []
+
+        for item in responses:
+
+            if item.file is None:
+                continue
+
+            file_details.append(PayloadsClient.get_file_details(item.file))
+
+        return payload_types.PayloadDetails(
+            payload_id=payload_types.PayloadId(responses[0].payload_id.value),
+            file_details=file_details,
+            payload_type=responses[0].type,
+            metadata=responses[0].metadata
+        )
+
     def create_payload(self, metadata: Mapping[str, str] = None, timeout=None) -> payload_types.PayloadDetails:
         """
         Creates a static payload.
@@ -239,6 +563,35 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
         Returns:
             A payload_types.PayloadDetails instance containing payload details
         """
+        details = self.iter_details(payload_id=payload_id, timeout=timeout)
+
+        file_details = list(details)
+
+        if details.payload_id is None:
+            return None
+
+        result = payload_types.PayloadDetails(
+            payload_id=details.payload_id,
+            file_details=file_details,
+            payload_type=details.payload_type,
+            metadata=details.metadata
+        )
+
+        return result
+
+    def iter_details(self, payload_id: payload_types.PayloadId, timeout=None) -> PayloadDetailsIterator:
+        """
+        Requests the details of a payload, identified by "payload_id" from Clara, yielding the details of each file as
+        they are received.
+
+        Unlike "get_details", no file details are buffered, so iterating over payloads with many files starts
+        immediately and uses constant memory.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+        Returns:
+            A PayloadDetailsIterator of payload_types.PayloadFileDetails, which also exposes the payload level details
+        """
 
         if (self._channel is None) or (self._stub is None):
             raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
@@ -253,40 +606,12 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
 
         response = self._stub.Details(request, timeout=timeout)
 
-        responses = [resp for resp in response]
-
-        if len(responses) > 0:
-
-            self.check_response_header(header=responses[0].header)
-
-            file_details = []
-
-            for item in responses:
-
-                if item.file is None:
-                    continue
-
-                detail = payload_types.PayloadFileDetails(
-                    mode=item.file.mode,
-                    name=item.file.name,
-                    size=item.file.size
-                )
-
-                file_details.append(detail)
-
-            result = payload_types.PayloadDetails(
-                payload_id=payload_types.PayloadId(responses[0].payload_id.value),
-                file_details=file_details,
-                payload_type=responses[0].type,
-                metadata=responses[0].metadata
-            )
-
-            return result
-
-        return None
+        return PayloadDetailsIterator(response, self.check_response_header)
 
     def download_from(self, payload_id: payload_types.PayloadId, blob_name: str, dest_obj: BinaryIO = None,
-                      dest_path: str = None, timeout=None) -> payload_types.PayloadFileDetails:
+                      dest_path: str = None, memory_map: bool = False, write_behind: int = None,
+                      checkpoint_path: str = None, progress: transfer_tools.ProgressCallback = None,
+                      timeout=None) -> payload_types.PayloadFileDetails:
         """
         Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara.
 
@@ -297,6 +622,17 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
             blob_name (str): The name, or path, of the blob in the payload.
             dest_obj (BinaryIO): Target stream object to write to with write privileges
             dest_path (str): Alternative to passing in BinaryIO object to download to, and rather passing in path for a file
+            memory_map (bool): If True, "dest_path" is preallocated to the size of the blob, given by the first message,
+                and written through a memory map rather than grown write by write; the size of the downloaded data is
+                verified against the size of the blob
+            write_behind (int): If specified, number of chunks to queue for writing on a background thread so
+                receiving the stream overlaps with writing the destination; buffering is capped at
+                "GrpcWriteBehindBytesMaximum" bytes and errors raised by the destination are re-raised
+            checkpoint_path (str): If specified, path of a local checkpoint recording the progress of the download, so
+                an interrupted download of "dest_path" is resumed by a later call, see "download_resumable"; cannot be
+                combined with "dest_obj", "memory_map" or "write_behind"
+            progress (transfer_tools.ProgressCallback): If specified, called with the progress of the download, sampled
+                every "TransferProgressIntervalSeconds" and once more on completion
         """
 
         if (self._channel is None) or (self._stub is None):
@@ -308,14 +644,25 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
         if (blob_name is None) or (blob_name == ""):
             raise Exception("Name of source blob must be initialized with non-null string")
 
+        if checkpoint_path is not None:
+            if (dest_path is None) or (dest_obj is not None) or memory_map or write_behind:
+                raise Exception("Resumable downloads require a destination path, without memory map or write behind")
+
+            checkpoint = transfer_tools.TransferCheckpoint(checkpoint_path, payload_id.value)
+
+            return self.download_resumable(payload_id=payload_id, blob_name=blob_name, dest_path=dest_path,
+                                           checkpoint=checkpoint, progress=progress, timeout=timeout)
+
         file_path_used = False
 
         if dest_obj is None:
             if dest_path is None:
                 raise Exception("Destination object for upload must be initialized with non-null BinaryIO object")
-            else:
+            elif not memory_map:
                 dest_obj = open(dest_path, 'wb')
                 file_path_used = True
+        elif memory_map:
+            raise Exception("Memory mapped downloads require a destination path rather than a BinaryIO object")
 
         request = payloads_pb2.PayloadsDownloadRequest(
             header=self.get_request_header(),
@@ -326,23 +673,400 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
         responses = self._stub.Download(request, timeout=timeout)
 
         result = None
+        sink = None
+        monitor = None
+        completed = False
+
+        try:
+            for resp in responses:
+                if result is None:
+                    self.check_response_header(header=resp.header)
+
+                    result = self.get_file_details(resp.details)
+
+                    if progress is not None:
+                        monitor = transfer_tools.ProgressMonitor(progress, blob_name, total_bytes=result.size)
+
+                    if memory_map:
+                        dest_obj = transfer_tools.MappedFileWriter(dest_path, result.size)
+                        file_path_used = True
+
+                    sink = transfer_tools.WriteBehindWriter(dest_obj, depth=write_behind) if write_behind else dest_obj
+
+                sink.write(resp.data)
+
+                if monitor is not None:
+                    monitor.update(len(resp.data))
+
+            if write_behind and (sink is not None):
+                sink.close()
+
+            if memory_map:
+                if dest_obj is None:
+                    # Empty stream, leave an empty file as buffered downloads do
+                    open(dest_path, 'wb').close()
+                elif dest_obj.position != result.size:
+                    raise Exception("Received " + str(dest_obj.position) + " of the " + str(result.size) +
+                                    " bytes of blob " + blob_name)
+
+            completed = True
+        finally:
+            if write_behind and (sink is not None):
+                sink.close()
+
+            if file_path_used:
+                dest_obj.close()
+
+            if memory_map and file_path_used and not completed:
+                # The preallocated file would otherwise pass for a blob of the right size
+                os.remove(dest_path)
+
+        if monitor is not None:
+            monitor.finish()
+
+        return result
+
+    def download_resumable(self, payload_id: payload_types.PayloadId, blob_name: str, dest_path: str,
+                           checkpoint: transfer_tools.TransferCheckpoint,
+                           progress: transfer_tools.ProgressCallback = None,
+                           timeout=None) -> payload_types.PayloadFileDetails:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara, to
+        "dest_path", resuming from the progress recorded in "checkpoint".
+
+        Written bytes are flushed to disk and confirmed in the checkpoint every "TransferCheckpointBytesInterval" bytes,
+        and when the stream ends or fails. A blob recorded as complete, whose file still has its size, is not downloaded
+        again. A partially downloaded file is kept up to its confirmed bytes and only the remainder is written; since
+        download requests carry no offset, the stream still starts from the beginning of the blob, and the confirmed
+        bytes are received again but not rewritten. A blob whose size changed since the checkpoint is downloaded again
+        from its start.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            dest_path (str): Path of the file to download to
+            checkpoint (transfer_tools.TransferCheckpoint): Checkpoint recording the progress of the download
+            progress (transfer_tools.ProgressCallback): If specified, called with the progress of the download, counting
+                bytes received again, sampled every "TransferProgressIntervalSeconds" and once more on completion
+
+        Returns:
+            payload_types.PayloadFileDetails of the downloaded blob
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        recorded = checkpoint.get(blob_name)
+        local_size = os.path.getsize(dest_path) if os.path.exists(dest_path) else -1
+        offset = 0
+
+        if (recorded is not None) and (local_size >= recorded['confirmed']):
+            if (recorded['confirmed'] == recorded['size']) and (local_size == recorded['size']):
+                result = payload_types.PayloadFileDetails(mode=recorded['mode'], name=recorded['name'],
+                                                          size=recorded['size'])
+                return result
+
+            offset = recorded['confirmed']
+
+        request = payloads_pb2.PayloadsDownloadRequest(
+            header=self.get_request_header(),
+            name=blob_name,
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        responses = self._stub.Download(request, timeout=timeout)
+
+        result = None
+        monitor = None
+        position = 0
+        confirmed = offset
+
+        with open(dest_path, 'r+b' if offset > 0 else 'wb') as dest_obj:
+            dest_obj.truncate(offset)
+            dest_obj.seek(offset)
+
+            def confirm():
+                dest_obj.flush()
+                os.fsync(dest_obj.fileno())
+                checkpoint.confirm(blob_name, result.name, result.size, result.mode, max(position, offset))
+
+            try:
+                for resp in responses:
+                    if result is None:
+                        self.check_response_header(header=resp.header)
+
+                        result = self.get_file_details(resp.details)
+
+                        if progress is not None:
+                            monitor = transfer_tools.ProgressMonitor(progress, blob_name, total_bytes=result.size)
+
+                        if (recorded is not None) and (result.size != recorded['size']):
+                            offset = 0
+                            confirmed = 0
+                            dest_obj.seek(0)
+                            dest_obj.truncate(0)
+
+                    data = resp.data
+                    end = position + len(data)
+
+                    if end > offset:
+                        dest_obj.write(memoryview(data)[max(offset - position, 0):])
+
+                    position = end
+
+                    if monitor is not None:
+                        monitor.update(len(data))
+
+                    if position - confirmed >= constants.TransferCheckpointBytesInterval:
+                        confirm()
+                        confirmed = position
+            finally:
+                if result is not None:
+                    confirm()
+
+        if (result is not None) and (max(position, offset) != result.size):
+            raise Exception("Received " + str(max(position, offset)) + " of the " + str(result.size) +
+                            " bytes of blob " + blob_name)
+
+        if monitor is not None:
+            monitor.finish()
+
+        return result
+
+    @staticmethod
+    def get_relative_path(blob_name: str) -> str:
+        """
+        Returns the path of a blob relative to the root of its payload, using "/" as separator
+
+        Args:
+            blob_name (str): The name, or path, of the blob in the payload (ex. "/operators/reader/image.raw")
+
+        Returns:
+            Normalized relative path of the blob (ex. "operators/reader/image.raw")
+        """
+        relative_path = posixpath.normpath("/" + blob_name.replace("\\", "/")).lstrip("/")
+
+        if relative_path in ("", "."):
+            raise Exception("Blob name does not name a file within the payload, found: " + str(blob_name))
+
+        return relative_path
+
+    @staticmethod
+    def get_blob_name(listed_name: str) -> str:
+        """
+        Returns the name by which a blob listed by "get_details" is addressed in download and remove requests
+
+        Payload listings name blobs from the payload root ("/operators/..."), requests take them relative to it
+        ("./operators/...").
+
+        Args:
+            listed_name (str): Name of the blob as listed by "get_details" or "iter_details"
+
+        Returns:
+            Name of the blob to use in requests
+        """
+        return "." + listed_name if listed_name.startswith("/") else listed_name
+
+    def download_all(self, payload_id: payload_types.PayloadId, dest_dir: str, include: str = None,
+                     parallelism: int = None, checkpoint_path: str = None,
+                     timeout=None) -> payload_types.PayloadTransferStats:
+        """
+        Downloads the blobs of a payload, identified by "payload_id", into "dest_dir" over concurrent download streams,
+        preserving the path layout of the blobs in the payload.
+
+        Blobs are listed with "iter_details", and each blob's download is started as soon as it is listed, so listing
+        overlaps with downloading; at most "parallelism" download streams are in flight at once.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            dest_dir (str): Local directory to download to; created if it does not exist.
+            include (str): If specified, glob pattern a blob path, relative to the payload root, must match to be
+                downloaded (ex. "operators/*")
+            parallelism (int): Number of concurrent download streams. If not specified, the value of the
+                "GRPC_PARALLEL_STREAMS" environment variable or "GrpcParallelStreamsDefault" is used.
+            checkpoint_path (str): If specified, path of a local checkpoint recording the progress of each download, so
+                an interrupted call is resumed by a later one; complete blobs are skipped and partially downloaded ones
+                are resumed, see "download_resumable"
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each downloaded blob and aggregate throughput
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if dest_dir is None:
+            raise Exception("Destination directory must be initialized with non-null string")
+
+        parallelism = self.get_parallel_streams(parallelism)
+
+        checkpoint = None
+
+        if checkpoint_path is not None:
+            checkpoint = transfer_tools.TransferCheckpoint(checkpoint_path, payload_id.value)
+
+        def download_file(blob_name: str, dest_path: str) -> payload_types.PayloadFileDetails:
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+
+            if checkpoint is not None:
+                return self.download_resumable(payload_id=payload_id, blob_name=blob_name, dest_path=dest_path,
+                                               checkpoint=checkpoint, timeout=timeout)
+
+            return self.download_from(payload_id=payload_id, blob_name=blob_name, dest_path=dest_path,
+                                      timeout=timeout)
+
+        start = time.perf_counter()
+
+        with futures.ThreadPoolExecutor(max_workers=parallelism) as executor:
+            downloads = []
+
+            try:
+                for file_details in self.iter_details(payload_id=payload_id, timeout=timeout):
+                    relative_path = self.get_relative_path(file_details.name)
+
+                    if (include is not None) and (not fnmatch.fnmatchcase(relative_path, include)):
+                        continue
+
+                    blob_name = self.get_blob_name(file_details.name)
+                    dest_path = os.path.join(dest_dir, *relative_path.split("/"))
+
+                    downloads.append(executor.submit(download_file, blob_name, dest_path))
+
+                file_details = [download.result() for download in downloads]
+            except Exception:
+                for download in downloads:
+                    download.cancel()
+                raise
+
+        result = payload_types.PayloadTransferStats(
+            file_details=file_details,
+            total_bytes=sum(details.size for details in file_details if details is not None),
+            elapsed_seconds=time.perf_counter() - start,
+            parallel_streams=parallelism
+        )
+
+        return result
+
+    def iter_download(self, payload_id: payload_types.PayloadId, blob_name: str,
+                      timeout=None) -> Iterator[memoryview]:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara,
+        yielding the data of the blob in chunks as they are received.
+
+        Each chunk is a read-only memoryview over the data of a received message, so no copy is made; its size is
+        chosen by the server.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+
+        Returns:
+            Iterator of memoryview chunks of the blob
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of source blob must be initialized with non-null string")
+
+        request = payloads_pb2.PayloadsDownloadRequest(
+            header=self.get_request_header(),
+            name=blob_name,
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        responses = self._stub.Download(request, timeout=timeout)
+
+        check_header = True
 
         for resp in responses:
-            if result is None:
+            if check_header:
                 self.check_response_header(header=resp.header)
+                check_header = False
 
-                result = payload_types.PayloadFileDetails(
-                    mode=resp.details.mode,
-                    name=resp.details.name,
-                    size=resp.details.size
-                )
+            yield memoryview(resp.data)
 
-            dest_obj.write(resp.data)
+    def download_into(self, payload_id: payload_types.PayloadId, blob_name: str, buffer=None,
+                      timeout=None) -> memoryview:
+        """
+        Downloads a blob, identified by "blob_name", from a payload, identified by its "payload_id", from Clara, into a
+        preallocated writable buffer.
 
-        if file_path_used:
-            dest_obj.close()
+        Chunks are copied into "buffer" as they are received, so the blob is never held twice in memory and the
+        buffer never grows. The size of the blob is read from the first message, before any data is copied.
 
-        return result
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            buffer: Writable, C-contiguous buffer (ex. bytearray or numpy array) at least the size of the blob, which
+                is given by "PayloadFileDetails.size"; if not specified, a bytearray of the size of the blob is
+                allocated
+
+        Returns:
+            memoryview of the bytes of "buffer" holding the blob
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of source blob must be initialized with non-null string")
+
+        request = payloads_pb2.PayloadsDownloadRequest(
+            header=self.get_request_header(),
+            name=blob_name,
+            payload_id=payload_id.to_grpc_value()
+        )
+
+        responses = self._stub.Download(request, timeout=timeout)
+
+        view = None
+        size = 0
+        offset = 0
+
+        for resp in responses:
+            if view is None:
+                self.check_response_header(header=resp.header)
+
+                size = resp.details.size
+
+                if buffer is None:
+                    buffer = bytearray(size)
+
+                view = memoryview(buffer).cast('B')
+
+                if view.readonly:
+                    raise Exception("Buffer must be writable")
+
+                if len(view) < size:
+                    raise Exception("Buffer of " + str(len(view)) + " bytes is smaller than blob " + blob_name +
+                                    " of " + str(size) + " bytes")
+
+            end = offset + len(resp.data)
+
+            if end > size:
+                raise Exception("Received more data than the " + str(size) + " bytes of blob " + blob_name)
+
+            view[offset:end] = resp.data
+            offset = end
+
+        if view is None:
+            return memoryview(b'')
+
+        if offset != size:
+            raise Exception("Received " + str(offset) + " of the " + str(size) + " bytes of blob " + blob_name)
+
+        return view[:size]
 
     def remove_from(self, payload_id: payload_types.PayloadId, blob_name: str, timeout=None):
         """
@@ -373,7 +1097,8 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
         self.check_response_header(header=response.header)
 
     def upload_request_iterator(self, payload_id: payload_types.PayloadId, file_name: str,
-                                source_object: BinaryIO = None, mode: int = 0):
+                                source_object: BinaryIO = None, mode: int = 0, chunk_size: int = None,
+                                adaptive_chunk_size: bool = None, monitor: transfer_tools.ProgressMonitor = None):
         """
         Creates generator with data from input file (specified by file_name)
 
@@ -382,6 +1107,10 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
             file_name (str): File_name to read from
             source_object (BinaryIO): Stream to read from
             mode (int): Privilege level
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+            adaptive_chunk_size (bool): If True, grow the chunk size until throughput stops improving; defaults to the
+                client setting
+            monitor (transfer_tools.ProgressMonitor): If specified, counts each chunk read
         """
         if (self._channel is None) or (self._stub is None):
             raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
@@ -389,18 +1118,39 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
         if source_object is None:
             raise Exception("Source object must be initialized with a non-null BinaryIO instance")
 
-        chunk_size = 64 * 1024
+        chunk_size = self._chunk_size if chunk_size is None else self.get_chunk_size(chunk_size)
+
+        if adaptive_chunk_size is None:
+            adaptive_chunk_size = self._adaptive_chunk_size
+
+        adaptive = transfer_tools.AdaptiveChunkSize(initial_size=chunk_size) if adaptive_chunk_size else None
+
+        chunks = transfer_tools.read_chunks(source_object, chunk_size=chunk_size, adaptive=adaptive)
+
+        if monitor is not None:
+            chunks = monitor.track(chunks)
+
+        return self.create_upload_requests(payload_id=payload_id, file_name=file_name, chunks=chunks, mode=mode)
 
-        while True:
-            data = source_object.read(chunk_size)
+    def create_upload_requests(self, payload_id: payload_types.PayloadId, file_name: str, chunks: Iterable[bytes],
+                               mode: int = 0) -> Iterator[payloads_pb2.PayloadsUploadRequest]:
+        """
+        Creates generator of upload requests, one for each of "chunks"
 
-            if not data:
-                return
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            file_name (str): Name of the blob in the payload
+            chunks (Iterable[bytes]): Data chunks, each carried by its own request
+            mode (int): Privilege level
+        """
+        header = self.get_request_header()
+        grpc_payload_id = payload_id.to_grpc_value()
 
+        for data in chunks:
             details = payloads_pb2.PayloadFileDetails(mode=mode, name=file_name, size=len(data))
             request = payloads_pb2.PayloadsUploadRequest(
-                header=self.get_request_header(),
-                payload_id=payload_id.to_grpc_value(),
+                header=header,
+                payload_id=grpc_payload_id,
                 details=details,
                 data=data
             )
@@ -408,8 +1158,9 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
             yield request
 
     def upload(self, payload_id: payload_types.PayloadId, blob_name: str, file_object: BinaryIO = None,
-               file_path: str = None,
-               timeout=None) -> payload_types.PayloadFileDetails:
+               file_path: str = None, timeout=None, chunk_size: int = None, adaptive_chunk_size: bool = None,
+               read_ahead: int = None, compression: grpc.Compression = None, compression_threshold: int = None,
+               progress: transfer_tools.ProgressCallback = None) -> payload_types.PayloadFileDetails:
         """
         Uploads a blob from "file_object", to a Clara Payload identified by "payload_id".
 
@@ -420,6 +1171,18 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
             blob_name (str): The name, or path, of the blob in the payload.
             file_object (BinaryIO): stream to read from and upload with read privileges
             file_path (str): Alternative to passing in BinaryIO object for upload, and rather passing in path for a file
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+            adaptive_chunk_size (bool): If True, grow the chunk size until throughput stops improving; defaults to the
+                client setting
+            read_ahead (int): If specified, number of chunks to prefetch on a background thread so reading the source
+                overlaps with sending; buffering is capped at "GrpcReadAheadBytesMaximum" bytes
+            compression (grpc.Compression): If specified, compression algorithm of the upload stream, overriding the
+                default of the channel
+            compression_threshold (int): Minimum size, in bytes, of a compressed blob; smaller blobs are sent
+                uncompressed. Defaults to "GrpcCompressionThresholdDefault"; not applied to streams of unknown size
+            progress (transfer_tools.ProgressCallback): If specified, called with the progress of the upload, counting
+                bytes handed to gRPC, sampled every "TransferProgressIntervalSeconds" and once more on completion;
+                called on a gRPC thread
         """
 
         if (self._channel is None) or (self._stub is None):
@@ -440,23 +1203,449 @@ class PayloadsClient(BaseClient, PayloadsClientStub):
                 file_object = open(file_path, 'rb')
                 file_path_used = True
 
-        requests = self.upload_request_iterator(
-            payload_id=payload_id,
-            file_name=blob_name,
-            source_object=file_object
-        )
+        call_options = {}
+        size = None
+
+        if (compression is not None) or (progress is not None):
+            try:
+                size = os.fstat(file_object.fileno()).st_size - file_object.tell()
+            except (AttributeError, OSError):
+                size = None
+
+        if compression is not None:
+            call_options['compression'] = self.get_compression(compression, size, compression_threshold)
+
+        monitor = transfer_tools.ProgressMonitor(progress, blob_name, total_bytes=size) if progress else None
+
+        source_object = file_object
+
+        if read_ahead:
+            source_object = transfer_tools.ReadAheadReader(file_object, depth=read_ahead)
+
+        try:
+            requests = self.upload_request_iterator(
+                payload_id=payload_id,
+                file_name=blob_name,
+                source_object=source_object,
+                chunk_size=chunk_size,
+                adaptive_chunk_size=adaptive_chunk_size,
+                monitor=monitor
+            )
+
+            response = self._stub.Upload(
+                requests,
+                timeout=timeout,
+                **call_options
+            )
+        finally:
+            if read_ahead:
+                source_object.close()
+
+            if file_path_used:
+                file_object.close()
+
+        self.check_response_header(header=response.header)
+
+        if monitor is not None:
+            monitor.finish()
+
+        result = payload_types.PayloadFileDetails(other=response.details)
+
+        return result
+
+    def upload_stream(self, payload_id: payload_types.PayloadId, blob_name: str, chunks: Iterable, timeout=None,
+                      chunk_size: int = None, compression: grpc.Compression = None,
+                      progress: transfer_tools.ProgressCallback = None) -> payload_types.PayloadFileDetails:
+        """
+        Uploads a blob from "chunks", data produced in memory, to a Clara Payload identified by "payload_id", without
+        writing it to a file first.
+
+        Pieces of data are coalesced or split into messages of "chunk_size" bytes as they are produced, so producers can
+        yield data of any size.
+
+        Each uploaded blob must be have a unique "blob_name" value within a given payload.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            blob_name (str): The name, or path, of the blob in the payload.
+            chunks (Iterable): Iterable of bytes-like objects (ex. bytes, bytearray, memoryview or numpy array); each
+                object must not be modified once yielded
+            chunk_size (int): Size, in bytes, of the data chunk carried by each message; defaults to the client setting
+            compression (grpc.Compression): If specified, compression algorithm of the upload stream, overriding the
+                default of the channel
+            progress (transfer_tools.ProgressCallback): If specified, called with the progress of the upload, counting
+                bytes handed to gRPC, sampled every "TransferProgressIntervalSeconds" and once more on completion;
+                called on a gRPC thread
+
+        Returns:
+            payload_types.PayloadFileDetails of the uploaded blob
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (blob_name is None) or (blob_name == ""):
+            raise Exception("Name of destination blob must be initialized with non-null string")
+
+        if chunks is None:
+            raise Exception("Chunks must be initialized with a non-null iterable of bytes-like objects")
+
+        chunk_size = self._chunk_size if chunk_size is None else self.get_chunk_size(chunk_size)
+
+        call_options = {}
+
+        if compression is not None:
+            call_options['compression'] = compression
+
+        chunks = transfer_tools.rechunk(chunks, chunk_size=chunk_size)
+        monitor = transfer_tools.ProgressMonitor(progress, blob_name) if progress else None
+
+        if monitor is not None:
+            chunks = monitor.track(chunks)
+
+        requests = self.create_upload_requests(payload_id=payload_id, file_name=blob_name, chunks=chunks)
 
         response = self._stub.Upload(
             requests,
-            timeout=timeout
+            timeout=timeout,
+            **call_options
         )
 
         self.check_response_header(header=response.header)
 
+        if monitor is not None:
+            monitor.finish()
+
         result = payload_types.PayloadFileDetails(other=response.details)
 
-        if file_path_used:
-            file_object.close()
+        return result
+
+    def upload_many(self, payload_id: payload_types.PayloadId, files: Mapping[str, str], parallel_streams: int = None,
+                    checkpoint_path: str = None, compression: grpc.Compression = None,
+                    compression_threshold: int = None, timeout=None) -> payload_types.PayloadTransferStats:
+        """
+        Uploads a set of local files to a Clara Payload identified by "payload_id" over concurrent upload streams.
+
+        Each file is uploaded over its own "Upload" stream, with at most "parallel_streams" streams in flight at once.
+        Files are started largest first, so a large file started last does not leave the other streams idle at the end
+        of the call.
+
+        With "checkpoint_path", the call can be retried after an interruption: blobs recorded as complete in the
+        checkpoint, or listed by "iter_details", with the size of their local file are skipped, and blobs listed with
+        any other size, left incomplete by the interrupted call or since changed, are removed and uploaded again.
+        Uploaded blobs are recorded in the checkpoint as the server confirms them. The server only confirms an upload
+        once its stream completes and upload requests carry no offset, so an interrupted blob is uploaded again from its
+        start.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            files (Mapping[str, str]): Mapping of blob names, within the payload, to paths of the local files to upload.
+            parallel_streams (int): Number of concurrent upload streams. If not specified, the value of the
+                "GRPC_PARALLEL_STREAMS" environment variable or "GrpcParallelStreamsDefault" is used.
+            checkpoint_path (str): If specified, path of a local checkpoint recording the uploaded blobs
+            compression (grpc.Compression): If specified, compression algorithm of the upload streams, overriding the
+                default of the channel
+            compression_threshold (int): Minimum size, in bytes, of a compressed blob; smaller blobs are sent
+                uncompressed. Defaults to "GrpcCompressionThresholdDefault"
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each uploaded blob, in the order of "files", and
+            aggregate throughput
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if files is None:
+            raise Exception("Files must be an instantiated map of blob names to file paths")
+
+        checkpoint = None
+
+        if checkpoint_path is not None:
+            checkpoint = transfer_tools.TransferCheckpoint(checkpoint_path, payload_id.value)
+            files = self.get_pending_uploads(payload_id=payload_id, files=files, checkpoint=checkpoint,
+                                             timeout=timeout)
+
+        parallel_streams = min(self.get_parallel_streams(parallel_streams), max(len(files), 1))
+
+        def upload_file(blob_name: str, file_path: str) -> payload_types.PayloadFileDetails:
+            file_details = self.upload(payload_id=payload_id, blob_name=blob_name, file_path=file_path,
+                                       compression=compression, compression_threshold=compression_threshold,
+                                       timeout=timeout)
+
+            if checkpoint is not None:
+                checkpoint.confirm(blob_name, file_details.name, file_details.size, file_details.mode,
+                                   file_details.size)
+
+            return file_details
+
+        start = time.perf_counter()
+
+        order = sorted(files.keys(), key=lambda blob_name: os.path.getsize(files[blob_name]), reverse=True)
+
+        with futures.ThreadPoolExecutor(max_workers=parallel_streams) as executor:
+            uploads = {
+                blob_name: executor.submit(upload_file, blob_name, files[blob_name])
+                for blob_name in order
+            }
+
+            try:
+                file_details = [uploads[blob_name].result() for blob_name in files.keys()]
+            except Exception:
+                for upload in uploads.values():
+                    upload.cancel()
+                raise
+
+        result = payload_types.PayloadTransferStats(
+            file_details=file_details,
+            total_bytes=sum(details.size for details in file_details),
+            elapsed_seconds=time.perf_counter() - start,
+            parallel_streams=parallel_streams
+        )
+
+        return result
+
+    def get_pending_uploads(self, payload_id: payload_types.PayloadId, files: Mapping[str, str],
+                            checkpoint: transfer_tools.TransferCheckpoint, timeout=None) -> Mapping[str, str]:
+        """
+        Returns the files of a resumed "upload_many" call which still have to be uploaded
+
+        Blobs recorded as complete in "checkpoint" with the size of their local file are skipped without asking the
+        server; the payload is only listed when other blobs remain. Blobs listed in the payload with the size of their
+        local file are then recorded as complete and skipped; blobs listed with any other size are removed from the
+        payload, so they can be uploaded again.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            files (Mapping[str, str]): Mapping of blob names, within the payload, to paths of the local files to upload.
+            checkpoint (transfer_tools.TransferCheckpoint): Checkpoint recording the uploaded blobs
+
+        Returns:
+            Mapping[str, str] of the blob names and local file paths left to upload
+        """
+        sizes = {blob_name: os.path.getsize(file_path) for blob_name, file_path in files.items()}
+
+        # Blobs confirmed by the server during an earlier call
+        unconfirmed = {blob_name: file_path for blob_name, file_path in files.items()
+                       if not checkpoint.is_complete(blob_name, sizes[blob_name])}
+
+        if len(unconfirmed) == 0:
+            return {}
+
+        remote_files = {self.get_relative_path(file_details.name): file_details
+                        for file_details in self.iter_details(payload_id=payload_id, timeout=timeout)}
+
+        pending = {}
+
+        for blob_name, file_path in unconfirmed.items():
+            remote_details = remote_files.get(self.get_relative_path(blob_name))
+            size = sizes[blob_name]
+
+            if (remote_details is not None) and (remote_details.size == size):
+                checkpoint.confirm(blob_name, remote_details.name, size, remote_details.mode, size, save=False)
+                continue
+
+            if remote_details is not None:
+                self.remove_from(payload_id=payload_id, blob_name=self.get_blob_name(remote_details.name),
+                                 timeout=timeout)
+
+            pending[blob_name] = file_path
+
+        checkpoint.save()
+
+        return pending
+
+    def upload_directory(self, payload_id: payload_types.PayloadId, source_dir: str, blob_prefix: str = "",
+                         parallel_streams: int = None, checkpoint_path: str = None,
+                         compression: grpc.Compression = None, compression_threshold: int = None,
+                         timeout=None) -> payload_types.PayloadTransferStats:
+        """
+        Uploads every file under "source_dir" to a Clara Payload identified by "payload_id".
+
+        Blob names are formed from "blob_prefix" followed by the path of each file relative to "source_dir", using "/"
+        as separator.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            source_dir (str): Local directory to upload.
+            blob_prefix (str): Prefix prepended to the relative path of each file to form its blob name.
+            parallel_streams (int): Number of concurrent upload streams. If not specified, the value of the
+                "GRPC_PARALLEL_STREAMS" environment variable or "GrpcParallelStreamsDefault" is used.
+            checkpoint_path (str): If specified, path of a local checkpoint recording the uploaded blobs, see
+                "upload_many"
+            compression (grpc.Compression): If specified, compression algorithm of the upload streams
+            compression_threshold (int): Minimum size, in bytes, of a compressed blob; defaults to
+                "GrpcCompressionThresholdDefault"
+
+        Returns:
+            A payload_types.PayloadTransferStats with the details of each uploaded blob and aggregate throughput
+        """
+
+        if (source_dir is None) or (not os.path.isdir(source_dir)):
+            raise Exception("Source directory must be initialized with path of an existing directory")
+
+        files = self.list_directory(source_dir, blob_prefix=blob_prefix)
+
+        return self.upload_many(payload_id=payload_id, files=files, parallel_streams=parallel_streams,
+                                checkpoint_path=checkpoint_path, compression=compression,
+                                compression_threshold=compression_threshold, timeout=timeout)
+
+    @staticmethod
+    def list_directory(source_dir: str, blob_prefix: str = "") -> Mapping[str, str]:
+        """
+        Lists the files under "source_dir" by the blob name each is uploaded to
+
+        Blob names are formed from "blob_prefix" followed by the path of each file relative to "source_dir", using "/"
+        as separator.
+
+        Args:
+            source_dir (str): Local directory to list.
+            blob_prefix (str): Prefix prepended to the relative path of each file to form its blob name.
+
+        Returns:
+            Mapping[str, str] of blob names to paths of the local files, in a stable order
+        """
+        files = {}
+
+        for root, dirs, file_names in os.walk(source_dir):
+            dirs.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(root, file_name)
+                relative_path = os.path.relpath(file_path, source_dir).replace(os.sep, "/")
+                files[blob_prefix + relative_path] = file_path
+
+        return files
+
+    @staticmethod
+    def get_sync_metadata_key(relative_path: str) -> str:
+        """
+        Returns the payload metadata key under which "sync_directory" keeps the content hash of a blob
+
+        Blob paths can be longer than the "MetadataKeySizeMaximum" bytes allowed for a metadata key, so the key is
+        derived from a digest of the path instead of the path itself.
+
+        Args:
+            relative_path (str): Path of the blob relative to the payload root
+
+        Returns:
+            Metadata key of the blob
+        """
+        return constants.PayloadSyncMetadataKeyPrefix + hashlib.sha1(relative_path.encode('utf-8')).hexdigest()
+
+    def sync_directory(self, payload_id: payload_types.PayloadId, local_dir: str, blob_prefix: str = "",
+                       content_hash: bool = False, parallel_streams: int = None,
+                       timeout=None) -> payload_types.PayloadSyncResult:
+        """
+        Makes the blobs of a Clara Payload identified by "payload_id" mirror the files under "local_dir", uploading only
+        new or changed files and removing blobs whose local file no longer exists.
+
+        Files are compared to the blobs listed by "iter_details" by name and size. With "content_hash", files of the
+        same size are also compared by their SHA-256 digest, which is kept in the payload metadata under a key derived
+        from the blob path (see "get_sync_metadata_key"); a blob without a recorded digest is treated as changed, so
+        the first hashed sync of a payload uploads every file once.
+
+        Changed blobs are removed before being uploaded again. Only blobs whose path starts with "blob_prefix" are
+        considered for removal.
+
+        Args:
+            payload_id (payload_types.PayloadId): Unique identifier of the payload.
+            local_dir (str): Local directory to mirror.
+            blob_prefix (str): Prefix prepended to the relative path of each file to form its blob name.
+            content_hash (bool): If True, files are also compared by a content hash kept in the payload metadata.
+            parallel_streams (int): Number of concurrent upload streams. If not specified, the value of the
+                "GRPC_PARALLEL_STREAMS" environment variable or "GrpcParallelStreamsDefault" is used.
+
+        Returns:
+            A payload_types.PayloadSyncResult with the uploaded, removed and unchanged blobs
+        """
+
+        if (self._channel is None) or (self._stub is None):
+            raise Exception("Connection is currently closed. Please run reconnect() to reopen connection")
+
+        if (payload_id.value is None) or (payload_id.value == ""):
+            raise Exception("Payload identifier argument must be initialized with non-null instance")
+
+        if (local_dir is None) or (not os.path.isdir(local_dir)):
+            raise Exception("Local directory must be initialized with path of an existing directory")
+
+        local_files = {}
+
+        for blob_name, file_path in self.list_directory(local_dir, blob_prefix=blob_prefix).items():
+            local_files[self.get_relative_path(blob_name)] = (blob_name, file_path)
+
+        details = self.iter_details(payload_id=payload_id, timeout=timeout)
+
+        remote_files = {self.get_relative_path(file_details.name): file_details for file_details in details}
+        metadata = dict(details.metadata) if details.metadata is not None else {}
+
+        digests = {}
+
+        if content_hash:
+            paths = list(local_files.keys())
+
+            with futures.ThreadPoolExecutor(max_workers=self.get_parallel_streams(parallel_streams)) as executor:
+                digests = dict(zip(paths, executor.map(transfer_tools.hash_file,
+                                                       [local_files[path][1] for path in paths])))
+
+        uploads = {}
+        changed_paths = []
+        stale_blobs = []
+        unchanged = []
+
+        for relative_path, (blob_name, file_path) in local_files.items():
+            remote_details = remote_files.get(relative_path)
+
+            changed = (remote_details is None) or (remote_details.size != os.path.getsize(file_path))
+
+            if (not changed) and content_hash:
+                changed = metadata.get(self.get_sync_metadata_key(relative_path)) != digests[relative_path]
+
+            if changed:
+                uploads[blob_name] = file_path
+                changed_paths.append(relative_path)
+
+                if remote_details is not None:
+                    stale_blobs.append(remote_details.name)
+            else:
+                unchanged.append(blob_name)
+
+        scope = posixpath.normpath("/" + blob_prefix).lstrip("/") if blob_prefix else ""
+
+        if blob_prefix.endswith("/") and (scope != ""):
+            scope += "/"
+
+        removed_paths = [relative_path for relative_path in remote_files.keys()
+                         if (relative_path not in local_files) and relative_path.startswith(scope)]
+        removed = [remote_files[relative_path].name for relative_path in removed_paths]
+
+        for blob_name in stale_blobs + removed:
+            self.remove_from(payload_id=payload_id, blob_name=self.get_blob_name(blob_name), timeout=timeout)
+
+        if len(uploads) > 0:
+            uploaded = self.upload_many(payload_id=payload_id, files=uploads, parallel_streams=parallel_streams,
+                                        timeout=timeout)
+        else:
+            uploaded = payload_types.PayloadTransferStats()
+
+        # Adding an existing metadata key fails, so outdated digests are removed before the new ones are added
+        stale_keys = [self.get_sync_metadata_key(relative_path) for relative_path in changed_paths + removed_paths]
+        stale_keys = [key for key in stale_keys if key in metadata]
+
+        if len(stale_keys) > 0:
+            self.remove_metadata(payload_id=payload_id, keys=stale_keys, timeout=timeout)
+
+        if content_hash and (len(changed_paths) > 0):
+            self.add_metadata(payload_id=payload_id, metadata={
+                self.get_sync_metadata_key(relative_path): digests[relative_path] for relative_path in changed_paths
+            }, timeout=timeout)
+
+        result = payload_types.PayloadSyncResult(uploaded=uploaded, removed=removed, unchanged=unchanged)
 
         return result
 
@@ -16,7 +16,7 @@ from typing import List, Mapping
 import grpc
 from nvidia_clara.grpc import pipelines_pb2, pipelines_pb2_grpc
 import nvidia_clara.pipeline_types as pipeline_types
-from nvidia_clara.base_client import BaseClient, RequestIterator
+from nvidia_clara.base_client import BaseClient, ChannelOptions, RequestIterator
 
 
 class PipelinesClientStub:
@@ -119,13 +119,17 @@ class PipelinesClientStub:
 
 
 class PipelinesClient(BaseClient, PipelinesClientStub):
-    def __init__(self, target: str, port: str = None, stub=None):
+    def __init__(self, target: str, port: str = None, stub=None, channel: grpc.Channel = None,
+                 channel_options: ChannelOptions = None):
         """
         Pipelines Client Creation
 
         Args:
             target (str): ipv4 address of clara instance
             port (str): if specified, port will be appended to the target with a ":"
+            channel (grpc.Channel): if specified, existing channel to issue calls over instead of opening a new one;
+                the channel is shared, and is not closed by "close()"
+            channel_options (ChannelOptions): if specified, options applied to channels opened by the client
         """
         if target is None:
             raise Exception("Target must be initialized to a non-null value")
@@ -135,7 +139,14 @@ class PipelinesClient(BaseClient, PipelinesClientStub):
         if port is not None:
             self._connection += ":" + port
 
-        self._channel = grpc.insecure_channel(self._connection)
+        self._channel_options = channel_options
+
+        if channel is None:
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
+        else:
+            self._channel = channel
+            self._owns_channel = False
 
         if stub is None:
             self._stub = pipelines_pb2_grpc.PipelinesStub(self._channel)
@@ -147,17 +158,25 @@ class PipelinesClient(BaseClient, PipelinesClientStub):
         Close connection
         """
         if self._channel:
-            self._channel.close()
+            if self._owns_channel:
+                self._channel.close()
             self._channel = None
         else:
             print("Connection for client already closed")
 
-    def reconnect(self):
+    def reconnect(self, channel_options: ChannelOptions = None):
         """
         Re-open connection with existing channel
+
+        Args:
+            channel_options (ChannelOptions): if specified, replaces the options applied to the channel
         """
+        if channel_options is not None:
+            self._channel_options = channel_options
+
         if self._channel is None:
-            self._channel = grpc.insecure_channel(self._connection)
+            self._channel = self.create_channel(self._connection, self._channel_options)
+            self._owns_channel = True
             self._stub = pipelines_pb2_grpc.PipelinesStub(self._channel)
         else:
             print("Connection for client already open")
@@ -170,6 +189,97 @@ class PipelinesClient(BaseClient, PipelinesClientStub):
             self.close()
         return False
 
+    @staticmethod
+    def create_pipeline_requests(definition: List[pipeline_types.PipelineDefinition],
+                                 pipeline_id: pipeline_types.PipelineId = None,
+                                 metadata: Mapping[str, str] = None) -> List[pipelines_pb2.PipelinesCreateRequest]:
+        """
+        Creates the requests of a create call, one per definition file
+
+        Args:
+            definition(List[pipeline_types.PipelineDefinition]): Definition from which to create the new pipeline.
+            pipeline_id (pipeline_types.PipelineId): Optional identifier to force on the new pipeline
+            metadata(Mapping[str, str]): Optional set of key/value pairs to be appended to the pipeline metadata
+
+        Returns:
+            List[pipelines_pb2.PipelinesCreateRequest]
+        """
+        # If pipeline identifier set, must first be in GRPC Identifier format
+        grpc_pipeline_id = pipeline_id.to_grpc_value() if pipeline_id is not None else None
+
+        request_list = []
+
+        for item in definition:
+            item_definition = pipelines_pb2.PipelineDefinitionFile(
+                content=item.content,
+                path=item.name
+            )
+
+            request = pipelines_pb2.PipelinesCreateRequest(
+                definition=item_definition,
+                pipeline_id=grpc_pipeline_id,
+                header=BaseClient.get_request_header()
+            )
+
+            if metadata is not None:
+                request.metadata.update(metadata)
+
+            request_list.append(request)
+
+        return request_list
+
+    @staticmethod
+    def get_pipeline_info(details: pipelines_pb2.PipelinesListResponse.PipelineDetails) -> pipeline_types.PipelineInfo:
+        """
+        Creates pipeline_types.PipelineInfo from the pipeline details of a list response
+
+        Args:
+            details (pipelines_pb2.PipelinesListResponse.PipelineDetails): pipeline details to convert
+
+        Returns:
+            pipeline_types.PipelineInfo
+        """
+        return pipeline_types.PipelineInfo(
+            pipeline_id=pipeline_types.PipelineId(details.pipeline_id.value),
+            name=details.name,
+            metadata=details.metadata
+        )
+
+    @staticmethod
+    def get_pipeline_details(
+            responses: List[pipelines_pb2.PipelinesDetailsResponse]) -> pipeline_types.PipelineDetails:
+        """
+        Creates pipeline_types.PipelineDetails from the responses of a details call
+
+        Args:
+            responses (List[pipelines_pb2.PipelinesDetailsResponse]): responses to convert, one per definition file
+
+        Returns:
+            pipeline_types.PipelineDetails, or None if "responses" is empty
+        """
+        if len(responses) == 0:
+            return None
+
+        result = pipeline_types.PipelineDetails(
+            name=responses[0].name,
+            pipeline_id=pipeline_types.PipelineId(responses[0].pipeline_id.value),
+            metadata=responses[0].metadata
+        )
+
+        result_definition = []
+
+        for resp in responses:
+            result_definition.append(
+                pipeline_types.PipelineDefinition(
+                    name=resp.name,
+                    content=resp.definition
+                )
+            )
+
+        result.definition = result_definition
+
+        return result
+
     def create_pipeline(self, definition: List[pipeline_types.PipelineDefinition],
                         pipeline_id: pipeline_types.PipelineId = None, metadata: Mapping[str, str] = None,
                         timeout=None) -> pipeline_types.PipelineId:
@@ -197,28 +307,7 @@ class PipelinesClient(BaseClient, PipelinesClientStub):
         if definition is None:
             raise Exception("Argument 'definition' must be initialized to a non-null list instance")
 
-        request_list = []
-
-        for item in definition:
-            item_definition = pipelines_pb2.PipelineDefinitionFile(
-                content=item.content,
-                path=item.name
-            )
-
-            # If pipeline identifier set, must first be in GRPC Identifier format
-            if pipeline_id is not None:
-                pipeline_id = pipeline_id.to_grpc_value()
-
-            request = pipelines_pb2.PipelinesCreateRequest(
-                definition=item_definition,
-                pipeline_id=pipeline_id,
-                header=self.get_request_header()
-            )
-
-            if metadata is not None:
-                request.metadata.update(metadata)
-
-            request_list.append(request)
+        request_list = self.create_pipeline_requests(definition, pipeline_id=pipeline_id, metadata=metadata)
 
         request_list = RequestIterator(request_list)
 
@@ -249,20 +338,11 @@ class PipelinesClient(BaseClient, PipelinesClientStub):
 
         info_list = []
 
-        responses = [resp for resp in response]
-
-        if len(responses) > 0:
-            for item in responses:
-                if (item.details is None) or (item.details.pipeline_id.value == ''):
-                    continue
-
-                info = pipeline_types.PipelineInfo(
-                    pipeline_id=pipeline_types.PipelineId(item.details.pipeline_id.value),
-                    name=item.details.name,
-                    metadata=item.details.metadata
-                )
+        for item in response:
+            if (item.details is None) or (item.details.pipeline_id.value == ''):
+                continue
 
-                info_list.append(info)
+            info_list.append(self.get_pipeline_info(item.details))
 
         return info_list
 
@@ -294,27 +374,7 @@ class PipelinesClient(BaseClient, PipelinesClientStub):
         if len(responses) > 0:
             self.check_response_header(header=responses[0].header)
 
-            result = pipeline_types.PipelineDetails(
-                name=responses[0].name,
-                pipeline_id=pipeline_types.PipelineId(responses[0].pipeline_id.value),
-                metadata=responses[0].metadata
-            )
-
-            result_definition = []
-
-            for resp in responses:
-                result_definition.append(
-                    pipeline_types.PipelineDefinition(
-                        name=resp.name,
-                        content=resp.definition
-                    )
-                )
-
-            result.definition = result_definition
-
-            return result
-
-        return None
+        return self.get_pipeline_details(responses)
 
     def remove_pipeline(self, pipeline_id: pipeline_types.PipelineId, timeout=None):
         """
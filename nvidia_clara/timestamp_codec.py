@@ -0,0 +1,213 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import array
+import datetime
+import functools
+from typing import Iterable, List
+
+import nvidia_clara.constants as constants
+from nvidia_clara.grpc import common_pb2
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+@functools.lru_cache(maxsize=constants.TimestampParseCacheSize)
+def parse_timestamp(text: str, utc: bool) -> datetime.datetime:
+    """
+    Parses a timestamp formatted as text; results are cached, as listings repeat the same strings
+
+    Args:
+        text (str): timestamp formatted as "constants.TimestampFormat"
+        utc (bool): if True, the parsed local time is converted to UTC
+
+    Returns:
+        datetime.datetime object
+    """
+    result = datetime.datetime.strptime(text, constants.TimestampFormat)
+
+    return result.astimezone(datetime.timezone.utc) if utc else result
+
+
+class TimestampCodec:
+    """
+    Converts the timestamps of Clara messages, counted in seconds from a reference year or formatted as text, to and
+    from datetime.datetime.
+
+    Timestamps of the Jobs service count seconds from year one and convert to datetimes in UTC; timestamps of the Clara
+    service count seconds from year zero and convert to naive datetimes in local time. "JOBS" and "CLARA" are the codecs
+    of both services.
+    """
+
+    def __init__(self, offset_seconds: int, utc: bool):
+        """
+        Args:
+            offset_seconds (int): Seconds from the reference year of the timestamps to the epoch
+            utc (bool): If True, timestamps convert to datetimes in UTC, otherwise to naive datetimes in local time
+        """
+        self._offset_seconds = offset_seconds
+        self._utc = utc
+        self._tz = datetime.timezone.utc if utc else None
+
+    @property
+    def offset_seconds(self) -> int:
+        """Seconds from the reference year of the timestamps to the epoch."""
+        return self._offset_seconds
+
+    @property
+    def utc(self) -> bool:
+        """True if timestamps convert to datetimes in UTC, False if to naive datetimes in local time."""
+        return self._utc
+
+    def from_seconds(self, seconds: int) -> datetime.datetime:
+        """
+        Converts a number of seconds since the reference year
+
+        Args:
+            seconds (int): seconds since the reference year
+
+        Returns:
+            datetime.datetime object, or None if before the epoch
+        """
+        seconds = seconds - self._offset_seconds
+
+        if seconds < 0:
+            return None
+
+        return datetime.datetime.fromtimestamp(seconds, self._tz)
+
+    def decode(self, timestamp) -> datetime.datetime:
+        """
+        Converts a timestamp
+
+        Args:
+            timestamp: common_pb2.Timestamp, seconds since the reference year, or text formatted as
+                "constants.TimestampFormat"
+
+        Returns:
+            datetime.datetime object, or None if not set or before the epoch
+        """
+        # Timestamps of messages are by far the most frequent
+        if type(timestamp) is common_pb2.Timestamp:
+            return self.from_seconds(timestamp.value)
+
+        if (timestamp is None) or (timestamp == ""):
+            return None
+
+        if isinstance(timestamp, str):
+            return parse_timestamp(timestamp, self._utc)
+
+        if isinstance(timestamp, (int, float)):
+            return self.from_seconds(timestamp)
+
+        return self.from_seconds(timestamp.value)
+
+    def decode_many(self, timestamps: Iterable) -> List[datetime.datetime]:
+        """
+        Converts many timestamps at once
+
+        Args:
+            timestamps (Iterable): common_pb2.Timestamp, seconds since the reference year, or formatted texts
+
+        Returns:
+            List of datetime.datetime objects, None where not set or before the epoch
+        """
+        offset_seconds = self._offset_seconds
+        tz = self._tz
+        fromtimestamp = datetime.datetime.fromtimestamp
+        result = []
+
+        for timestamp in timestamps:
+            if type(timestamp) is common_pb2.Timestamp:
+                seconds = timestamp.value - offset_seconds
+            elif type(timestamp) is int:
+                seconds = timestamp - offset_seconds
+            else:
+                result.append(self.decode(timestamp))
+                continue
+
+            result.append(fromtimestamp(seconds, tz) if seconds >= 0 else None)
+
+        return result
+
+    def to_epoch_seconds(self, timestamp) -> float:
+        """
+        Converts a timestamp to seconds since the epoch
+
+        Args:
+            timestamp: common_pb2.Timestamp, seconds since the reference year, or formatted text
+
+        Returns:
+            seconds since the epoch, or NaN if not set or before the epoch
+        """
+        if type(timestamp) is common_pb2.Timestamp:
+            seconds = timestamp.value - self._offset_seconds
+        elif isinstance(timestamp, (int, float)):
+            seconds = timestamp - self._offset_seconds
+        else:
+            result = self.decode(timestamp)
+            return float('nan') if result is None else result.timestamp()
+
+        return float(seconds) if seconds >= 0 else float('nan')
+
+    def to_epoch_seconds_many(self, seconds: Iterable[int]):
+        """
+        Converts many numbers of seconds since the reference year to seconds since the epoch at once
+
+        Args:
+            seconds (Iterable[int]): seconds since the reference year, as "array.array" or any iterable
+
+        Returns:
+            NumPy array of seconds since the epoch, NaN where before the epoch, when NumPy is installed; otherwise
+            "array.array" of doubles
+        """
+        if numpy is not None:
+            if isinstance(seconds, array.array):
+                values = numpy.frombuffer(seconds, dtype=seconds.typecode).astype(numpy.float64)
+            else:
+                values = numpy.fromiter(seconds, dtype=numpy.float64)
+
+            values -= self._offset_seconds
+            values[values < 0] = numpy.nan
+
+            return values
+
+        nan = float('nan')
+        offset_seconds = self._offset_seconds
+
+        return array.array('d', [value - offset_seconds if value >= offset_seconds else nan for value in seconds])
+
+    def encode(self, value: datetime.datetime) -> int:
+        """
+        Converts a datetime to seconds since the reference year
+
+        Args:
+            value (datetime.datetime): date to convert; its wall clock time is used, whatever its time zone
+
+        Returns:
+            seconds since the reference year
+        """
+        delta = value.replace(tzinfo=None) - _EPOCH + datetime.timedelta(seconds=self._offset_seconds)
+
+        return int(delta.total_seconds())
+
+
+JOBS = TimestampCodec(constants.TimestampOffsetYearOne, utc=True)
+CLARA = TimestampCodec(constants.TimestampOffsetYearZero, utc=False)
@@ -0,0 +1,807 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator
+import nvidia_clara.constants as constants
+
+
+class AdaptiveChunkSize:
+    """
+    Grows the chunk size of an upload stream until throughput stops improving.
+
+    Throughput is measured over windows of "window" chunks. After each window the chunk size is doubled, up to
+    "maximum_size", as long as throughput improved by at least "minimum_gain" over the best window so far; once it
+    does not, the chunk size is settled on the best performing size for the remainder of the stream.
+    """
+
+    def __init__(self, initial_size: int = constants.GrpcChunkSizeDefault,
+                 maximum_size: int = constants.GrpcChunkSizeMaximum, window: int = 4, minimum_gain: float = 1.1):
+        if (initial_size < constants.GrpcChunkSizeMinimum) or (initial_size > maximum_size):
+            raise Exception("Initial chunk size must be within " + str(constants.GrpcChunkSizeMinimum) + " and " +
+                            str(maximum_size) + ", found: " + str(initial_size))
+
+        self._size = initial_size
+        self._maximum_size = maximum_size
+        self._window = window
+        self._minimum_gain = minimum_gain
+        self._settled = initial_size >= maximum_size
+        self._best_size = initial_size
+        self._best_throughput = 0.0
+        self._window_bytes = 0
+        self._window_seconds = 0.0
+        self._window_chunks = 0
+
+    @property
+    def size(self) -> int:
+        """Chunk size, in bytes, to use for the next chunk."""
+        return self._size
+
+    @property
+    def settled(self) -> bool:
+        """True once the chunk size has stopped growing."""
+        return self._settled
+
+    def record(self, byte_count: int, seconds: float):
+        """
+        Records the transfer of a chunk
+
+        Args:
+            byte_count (int): Size, in bytes, of the chunk
+            seconds (float): Time taken to read and send the chunk
+        """
+        if self._settled:
+            return
+
+        self._window_bytes += byte_count
+        self._window_seconds += seconds
+        self._window_chunks += 1
+
+        if self._window_chunks < self._window:
+            return
+
+        throughput = self._window_bytes / max(self._window_seconds, 1e-9)
+
+        self._window_bytes = 0
+        self._window_seconds = 0.0
+        self._window_chunks = 0
+
+        if throughput >= self._best_throughput * self._minimum_gain:
+            self._best_throughput = throughput
+            self._best_size = self._size
+
+            if self._size >= self._maximum_size:
+                self._settled = True
+            else:
+                self._size = min(self._size * 2, self._maximum_size)
+        else:
+            self._size = self._best_size
+            self._settled = True
+
+
+class TransferProgress:
+    """
+    Snapshot of the progress of the transfer of a blob, or model, reported to progress callbacks.
+    """
+
+    def __init__(self, name: str, total_bytes: int, bytes_transferred: int, chunks: int, elapsed_seconds: float,
+                 bytes_per_second: float, done: bool):
+        self._name = name
+        self._total_bytes = total_bytes
+        self._bytes_transferred = bytes_transferred
+        self._chunks = chunks
+        self._elapsed_seconds = elapsed_seconds
+        self._bytes_per_second = bytes_per_second
+        self._done = done
+
+    @property
+    def name(self) -> str:
+        """Name of the blob, or model, transferred."""
+        return self._name
+
+    @property
+    def total_bytes(self) -> int:
+        """Size, in bytes, of the transfer; None if not known in advance."""
+        return self._total_bytes
+
+    @property
+    def bytes_transferred(self) -> int:
+        """Number of bytes transferred so far."""
+        return self._bytes_transferred
+
+    @property
+    def chunks(self) -> int:
+        """Number of chunks transferred so far."""
+        return self._chunks
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Time elapsed since the start of the transfer."""
+        return self._elapsed_seconds
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Throughput since the previous report."""
+        return self._bytes_per_second
+
+    @property
+    def done(self) -> bool:
+        """True for the final report of a completed transfer."""
+        return self._done
+
+
+ProgressCallback = Callable[[TransferProgress], None]
+
+
+class ProgressMonitor:
+    """
+    Counts the bytes and chunks of a transfer and reports its progress to "callback".
+
+    Counting a chunk only adds to two counters and reads the clock; "callback" is called at most once every
+    "interval_seconds", with the throughput since its previous call, and once more when the transfer completes. No
+    report is made while no chunk is transferred, so a transfer can be detected as stalled when the elapsed time since
+    its last report exceeds the interval.
+
+    "callback" is called on the thread transferring the chunks, which for uploads is a gRPC thread, and must return
+    quickly.
+    """
+
+    def __init__(self, callback: ProgressCallback, name: str, total_bytes: int = None,
+                 interval_seconds: float = constants.TransferProgressIntervalSeconds):
+        """
+        Args:
+            callback (ProgressCallback): Function receiving each progress report
+            name (str): Name of the blob, or model, transferred
+            total_bytes (int): Size, in bytes, of the transfer, if known in advance
+            interval_seconds (float): Minimum time, in seconds, between two reports
+        """
+        if callback is None:
+            raise Exception("Progress callback must be initialized with a non-null callable")
+
+        self._callback = callback
+        self._name = name
+        self._total_bytes = total_bytes
+        self._interval_seconds = interval_seconds
+        self._bytes = 0
+        self._chunks = 0
+        self._start = time.perf_counter()
+        self._report_time = self._start
+        self._report_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Size, in bytes, of the transfer; None if not known in advance."""
+        return self._total_bytes
+
+    @total_bytes.setter
+    def total_bytes(self, total_bytes: int):
+        """Size, in bytes, of the transfer; None if not known in advance."""
+        self._total_bytes = total_bytes
+
+    def update(self, byte_count: int):
+        """
+        Counts a transferred chunk, reporting progress if "interval_seconds" have elapsed since the previous report
+
+        Args:
+            byte_count (int): Size, in bytes, of the chunk
+        """
+        self._bytes += byte_count
+        self._chunks += 1
+
+        now = time.perf_counter()
+
+        if now - self._report_time >= self._interval_seconds:
+            self._report(now, False)
+
+    def track(self, chunks: Iterable) -> Iterator:
+        """
+        Creates generator of "chunks", counting each chunk as it is handed on
+
+        Args:
+            chunks (Iterable): Iterable of bytes-like objects
+        """
+        for data in chunks:
+            self.update(len(data))
+            yield data
+
+    def finish(self):
+        """Reports the completion of the transfer"""
+        self._report(time.perf_counter(), True)
+
+    def _report(self, now: float, done: bool):
+        interval = now - self._report_time
+        bytes_per_second = (self._bytes - self._report_bytes) / interval if interval > 0 else 0.0
+
+        self._report_time = now
+        self._report_bytes = self._bytes
+
+        self._callback(TransferProgress(name=self._name, total_bytes=self._total_bytes, bytes_transferred=self._bytes,
+                                        chunks=self._chunks, elapsed_seconds=now - self._start,
+                                        bytes_per_second=bytes_per_second, done=done))
+
+
+class MappedFileWriter:
+    """
+    Write-only, file-like view of a file of known size on disk backed by a sliding memory map.
+
+    The file is preallocated to "size" bytes up front, so the filesystem can lay it out in one extent rather than
+    growing it write by write, and chunks are copied straight into the mapped page cache without a write system call
+    per chunk. Only a window of "window_size" bytes is mapped at a time; dirty pages of previous windows are written
+    back by the kernel.
+    """
+
+    def __init__(self, file_path: str, size: int, window_size: int = 8 * 1024 * 1024):
+        """
+        Args:
+            file_path (str): Path of the file to create, or truncate
+            size (int): Final size, in bytes, of the file
+            window_size (int): Size, in bytes, of the mapped window; rounded up to the allocation granularity
+        """
+        if (size is None) or (size < 0):
+            raise Exception("Size of mapped file must be a non-negative integer, found: " + str(size))
+
+        granularity = mmap.ALLOCATIONGRANULARITY
+
+        self._file = open(file_path, 'w+b')
+        self._size = size
+        self._window_size = max(granularity, (window_size + granularity - 1) // granularity * granularity)
+        self._map = None
+        self._map_offset = 0
+        self._map_length = 0
+        self._position = 0
+
+        if size > 0:
+            try:
+                os.posix_fallocate(self._file.fileno(), 0, size)
+            except (AttributeError, OSError):
+                # Not every platform, or filesystem, supports preallocation; a sparse file is mapped just as well
+                os.ftruncate(self._file.fileno(), size)
+
+    @property
+    def size(self) -> int:
+        """Size, in bytes, of the mapped file."""
+        return self._size
+
+    @property
+    def position(self) -> int:
+        """Number of bytes written so far."""
+        return self._position
+
+    def _map_window(self, position: int):
+        if self._map is not None:
+            self._map.close()
+
+        self._map_offset = position - (position % mmap.ALLOCATIONGRANULARITY)
+        self._map_length = min(self._window_size, self._size - self._map_offset)
+        self._map = mmap.mmap(self._file.fileno(), self._map_length, offset=self._map_offset,
+                              access=mmap.ACCESS_WRITE)
+
+        if hasattr(self._map, 'madvise'):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+    def write(self, data) -> int:
+        """
+        Writes "data" at the current position
+
+        Args:
+            data: bytes-like object to write
+
+        Returns:
+            number of bytes written
+        """
+        if self._file is None:
+            raise Exception("Mapped file writer is closed")
+
+        data = memoryview(data).cast('B')
+        length = len(data)
+
+        if self._position + length > self._size:
+            raise Exception("Write of " + str(length) + " bytes at " + str(self._position) +
+                            " exceeds the size of the mapped file of " + str(self._size) + " bytes")
+
+        written = 0
+
+        while written < length:
+            if (self._map is None) or (self._position >= self._map_offset + self._map_length):
+                self._map_window(self._position)
+
+            start = self._position - self._map_offset
+            count = min(length - written, self._map_length - start)
+
+            self._map[start:start + count] = data[written:written + count]
+
+            written += count
+            self._position += count
+
+        return length
+
+    def close(self):
+        """Unmaps the file and closes it"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class ReadAheadReader:
+    """
+    File-like wrapper which prefetches chunks of "source_object" on a background thread.
+
+    Reading from disk then overlaps with sending the previously read chunks. At most "depth" chunks, and never more
+    than "max_bytes" bytes, are buffered ahead of the reader, so a slow consumer cannot cause unbounded buffering.
+
+    Chunks are read at the size last requested from "read()"; errors raised by the source are re-raised by "read()".
+    The wrapper must be closed, which stops the background thread, before the source is closed.
+    """
+
+    def __init__(self, source_object: BinaryIO, depth: int = 4, max_bytes: int = constants.GrpcReadAheadBytesMaximum):
+        """
+        Args:
+            source_object (BinaryIO): Stream to read from
+            depth (int): Maximum number of chunks to buffer ahead of the reader
+            max_bytes (int): Maximum number of bytes to buffer ahead of the reader; capped at
+                "GrpcReadAheadBytesMaximum"
+        """
+        if source_object is None:
+            raise Exception("Source object must be initialized with a non-null BinaryIO instance")
+
+        if depth < 1:
+            raise Exception("Read ahead depth must be at least 1, found: " + str(depth))
+
+        self._source = source_object
+        self._depth = depth
+        self._max_bytes = min(max_bytes, constants.GrpcReadAheadBytesMaximum)
+        self._read_size = None
+        self._buffer = collections.deque()
+        self._buffered_bytes = 0
+        self._pending = b''
+        self._condition = threading.Condition()
+        self._done = False
+        self._closed = False
+        self._error = None
+        self._thread = None
+
+    def _produce(self):
+        try:
+            while True:
+                with self._condition:
+                    while (not self._closed) and (len(self._buffer) > 0) and (
+                            (len(self._buffer) >= self._depth) or (
+                            self._buffered_bytes + self._read_size > self._max_bytes)):
+                        self._condition.wait()
+
+                    if self._closed:
+                        return
+
+                    size = self._read_size
+
+                data = self._source.read(size)
+
+                with self._condition:
+                    if not data:
+                        return
+
+                    self._buffer.append(data)
+                    self._buffered_bytes += len(data)
+                    self._condition.notify_all()
+        except Exception as e:
+            with self._condition:
+                self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads the next prefetched chunk, or at most "size" bytes of it
+
+        Args:
+            size (int): Maximum number of bytes to read; the next whole chunk if negative
+
+        Returns:
+            bytes read, empty once the end of the source has been reached
+        """
+        if self._closed:
+            raise Exception("Read ahead reader is closed")
+
+        if (size is None) or (size < 0):
+            size = constants.GrpcChunkSizeDefault
+
+        with self._condition:
+            self._read_size = size
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._produce, daemon=True)
+                self._thread.start()
+
+            if len(self._pending) == 0:
+                while (len(self._buffer) == 0) and (not self._done):
+                    self._condition.wait()
+
+                if len(self._buffer) == 0:
+                    if self._error is not None:
+                        raise self._error
+                    return b''
+
+                self._pending = self._buffer.popleft()
+                self._buffered_bytes -= len(self._pending)
+                self._condition.notify_all()
+
+            data = self._pending[:size]
+            self._pending = self._pending[size:]
+
+            return data
+
+    def close(self):
+        """Stops prefetching and waits for the background thread; the wrapped source is left open"""
+        with self._condition:
+            self._closed = True
+            self._buffer.clear()
+            self._buffered_bytes = 0
+            self._pending = b''
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class WriteBehindWriter:
+    """
+    File-like wrapper which writes to "dest_object" on a background thread.
+
+    Receiving the next chunk then overlaps with writing the previous ones. At most "depth" chunks, and never more than
+    "max_bytes" bytes, are queued behind the writer; once the queue is full "write()" blocks, so a slow destination
+    throttles the stream rather than causing unbounded buffering.
+
+    Errors raised by the destination are re-raised by the next "write()", or by "close()", which waits for all queued
+    chunks to be written. The wrapper must be closed before the destination is closed.
+    """
+
+    def __init__(self, dest_object: BinaryIO, depth: int = 4,
+                 max_bytes: int = constants.GrpcWriteBehindBytesMaximum):
+        """
+        Args:
+            dest_object (BinaryIO): Stream to write to
+            depth (int): Maximum number of chunks to queue behind the writer
+            max_bytes (int): Maximum number of bytes to queue behind the writer; capped at
+                "GrpcWriteBehindBytesMaximum"
+        """
+        if dest_object is None:
+            raise Exception("Destination object must be initialized with a non-null BinaryIO instance")
+
+        if depth < 1:
+            raise Exception("Write behind depth must be at least 1, found: " + str(depth))
+
+        self._dest = dest_object
+        self._depth = depth
+        self._max_bytes = min(max_bytes, constants.GrpcWriteBehindBytesMaximum)
+        self._buffer = collections.deque()
+        self._buffered_bytes = 0
+        self._condition = threading.Condition()
+        self._closing = False
+        self._closed = False
+        self._error = None
+        self._thread = None
+
+    def _consume(self):
+        try:
+            while True:
+                with self._condition:
+                    while (len(self._buffer) == 0) and (not self._closing):
+                        self._condition.wait()
+
+                    if len(self._buffer) == 0:
+                        return
+
+                    data = self._buffer[0]
+
+                self._dest.write(data)
+
+                with self._condition:
+                    self._buffer.popleft()
+                    self._buffered_bytes -= len(data)
+                    self._condition.notify_all()
+        except Exception as e:
+            with self._condition:
+                self._error = e
+                self._buffer.clear()
+                self._buffered_bytes = 0
+        finally:
+            with self._condition:
+                self._closing = True
+                self._condition.notify_all()
+
+    def write(self, data) -> int:
+        """
+        Queues "data" to be written, blocking while the queue is full
+
+        Args:
+            data: bytes-like object to write; it must not be modified until written
+
+        Returns:
+            number of bytes queued
+        """
+        if self._closed:
+            raise Exception("Write behind writer is closed")
+
+        length = len(data)
+
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._consume, daemon=True)
+                self._thread.start()
+
+            while (self._error is None) and (not self._closing) and (len(self._buffer) > 0) and (
+                    (len(self._buffer) >= self._depth) or (self._buffered_bytes + length > self._max_bytes)):
+                self._condition.wait()
+
+            if self._error is not None:
+                raise self._error
+
+            self._buffer.append(data)
+            self._buffered_bytes += length
+            self._condition.notify_all()
+
+        return length
+
+    def close(self):
+        """Waits for all queued chunks to be written and stops the background thread; the destination is left open"""
+        if self._closed:
+            return
+
+        self._closed = True
+
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class TransferCheckpoint:
+    """
+    Progress of the transfers of the blobs of a payload, kept in a local JSON file so an interrupted transfer can be
+    resumed by a later process.
+
+    For each blob the checkpoint records its name, as reported by the server, its size and mode, and the number of
+    bytes confirmed: written to disk for downloads, acknowledged by the server for uploads. A checkpoint file left by
+    the transfer of another payload is ignored, and overwritten on the next save.
+
+    The checkpoint is safe to share between the threads of concurrent transfers.
+    """
+
+    def __init__(self, checkpoint_path: str, payload_id: str):
+        """
+        Args:
+            checkpoint_path (str): Path of the JSON checkpoint file; loaded if it exists
+            payload_id (str): Unique identifier of the payload the transfers belong to
+        """
+        if (checkpoint_path is None) or (checkpoint_path == ""):
+            raise Exception("Checkpoint path must be initialized with non-null string")
+
+        self._checkpoint_path = checkpoint_path
+        self._payload_id = payload_id
+        self._blobs = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r') as checkpoint_file:
+                state = json.load(checkpoint_file)
+
+            if state.get('payload_id') == payload_id:
+                self._blobs = state.get('blobs', {})
+
+    @property
+    def checkpoint_path(self) -> str:
+        """Path of the JSON checkpoint file."""
+        return self._checkpoint_path
+
+    @property
+    def payload_id(self) -> str:
+        """Unique identifier of the payload the transfers belong to."""
+        return self._payload_id
+
+    def get(self, blob_name: str):
+        """
+        Returns the progress recorded for a blob
+
+        Args:
+            blob_name (str): The name, or path, of the blob in the payload, as passed to the transfer
+
+        Returns:
+            dict with the "name", "size", "mode" and "confirmed" bytes of the blob, or None if nothing is recorded
+        """
+        with self._lock:
+            progress = self._blobs.get(blob_name)
+            return dict(progress) if progress is not None else None
+
+    def confirm(self, blob_name: str, name: str, size: int, mode: int, confirmed: int, save: bool = True):
+        """
+        Records the progress of a blob
+
+        Args:
+            blob_name (str): The name, or path, of the blob in the payload, as passed to the transfer
+            name (str): The name of the blob as reported by the server
+            size (int): Size, in bytes, of the blob
+            mode (int): Mode of the blob
+            confirmed (int): Number of bytes of the blob confirmed so far
+            save (bool): If True, the checkpoint file is saved; otherwise the progress is kept until the next save
+        """
+        with self._lock:
+            self._blobs[blob_name] = {'name': name, 'size': size, 'mode': mode, 'confirmed': confirmed}
+
+            if save:
+                self._save()
+
+    def is_complete(self, blob_name: str, size: int) -> bool:
+        """
+        Returns True if every byte of a blob of "size" bytes has been confirmed
+
+        Args:
+            blob_name (str): The name, or path, of the blob in the payload, as passed to the transfer
+            size (int): Expected size, in bytes, of the blob
+        """
+        progress = self.get(blob_name)
+        return (progress is not None) and (progress['size'] == size) and (progress['confirmed'] == size)
+
+    def save(self):
+        """Saves the checkpoint file"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        # Written aside and renamed over the checkpoint, so an interruption never leaves a truncated checkpoint
+        temp_path = self._checkpoint_path + '.tmp'
+
+        with open(temp_path, 'w') as checkpoint_file:
+            json.dump({'payload_id': self._payload_id, 'blobs': self._blobs}, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+
+        os.replace(temp_path, self._checkpoint_path)
+
+
+def read_chunks(source_object: BinaryIO, chunk_size: int = constants.GrpcChunkSizeDefault,
+                adaptive: AdaptiveChunkSize = None) -> Iterator[bytes]:
+    """
+    Creates generator of chunks read from "source_object"
+
+    Args:
+        source_object (BinaryIO): Stream to read from
+        chunk_size (int): Size, in bytes, of each chunk
+        adaptive (AdaptiveChunkSize): If specified, chunk sizes are taken from, and timings reported to, "adaptive"
+    """
+    last = time.perf_counter()
+
+    while True:
+        size = chunk_size if adaptive is None else adaptive.size
+        data = source_object.read(size)
+
+        if not data:
+            return
+
+        yield data
+
+        if adaptive is not None:
+            now = time.perf_counter()
+            adaptive.record(len(data), now - last)
+            last = now
+
+
+def fill_chunks(buffer: bytearray, data, chunk_size: int) -> Iterator[bytes]:
+    """
+    Appends "data" to the partial chunk held in "buffer", yielding each chunk of "chunk_size" bytes completed
+
+    Bytes left over after the last complete chunk stay in "buffer". A "bytes" object of exactly "chunk_size" bytes
+    arriving on an empty buffer is yielded as is, without being copied.
+
+    Args:
+        buffer (bytearray): Partial chunk carried over between calls
+        data: bytes-like object to append (ex. bytes, bytearray, memoryview or numpy array)
+        chunk_size (int): Size, in bytes, of each chunk
+    """
+    if (len(buffer) == 0) and (type(data) is bytes) and (len(data) == chunk_size):
+        yield data
+        return
+
+    view = memoryview(data).cast('B')
+    offset = 0
+
+    if len(buffer) > 0:
+        offset = min(chunk_size - len(buffer), len(view))
+        buffer += view[:offset]
+
+        if len(buffer) < chunk_size:
+            return
+
+        yield bytes(buffer)
+        buffer.clear()
+
+    while len(view) - offset >= chunk_size:
+        yield bytes(view[offset:offset + chunk_size])
+        offset += chunk_size
+
+    buffer += view[offset:]
+
+
+def rechunk(chunks: Iterable, chunk_size: int = constants.GrpcChunkSizeDefault) -> Iterator[bytes]:
+    """
+    Creates generator of chunks of "chunk_size" bytes, the last one possibly smaller, from pieces of data of any size
+
+    Args:
+        chunks (Iterable): Iterable of bytes-like objects (ex. bytes, bytearray, memoryview or numpy array)
+        chunk_size (int): Size, in bytes, of each chunk
+    """
+    buffer = bytearray()
+
+    for data in chunks:
+        yield from fill_chunks(buffer, data, chunk_size)
+
+    if len(buffer) > 0:
+        yield bytes(buffer)
+
+
+def hash_file(file_path: str, chunk_size: int = constants.GrpcChunkSizeMaximum) -> str:
+    """
+    Computes the SHA-256 digest of the content of a file
+
+    Args:
+        file_path (str): Path of the file to hash
+        chunk_size (int): Size, in bytes, of the chunks the file is read in
+
+    Returns:
+        Hexadecimal SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+
+    with open(file_path, 'rb') as file_object:
+        for data in read_chunks(file_object, chunk_size=chunk_size):
+            digest.update(data)
+
+    return digest.hexdigest()
@@ -0,0 +1,194 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Compares the wall time of PayloadsClient.upload and download_from, with and without gRPC message compression, over a
+bandwidth-limited link.
+
+A local Payloads server is reached through a TCP proxy throttling each direction to "--mbps" megabits per second. The
+blob is synthetic with 4 bits of entropy per byte, compressing about 2x like raw DICOM and NIfTI volumes; pass "--file"
+to use a real volume instead. Upload compression is chosen by the client per call; download compression is chosen by
+the server, so downloads are compared with the server compressing its responses or not.
+
+gzip and deflate run at roughly 10-20 MB/s per stream, so compression only pays off on links slower than that.
+
+Usage:
+    python tests/benchmarks/bench_compression.py [--size-mb 16] [--mbps 20] [--file volume.nii]
+"""
+
+import argparse
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+from nvidia_clara.grpc import common_pb2, payloads_pb2, payloads_pb2_grpc
+from nvidia_clara.payloads_client import PayloadsClient
+import nvidia_clara.payload_types as payload_types
+
+PAYLOAD_ID = '7ac5c691e13d4f45894a3a70d9925936'
+BLOB_NAME = './input/volume.raw'
+
+
+class PayloadsServicer(payloads_pb2_grpc.PayloadsServicer):
+
+    def __init__(self, download_compression):
+        self.blobs = {}
+        self.download_compression = download_compression
+
+    def Upload(self, request_iterator, context):
+        name = None
+        chunks = []
+
+        for request in request_iterator:
+            name = request.details.name
+            chunks.append(request.data)
+
+        self.blobs[name] = b''.join(chunks)
+
+        return payloads_pb2.PayloadsUploadResponse(
+            header=common_pb2.ResponseHeader(code=0),
+            details=payloads_pb2.PayloadFileDetails(name=name, size=len(self.blobs[name])))
+
+    def Download(self, request, context):
+        context.set_compression(self.download_compression)
+
+        data = self.blobs[request.name]
+        details = payloads_pb2.PayloadFileDetails(name=request.name, size=len(data))
+
+        for offset in range(0, max(len(data), 1), 1024 * 1024):
+            yield payloads_pb2.PayloadsDownloadResponse(
+                header=common_pb2.ResponseHeader(code=0), details=details, data=data[offset:offset + 1024 * 1024])
+
+
+class ThrottledProxy:
+    """Relays TCP connections to "target_port", throttling each direction to "bytes_per_second"."""
+
+    def __init__(self, target_port, bytes_per_second):
+        self.target_port = target_port
+        self.bytes_per_second = bytes_per_second
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen()
+        self.port = self.listener.getsockname()[1]
+
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self):
+        while True:
+            client, _ = self.listener.accept()
+            upstream = socket.create_connection(('127.0.0.1', self.target_port))
+
+            for source, dest in ((client, upstream), (upstream, client)):
+                threading.Thread(target=self.relay, args=(source, dest), daemon=True).start()
+
+    def relay(self, source, dest):
+        start = time.perf_counter()
+        sent = 0
+
+        try:
+            while True:
+                data = source.recv(16 * 1024)
+
+                if not data:
+                    break
+
+                sent += len(data)
+                delay = sent / self.bytes_per_second - (time.perf_counter() - start)
+
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Idle periods do not bank bandwidth for later bursts
+                    start = time.perf_counter() - sent / self.bytes_per_second
+
+                dest.sendall(data)
+        except OSError:
+            pass
+        finally:
+            dest.close()
+
+
+def create_blob(file_path, size):
+    if file_path is not None:
+        with open(file_path, 'rb') as fp:
+            return fp.read()
+
+    # Keep the low 4 bits of each random byte
+    return os.urandom(size).translate(bytes(value & 0x0F for value in range(256)))
+
+
+def run(data, mbps, compression, download_compression):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4),
+                         options=[('grpc.max_receive_message_length', -1)])
+    payloads_pb2_grpc.add_PayloadsServicer_to_server(PayloadsServicer(download_compression), server)
+    server_port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+
+    proxy = ThrottledProxy(server_port, mbps * 1000 * 1000 / 8)
+
+    temp_dir = tempfile.TemporaryDirectory()
+    upload_path = os.path.join(temp_dir.name, 'upload.raw')
+    download_path = os.path.join(temp_dir.name, 'download.raw')
+
+    with open(upload_path, 'wb') as fp:
+        fp.write(data)
+
+    try:
+        with PayloadsClient(target='127.0.0.1', port=str(proxy.port)) as client:
+            payload_id = payload_types.PayloadId(PAYLOAD_ID)
+
+            start = time.perf_counter()
+            client.upload(payload_id=payload_id, blob_name=BLOB_NAME, file_path=upload_path, compression=compression)
+            upload_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            client.download_from(payload_id=payload_id, blob_name=BLOB_NAME, dest_path=download_path)
+            download_seconds = time.perf_counter() - start
+
+        with open(download_path, 'rb') as fp:
+            assert fp.read() == data
+    finally:
+        server.stop(None)
+        temp_dir.cleanup()
+
+    return upload_seconds, download_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, default=16)
+    parser.add_argument('--mbps', type=float, default=20)
+    parser.add_argument('--file', help='Use the content of this file as blob')
+    args = parser.parse_args()
+
+    data = create_blob(args.file, args.size_mb * 1024 * 1024)
+
+    print("blob_mb=%.1f link_mbps=%.0f" % (len(data) / 2 ** 20, args.mbps))
+
+    for name, compression in (('none', grpc.Compression.NoCompression), ('gzip', grpc.Compression.Gzip),
+                              ('deflate', grpc.Compression.Deflate)):
+        upload_seconds, download_seconds = run(data, args.mbps, compression, compression)
+
+        print("%-8s upload_seconds=%.2f download_seconds=%.2f" % (name, upload_seconds, download_seconds))
+
+
+if __name__ == '__main__':
+    main()
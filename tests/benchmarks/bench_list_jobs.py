@@ -0,0 +1,152 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Compares JobsClient.list_jobs, stream_jobs and list_jobs_lazy over a long job history: time to first job, time to
+list every job, time to then read the identifier and state of every job, and Python memory held once the jobs are
+listed and at its peak, after they are read.
+
+A local Jobs server streams "--jobs" synthetic jobs, each with three timestamps and some metadata. Memory is measured
+with tracemalloc in a separate pass, as tracing slows allocation down. "stream_jobs" does not hold the jobs, they are
+read while listed.
+
+With the pure Python protobuf runtime, listing 100000 jobs takes tens of seconds per pass.
+
+Usage:
+    python tests/benchmarks/bench_list_jobs.py [--jobs 20000]
+"""
+
+import argparse
+import time
+import tracemalloc
+import uuid
+from concurrent import futures
+
+import grpc
+
+from nvidia_clara.grpc import common_pb2, jobs_pb2, jobs_pb2_grpc
+from nvidia_clara.jobs_client import JobsClient
+
+
+class JobsServicer(jobs_pb2_grpc.JobsServicer):
+
+    def __init__(self, count):
+        pipeline_id = common_pb2.Identifier(value=uuid.uuid4().hex)
+
+        self.responses = [
+            jobs_pb2.JobsListResponse(
+                header=common_pb2.ResponseHeader(code=0),
+                job_details=jobs_pb2.JobsListResponse.JobDetails(
+                    job_id=common_pb2.Identifier(value=uuid.uuid4().hex),
+                    job_name='job_' + str(index),
+                    payload_id=common_pb2.Identifier(value=uuid.uuid4().hex),
+                    pipeline_id=pipeline_id,
+                    state=jobs_pb2.JOB_STATE_STOPPED,
+                    status=jobs_pb2.JOB_STATUS_HEALTHY,
+                    priority=jobs_pb2.JOB_PRIORITY_NORMAL,
+                    created=common_pb2.Timestamp(value=63750823591 + index),
+                    started=common_pb2.Timestamp(value=63750823601 + index),
+                    stopped=common_pb2.Timestamp(value=63750823661 + index),
+                    metadata={'study': str(index)}))
+            for index in range(count)]
+
+    def List(self, request, context):
+        for response in self.responses:
+            yield response
+
+
+def list_jobs(client):
+    jobs = client.list_jobs()
+    return jobs[0], jobs
+
+
+def stream_jobs(client):
+    jobs = client.stream_jobs()
+    return next(jobs), jobs
+
+
+def list_jobs_lazy(client):
+    jobs = client.list_jobs_lazy()
+    return jobs[0], jobs
+
+
+def run(client, method, trace):
+    held_bytes = 0
+
+    if trace:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    first, jobs = method(client)
+    first_seconds = time.perf_counter() - start
+
+    if method is stream_jobs:
+        # Jobs are not held, they are read while listed
+        states = [(first.job_id.value, first.job_state)] + [(job.job_id.value, job.job_state) for job in jobs]
+        count = len(states)
+        list_seconds = time.perf_counter() - start
+        read_seconds = 0.0
+    else:
+        count = len(jobs)
+        list_seconds = time.perf_counter() - start
+
+        if trace:
+            held_bytes = tracemalloc.get_traced_memory()[0]
+
+        read_start = time.perf_counter()
+        states = [(job.job_id.value, job.job_state) for job in jobs]
+        read_seconds = time.perf_counter() - read_start
+
+    peak_bytes = 0
+
+    if trace:
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        held_bytes = held_bytes or peak_bytes
+        tracemalloc.stop()
+
+    del first, jobs, states
+
+    return count, first_seconds, list_seconds, read_seconds, held_bytes, peak_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=20000)
+    args = parser.parse_args()
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    jobs_pb2_grpc.add_JobsServicer_to_server(JobsServicer(args.jobs), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+
+    print("jobs=%d" % args.jobs)
+
+    try:
+        with JobsClient(target='127.0.0.1', port=str(port)) as client:
+            for name, method in (('list_jobs', list_jobs), ('stream_jobs', stream_jobs),
+                                 ('list_jobs_lazy', list_jobs_lazy)):
+                count, first_seconds, list_seconds, read_seconds, _, _ = run(client, method, False)
+                _, _, _, _, held_bytes, peak_bytes = run(client, method, True)
+
+                assert count == args.jobs
+
+                print("%-14s first_job_seconds=%.4f list_seconds=%.2f read_seconds=%.2f listed_mb=%.0f peak_mb=%.0f" % (
+                    name, first_seconds, list_seconds, read_seconds, held_bytes / 2 ** 20, peak_bytes / 2 ** 20))
+    finally:
+        server.stop(None)
+
+
+if __name__ == '__main__':
+    main()
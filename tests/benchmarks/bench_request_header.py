@@ -0,0 +1,78 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures PayloadsUploadRequest generation rate with a request header built per message (previous behavior) and with
+the shared header used by PayloadsClient.upload_request_iterator.
+
+Usage:
+    python tests/benchmarks/bench_request_header.py [--messages 200000] [--chunk-size 1024]
+"""
+
+import argparse
+import io
+import time
+
+from nvidia_clara.grpc import payloads_pb2
+from nvidia_clara.base_client import BaseClient
+from nvidia_clara.payloads_client import PayloadsClient
+import nvidia_clara.payload_types as payload_types
+import nvidia_clara.transfer_tools as transfer_tools
+
+
+def per_message_header(payload_id, file_name, source_object, chunk_size):
+    for data in transfer_tools.read_chunks(source_object, chunk_size=chunk_size):
+        details = payloads_pb2.PayloadFileDetails(mode=0, name=file_name, size=len(data))
+        yield payloads_pb2.PayloadsUploadRequest(
+            header=BaseClient.create_request_header(),
+            payload_id=payload_id.to_grpc_value(),
+            details=details,
+            data=data
+        )
+
+
+def measure(name, requests, serialize):
+    start = time.perf_counter()
+    messages = 0
+
+    for request in requests:
+        if serialize:
+            request.SerializeToString()
+        messages += 1
+
+    elapsed = time.perf_counter() - start
+    print("%-20s serialize=%-5s messages=%d messages_per_second=%.0f" % (name, serialize, messages,
+                                                                       messages / elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--messages', type=int, default=200000)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    client = PayloadsClient(target='localhost:50051', stub=object())
+    payload_id = payload_types.PayloadId('7ac5c691e13d4f45894a3a70d9925936')
+    data = b'x' * (args.messages * args.chunk_size)
+
+    for serialize in (False, True):
+        measure('per-message header', per_message_header(payload_id, './input/image.raw', io.BytesIO(data),
+                                                         args.chunk_size), serialize)
+        measure('shared header', client.upload_request_iterator(payload_id=payload_id, file_name='./input/image.raw',
+                                                                source_object=io.BytesIO(data),
+                                                                chunk_size=args.chunk_size), serialize)
+
+
+if __name__ == '__main__':
+    main()
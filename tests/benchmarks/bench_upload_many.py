@@ -0,0 +1,117 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Compares the files per second of uploading many small files, as DICOM slices, one "PayloadsClient.upload" call at a
+time like the loop of examples/combined_example.py, with "upload_many" and its concurrent, largest first, streams.
+
+A local Payloads server accepts the uploads; "--latency-ms" is added to each call on the server side to stand for the
+round trip and storage commit of a remote Clara instance, which is where per-call overhead comes from. Each blob is
+still uploaded over its own "Upload" call, as an upload stream carries a single blob.
+
+Usage:
+    python tests/benchmarks/bench_upload_many.py [--files 500] [--size-kb 500] [--latency-ms 5] [--parallel 8]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent import futures
+
+import grpc
+
+from nvidia_clara.grpc import common_pb2, payloads_pb2, payloads_pb2_grpc
+from nvidia_clara.payloads_client import PayloadsClient
+import nvidia_clara.payload_types as payload_types
+
+PAYLOAD_ID = '7ac5c691e13d4f45894a3a70d9925936'
+
+
+class PayloadsServicer(payloads_pb2_grpc.PayloadsServicer):
+
+    def __init__(self, latency_seconds):
+        self.latency_seconds = latency_seconds
+
+    def Upload(self, request_iterator, context):
+        name = None
+        size = 0
+
+        for request in request_iterator:
+            name = request.details.name
+            size += len(request.data)
+
+        time.sleep(self.latency_seconds)
+
+        return payloads_pb2.PayloadsUploadResponse(
+            header=common_pb2.ResponseHeader(code=0),
+            details=payloads_pb2.PayloadFileDetails(name='/' + name, size=size))
+
+
+def upload_loop(client, payload_id, files, parallel_streams):
+    for blob_name, file_path in files.items():
+        with open(file_path, 'rb') as fp:
+            client.upload(payload_id=payload_id, blob_name=blob_name, file_object=fp)
+
+
+def upload_many(client, payload_id, files, parallel_streams):
+    client.upload_many(payload_id=payload_id, files=files, parallel_streams=parallel_streams)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=500)
+    parser.add_argument('--size-kb', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=5)
+    parser.add_argument('--parallel', type=int, default=8)
+    args = parser.parse_args()
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2 * args.parallel))
+    payloads_pb2_grpc.add_PayloadsServicer_to_server(PayloadsServicer(args.latency_ms / 1000), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+
+    temp_dir = tempfile.TemporaryDirectory()
+    files = {}
+
+    # Slices of slightly different sizes, as compressed DICOM files are
+    for index in range(args.files):
+        file_path = os.path.join(temp_dir.name, 'slice%05d.dcm' % index)
+
+        with open(file_path, 'wb') as fp:
+            fp.write(os.urandom(args.size_kb * 1024 - (index % 64) * 256))
+
+        files['slice%05d.dcm' % index] = file_path
+
+    print("files=%d size_kb=%d latency_ms=%.1f parallel=%d" % (args.files, args.size_kb, args.latency_ms,
+                                                               args.parallel))
+
+    try:
+        with PayloadsClient(target='127.0.0.1', port=str(port)) as client:
+            payload_id = payload_types.PayloadId(PAYLOAD_ID)
+
+            for name, method in (('loop', upload_loop), ('upload_many', upload_many)):
+                start = time.perf_counter()
+                method(client, payload_id, files, args.parallel)
+                seconds = time.perf_counter() - start
+
+                print("%-12s seconds=%.2f files_per_second=%.0f" % (name, seconds, args.files / seconds))
+    finally:
+        server.stop(None)
+        temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import io
+
+import grpc.aio
+
+import nvidia_clara.grpc.common_pb2 as common_pb2
+import nvidia_clara.grpc.clara_pb2 as clara_pb2
+import nvidia_clara.grpc.clara_pb2_grpc as clara_pb2_grpc
+import nvidia_clara.grpc.jobs_pb2 as jobs_pb2
+import nvidia_clara.grpc.jobs_pb2_grpc as jobs_pb2_grpc
+import nvidia_clara.grpc.payloads_pb2 as payloads_pb2
+import nvidia_clara.grpc.payloads_pb2_grpc as payloads_pb2_grpc
+
+from nvidia_clara.aio import ClaraClient, JobsClient, PayloadsClient
+import nvidia_clara.job_types as job_types
+import nvidia_clara.pipeline_types as pipeline_types
+import nvidia_clara.payload_types as payload_types
+
+
+class JobsServicer(jobs_pb2_grpc.JobsServicer):
+
+    async def List(self, request, context):
+        for job_id, state in [('432b274a8f754968888807fe1eba237b', 2), ('532b274a8f754968888807fe1eba237b', 3)]:
+            yield jobs_pb2.JobsListResponse(
+                header=common_pb2.ResponseHeader(code=0, messages=[]),
+                job_details=jobs_pb2.JobsListResponse.JobDetails(
+                    job_id=common_pb2.Identifier(value=job_id),
+                    job_name='job_' + job_id[0],
+                    payload_id=common_pb2.Identifier(value='7ac5c691e13d4f45894a3a70d9925936'),
+                    pipeline_id=common_pb2.Identifier(value=list(request.filter.pipeline_id)[0].value),
+                    state=state,
+                    created=common_pb2.Timestamp(value=63750823591)
+                )
+            )
+
+
+class PayloadsServicer(payloads_pb2_grpc.PayloadsServicer):
+
+    def __init__(self):
+        self.blobs = {}
+        self.chunk_sizes = {}
+
+    async def Upload(self, request_iterator, context):
+        name = None
+        data = b''
+        chunk_sizes = []
+
+        async for request in request_iterator:
+            name = request.details.name
+            data += request.data
+            chunk_sizes.append(len(request.data))
+
+        self.blobs[name] = data
+        self.chunk_sizes[name] = chunk_sizes
+
+        return payloads_pb2.PayloadsUploadResponse(
+            header=common_pb2.ResponseHeader(code=0, messages=[]),
+            details=payloads_pb2.PayloadFileDetails(mode=0, name=name, size=len(data))
+        )
+
+    async def Download(self, request, context):
+        data = self.blobs[request.name]
+
+        for offset in range(0, len(data), 1024):
+            yield payloads_pb2.PayloadsDownloadResponse(
+                header=common_pb2.ResponseHeader(code=0, messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=request.name, size=len(data)),
+                data=data[offset:offset + 1024]
+            )
+
+
+class ClaraServicer(clara_pb2_grpc.ClaraServicer):
+
+    async def Utilization(self, request, context):
+        for _ in range(3):
+            yield clara_pb2.ClaraUtilizationResponse(
+                header=common_pb2.ResponseHeader(code=0, messages=[]),
+                gpu_metrics=[clara_pb2.ClaraUtilizationResponse.GpuUtilization(
+                    node_id='1',
+                    pcie_id=1,
+                    process_details=[
+                        clara_pb2.ClaraUtilizationResponse.GpuUtilization.ProcessDetails(name='triton')
+                    ]
+                )]
+            )
+
+
+async def run_with_server(test):
+    server = grpc.aio.server()
+    payloads_servicer = PayloadsServicer()
+    jobs_pb2_grpc.add_JobsServicer_to_server(JobsServicer(), server)
+    payloads_pb2_grpc.add_PayloadsServicer_to_server(payloads_servicer, server)
+    clara_pb2_grpc.add_ClaraServicer_to_server(ClaraServicer(), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+
+    try:
+        await test('127.0.0.1', str(port), payloads_servicer)
+    finally:
+        await server.stop(None)
+
+
+def test_aio_stream_jobs():
+    async def test(target, port, servicer):
+        async with JobsClient(target=target, port=port) as client:
+            job_filter = job_types.JobFilter(pipeline_ids=[pipeline_types.PipelineId('92656d79fa414db6b294069c0e9e6df5')])
+
+            jobs = [job async for job in client.stream_jobs(job_filter=job_filter)]
+
+            assert [job.job_id.value for job in jobs] == ['432b274a8f754968888807fe1eba237b',
+                                                          '532b274a8f754968888807fe1eba237b']
+            assert jobs[0].pipeline_id.value == '92656d79fa414db6b294069c0e9e6df5'
+            assert jobs[0].date_created is not None
+
+            # Many calls in flight on one event loop over the client's single channel
+            results = await asyncio.gather(*[client.list_jobs(job_filter=job_filter) for _ in range(50)])
+            assert all(len(result) == 2 for result in results)
+
+    asyncio.run(run_with_server(test))
+
+
+def test_aio_upload_download():
+    async def test(target, port, servicer):
+        data = bytes(range(256)) * 20
+
+        class AsyncSource:
+
+            def __init__(self, source):
+                self._source = io.BytesIO(source)
+
+            async def read(self, size):
+                return self._source.read(size)
+
+        async with PayloadsClient(target=target, port=port, chunk_size=1024) as client:
+            payload_id = payload_types.PayloadId('92656d79fa414db6b294069c0e9e6df5')
+
+            details = await client.upload(payload_id, 'async.bin', file_object=AsyncSource(data))
+            assert details.size == len(data)
+
+            details = await client.upload(payload_id, 'sync.bin', file_object=io.BytesIO(data))
+            assert details.size == len(data)
+            assert servicer.blobs['sync.bin'] == servicer.blobs['async.bin'] == data
+
+            chunks = [chunk async for chunk in client.iter_download(payload_id, 'async.bin')]
+            assert len(chunks) == 5
+            assert b''.join(chunks) == data
+
+            dest = io.BytesIO()
+            details = await client.download_from(payload_id, 'sync.bin', dest_obj=dest)
+            assert details.name == 'sync.bin'
+            assert dest.getvalue() == data
+
+    asyncio.run(run_with_server(test))
+
+
+def test_aio_upload_stream():
+    async def test(target, port, servicer):
+        data = bytes(range(256)) * 10
+
+        async def produce():
+            for offset in range(0, len(data), 700):
+                await asyncio.sleep(0)
+                yield data[offset:offset + 700]
+
+        async with PayloadsClient(target=target, port=port, chunk_size=1024) as client:
+            payload_id = payload_types.PayloadId('92656d79fa414db6b294069c0e9e6df5')
+
+            details = await client.upload_stream(payload_id, 'stream.bin', produce())
+            assert details.size == len(data)
+            assert servicer.blobs['stream.bin'] == data
+            assert servicer.chunk_sizes['stream.bin'] == [1024, 1024, 512]
+
+            details = await client.upload_stream(payload_id, 'list.bin', [bytearray(data), memoryview(data)])
+            assert details.size == 2 * len(data)
+            assert servicer.blobs['list.bin'] == data + data
+
+    asyncio.run(run_with_server(test))
+
+
+def test_aio_stream_utilization():
+    async def test(target, port, servicer):
+        async with ClaraClient(target=target, port=port) as client:
+            utilization = [details async for details in client.stream_utilization()]
+
+            assert len(utilization) == 3
+            process_details = utilization[0].gpu_metrics[0].process_details[0]
+            assert process_details.name == 'triton'
+            assert process_details.job_id is None
+
+    asyncio.run(run_with_server(test))
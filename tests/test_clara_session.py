@@ -0,0 +1,88 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import grpc
+import pytest
+
+from nvidia_clara.base_client import ChannelOptions
+from nvidia_clara.clara_session import ClaraSession
+from nvidia_clara.jobs_client import JobsClient
+
+
+def test_session_round_robin_channels():
+    with ClaraSession(target='10.0.0.1', port='50051', pool_size=2) as session:
+        jobs_client = session.jobs_client()
+        payloads_client = session.payloads_client()
+        pipelines_client = session.pipelines_client()
+
+        assert jobs_client._channel is not payloads_client._channel
+        assert jobs_client._channel is pipelines_client._channel
+
+        # Closing a client leaves the shared channel open for the other clients
+        jobs_client.close()
+        assert jobs_client._channel is None
+        assert pipelines_client._channel is not None
+
+        models_client = session.models_client()
+        clara_client = session.clara_client()
+        assert models_client._channel is payloads_client._channel
+        assert clara_client._channel is pipelines_client._channel
+
+
+def test_session_close():
+    session = ClaraSession(target='10.0.0.1:50051')
+    assert session.pool_size == 1
+
+    session.close()
+
+    with pytest.raises(Exception):
+        session.jobs_client()
+
+
+def test_session_pool_size_validation():
+    with pytest.raises(Exception):
+        ClaraSession(target='10.0.0.1:50051', pool_size=0)
+
+
+def test_channel_options():
+    channel_options = ChannelOptions(
+        max_send_message_length=16 * 1024 * 1024,
+        keepalive_time_ms=30000,
+        keepalive_permit_without_calls=True,
+        http2_bdp_probe=False,
+        compression=grpc.Compression.Gzip,
+        options=[('grpc.primary_user_agent', 'test')]
+    )
+
+    assert channel_options.to_grpc_options() == [
+        ('grpc.max_send_message_length', 16 * 1024 * 1024),
+        ('grpc.keepalive_time_ms', 30000),
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.bdp_probe', 0),
+        ('grpc.primary_user_agent', 'test'),
+    ]
+
+    with ClaraSession(target='10.0.0.1:50051', pool_size=2, channel_options=channel_options) as session:
+        with session.jobs_client() as client:
+            assert client._channel is not None
+
+        # Every client handed out keeps the options for the channels it opens
+        clients = [session.jobs_client(), session.payloads_client(), session.pipelines_client(),
+                   session.models_client(), session.clara_client()]
+        assert all(client._channel_options is channel_options for client in clients)
+
+    with JobsClient(target='10.0.0.1:50051', channel_options=channel_options) as client:
+        client.close()
+        client.reconnect(channel_options=ChannelOptions(max_receive_message_length=1024))
+        assert client._channel is not None
@@ -0,0 +1,115 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+
+import pytest
+
+import nvidia_clara.job_types as job_types
+import nvidia_clara.payload_types as payload_types
+import nvidia_clara.pipeline_types as pipeline_types
+from nvidia_clara.job_submitter import JobSubmitter
+
+PIPELINE_ID = pipeline_types.PipelineId('932b274a8f754968888807fe1eba237b')
+
+
+class FakeJobsClient:
+
+    def __init__(self, failing_name=None):
+        self.created = []
+        self.started = []
+        self.failing_name = failing_name
+        self.lock = threading.Lock()
+
+    def create_job(self, pipeline_id, job_name, input_payloads=None, job_priority=job_types.JobPriority.Normal,
+                   metadata=None, timeout=None):
+        if job_name == self.failing_name:
+            raise Exception('Create failed')
+
+        with self.lock:
+            self.created.append(job_name)
+
+        return job_types.JobInfo(job_id=job_types.JobId('job_' + job_name), job_priority=job_priority,
+                                 payload_id=payload_types.PayloadId('payload_' + job_name), pipeline_id=pipeline_id,
+                                 name=job_name)
+
+    def start_job(self, job_id, named_values=None, timeout=None):
+        with self.lock:
+            self.started.append(job_id)
+
+        return job_types.JobToken(job_id=job_id, job_state=job_types.JobState.Pending,
+                                  job_status=job_types.JobStatus.Healthy)
+
+
+class FakePayloadsClient:
+
+    def __init__(self):
+        self.uploaded = {}
+
+    def upload_many(self, payload_id, files, parallel_streams=None, timeout=None):
+        self.uploaded[payload_id.value] = sorted(files.keys())
+        return payload_types.PayloadTransferStats()
+
+
+def test_submit_many(tmp_path):
+    (tmp_path / 'image.dcm').write_bytes(b'dicom')
+
+    submissions = [
+        job_types.JobSubmission(PIPELINE_ID, 'lower', job_priority=job_types.JobPriority.Lower,
+                                input_files={'image.dcm': str(tmp_path / 'image.dcm')}),
+        job_types.JobSubmission(PIPELINE_ID, 'immediate', job_priority=job_types.JobPriority.Immediate),
+        job_types.JobSubmission(PIPELINE_ID, 'normal'),
+    ]
+
+    jobs_client = FakeJobsClient()
+    payloads_client = FakePayloadsClient()
+    submitter = JobSubmitter(jobs_client, payloads_client, create_concurrency=1, upload_concurrency=1,
+                             start_concurrency=1)
+
+    job_tokens = list(submitter.submit_many(submissions))
+
+    # Higher priorities are created first
+    assert jobs_client.created == ['immediate', 'normal', 'lower']
+    assert sorted(job_token.job_id.value for job_token in job_tokens) == ['job_immediate', 'job_lower', 'job_normal']
+    assert payloads_client.uploaded == {'payload_lower': ['image.dcm']}
+
+    stats = submitter.stage_stats
+    assert stats[JobSubmitter.STAGE_CREATE].count == 3
+    assert stats[JobSubmitter.STAGE_UPLOAD].count == 1
+    assert stats[JobSubmitter.STAGE_START].count == 3
+    assert stats[JobSubmitter.STAGE_START].percentile(100) >= stats[JobSubmitter.STAGE_START].mean_seconds
+
+
+def test_submit_many_failure():
+    submissions = [job_types.JobSubmission(PIPELINE_ID, name) for name in ['a', 'b', 'c', 'd']]
+
+    jobs_client = FakeJobsClient(failing_name='b')
+    submitter = JobSubmitter(jobs_client, FakePayloadsClient(), create_concurrency=1, start_concurrency=1)
+
+    with pytest.raises(Exception):
+        list(submitter.submit_many(submissions))
+
+    # No job is created once a stage failed
+    assert jobs_client.created == ['a']
+
+
+def test_stage_stats():
+    stats = job_types.JobStageStats(JobSubmitter.STAGE_CREATE, latencies=[0.5, 0.1, 0.3, 0.2, 0.4])
+
+    assert stats.count == 5
+    assert stats.mean_seconds == pytest.approx(0.3)
+    assert stats.percentile(50) == 0.3
+    assert stats.percentile(95) == 0.5
+    assert job_types.JobStageStats(JobSubmitter.STAGE_START).percentile(50) == 0.0
@@ -0,0 +1,212 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import datetime
+import threading
+
+import pytest
+
+import nvidia_clara.constants as constants
+import nvidia_clara.job_types as job_types
+import nvidia_clara.pipeline_types as pipeline_types
+from nvidia_clara.job_watcher import JobWatcher
+
+PIPELINE_ID = pipeline_types.PipelineId('932b274a8f754968888807fe1eba237b')
+
+
+class FakeJobsClient:
+
+    def __init__(self):
+        self.stopped = []
+        self.filters = []
+        self.error = None
+        self.lock = threading.Lock()
+
+    def stop(self, job_id, date_created=None):
+        if date_created is None:
+            date_created = datetime.datetime.now(datetime.timezone.utc)
+
+        with self.lock:
+            self.stopped.append(job_types.JobInfo(job_id=job_id, job_state=job_types.JobState.Stopped,
+                                                  job_status=job_types.JobStatus.Healthy, pipeline_id=PIPELINE_ID,
+                                                  date_created=date_created))
+
+    def stream_jobs(self, job_filter=None, timeout=None):
+        with self.lock:
+            self.filters.append(job_filter)
+
+            if self.error is not None:
+                raise self.error
+
+            # Filtered by creation date as on the server
+            return [job_info for job_info in self.stopped
+                    if (job_filter.created_after is None) or (job_info.date_created > job_filter.created_after)]
+
+
+def test_refresh():
+    client = FakeJobsClient()
+    job_ids = [job_types.JobId('432b274a8f754968888807fe1eba23' + str(index).zfill(2)) for index in range(3)]
+
+    with JobWatcher(client, interval_seconds=60, max_interval_seconds=240) as watcher:
+        watched = [watcher.watch(job_id, pipeline_id=PIPELINE_ID) for job_id in job_ids]
+        client.stop(job_ids[1])
+
+        assert watcher.refresh() == 1
+        assert watched[1].result().job_id == job_ids[1]
+        assert not watched[0].done()
+        assert watcher.watched_jobs == [job_ids[0], job_ids[2]]
+
+        # A single list call covers every watched job, filtered by state and pipeline
+        job_filter = client.filters[-1]
+        assert job_filter.has_job_state == [job_types.JobState.Stopped]
+        assert job_filter.pipeline_ids == [PIPELINE_ID]
+
+        assert watcher.refresh() == 0
+        assert watcher.interval_seconds == 120
+        assert watcher.refresh() == 0
+        assert watcher.refresh() == 0
+        assert watcher.interval_seconds == 240
+
+        client.stop(job_ids[0])
+        assert watcher.refresh() == 1
+        assert watcher.interval_seconds == 60
+
+
+def test_job_filter_without_pipeline():
+    client = FakeJobsClient()
+
+    with JobWatcher(client, interval_seconds=60) as watcher:
+        watcher.watch(job_types.JobId('432b274a8f754968888807fe1eba237b'), pipeline_id=PIPELINE_ID)
+        watcher.watch(job_types.JobId('532b274a8f754968888807fe1eba237b'))
+        watcher.refresh()
+
+        # The pipeline of a watched job is unknown, list calls cannot be limited to pipelines
+        assert client.filters[-1].pipeline_ids == []
+
+
+def test_wait():
+    client = FakeJobsClient()
+    job_ids = [job_types.JobId('432b274a8f754968888807fe1eba237b'), job_types.JobId('532b274a8f754968888807fe1eba237b')]
+    stopped = []
+
+    with JobWatcher(client, interval_seconds=0.01) as watcher:
+        watcher.watch(job_ids[0], callback=stopped.append)
+
+        client.stop(job_ids[1])
+        client.stop(job_ids[0])
+
+        job_infos = watcher.wait(job_ids, timeout=10)
+
+        assert [job_info.job_id for job_info in job_infos] == job_ids
+        assert [job_info.job_id for job_info in stopped] == [job_ids[0]]
+
+        with pytest.raises(Exception):
+            watcher.wait([job_types.JobId('632b274a8f754968888807fe1eba237b')], timeout=0.05)
+
+
+def test_refresh_failure():
+    client = FakeJobsClient()
+    client.error = Exception('List failed')
+    job_id = job_types.JobId('432b274a8f754968888807fe1eba237b')
+
+    with JobWatcher(client, interval_seconds=60, max_interval_seconds=480, max_errors=3) as watcher:
+        future = watcher.watch(job_id)
+
+        # Transient errors leave the job watched, backing off the list calls
+        for interval_seconds in [120, 240]:
+            with pytest.raises(Exception):
+                watcher.refresh()
+
+            assert not future.done()
+            assert watcher.watched_jobs == [job_id]
+            assert watcher.interval_seconds == interval_seconds
+
+        # A successful list call resets the count of errors
+        client.error = None
+        assert watcher.refresh() == 0
+
+        client.error = Exception('List failed')
+        for attempt in range(2):
+            with pytest.raises(Exception):
+                watcher.refresh()
+
+        assert not future.done()
+
+        with pytest.raises(Exception):
+            watcher.refresh()
+
+        assert future.exception() is client.error
+        assert watcher.watched_jobs == []
+
+
+def test_job_filter_created_after():
+    client = FakeJobsClient()
+    margin = datetime.timedelta(seconds=constants.JobWatcherCreatedMarginSeconds)
+    date_created = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1)
+    job_ids = [job_types.JobId('432b274a8f754968888807fe1eba237b'), job_types.JobId('532b274a8f754968888807fe1eba237b')]
+
+    with JobWatcher(client, interval_seconds=60) as watcher:
+        # A job created long before being watched is still found without its creation date
+        future = watcher.watch(job_ids[0])
+        client.stop(job_ids[0], date_created=date_created)
+
+        assert watcher.refresh() == 1
+        assert client.filters[-1].created_after is None
+        assert future.result().job_id == job_ids[0]
+
+        # The bound is derived once the creation dates of all the watched jobs are known
+        future = watcher.watch(job_ids[1], date_created=date_created)
+        client.stop(job_ids[1], date_created=date_created)
+
+        assert watcher.refresh() == 1
+        assert client.filters[-1].created_after == date_created - margin
+        assert future.result().job_id == job_ids[1]
+
+    with JobWatcher(client, interval_seconds=60, created_after=date_created - margin) as watcher:
+        watcher.watch(job_ids[0])
+        watcher.refresh()
+
+        assert client.filters[-1].created_after == date_created - margin
+
+
+def test_refresh_after_close():
+    client = FakeJobsClient()
+    job_ids = [job_types.JobId('432b274a8f754968888807fe1eba237b'), job_types.JobId('532b274a8f754968888807fe1eba237b')]
+
+    watcher = JobWatcher(client, interval_seconds=60)
+    watched = [watcher.watch(job_id) for job_id in job_ids]
+
+    # The jobs stop while the list call is in flight, and the watcher is closed before it returns
+    def stream_jobs(job_filter=None, timeout=None):
+        client.stop(job_ids[0])
+        client.stop(job_ids[1])
+        watcher.close()
+        return list(client.stopped)
+
+    client.stream_jobs = stream_jobs
+
+    assert watcher.refresh() == 0
+    assert all(future.exception() is not None for future in watched)
+
+
+def test_close():
+    watcher = JobWatcher(FakeJobsClient(), interval_seconds=60)
+    future = watcher.watch(job_types.JobId('432b274a8f754968888807fe1eba237b'))
+    watcher.close()
+
+    assert future.exception() is not None
+
+    with pytest.raises(Exception):
+        watcher.watch(job_types.JobId('432b274a8f754968888807fe1eba237b'))
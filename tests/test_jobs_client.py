@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import datetime
+import math
+
+import pytest
 
 import nvidia_clara.grpc.common_pb2 as common_pb2
 import nvidia_clara.grpc.jobs_pb2 as jobs_pb2
 
 from nvidia_clara.base_client import BaseClient
-from nvidia_clara.jobs_client import JobsClient
+from nvidia_clara.jobs_client import JobList, JobsClient
 import nvidia_clara.pipeline_types as pipeline_types
 import nvidia_clara.job_types as job_types
 
@@ -75,6 +79,14 @@ class MockClaraJobsServiceClient:
             stub_method_handlers=MockClaraJobsServiceClient.stub_method_handlers,
             *args, **kwargs)
 
+    def list_jobs_table(self, *args, **kwargs):
+        return run_client_test(
+            'Jobs',
+            'list_jobs_table',
+            run_job_client,
+            stub_method_handlers=MockClaraJobsServiceClient.stub_method_handlers,
+            *args, **kwargs)
+
     def start_job(self, *args, **kwargs):
         return run_client_test(
             'Jobs',
@@ -334,6 +346,194 @@ def test_list_jobs():
         assert list_jobs[1].date_created == datetime.datetime(2021, 3, 8, 18, 6, 31, tzinfo=datetime.timezone.utc)
 
 
+def run_list_jobs_lazy(stub, method_name, *args, **kwargs):
+    with JobsClient(target='10.0.0.1:50051', stub=stub) as client:
+        jobs = getattr(client, method_name)(*args, **kwargs)
+
+        # The stream is received while the jobs are accessed
+        first = jobs[0]
+        return first, list(jobs), len(jobs)
+
+
+def test_list_jobs_lazy():
+    requests = [
+        jobs_pb2.JobsListRequest(
+            header=BaseClient.get_request_header()
+        )
+    ]
+
+    responses = [
+        jobs_pb2.JobsListResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            job_details=jobs_pb2.JobsListResponse.JobDetails(
+                job_name=job_name,
+                job_id=common_pb2.Identifier(
+                    value=job_id
+                ),
+                payload_id=common_pb2.Identifier(
+                    value='532b274a8f754968888807fe1eba237b'
+                ),
+                pipeline_id=common_pb2.Identifier(
+                    value='932b274a8f754968888807fe1eba237b'
+                ),
+                state=jobs_pb2.JOB_STATE_RUNNING,
+                created=common_pb2.Timestamp(
+                    value=63750823591
+                )
+            )
+        ) for job_name, job_id in [("job_1", "432b274a8f754968888807fe1eba237b"),
+                                   ("", ""),
+                                   ("job_2", "212b274a8f754968888807fe1eba237b")]
+    ]
+
+    stub_method_handlers = [(
+        'List',
+        'unary_stream',
+        (
+            requests,
+            responses
+        )
+    )]
+
+    first, list_jobs, length = run_client_test('Jobs', 'list_jobs_lazy', run_list_jobs_lazy,
+                                               stub_method_handlers=stub_method_handlers)
+
+    assert length == 2
+    assert first is list_jobs[0]
+    assert isinstance(first, job_types.JobInfo)
+
+    assert list_jobs[0].name == "job_1"
+    assert list_jobs[0].job_id.value == "432b274a8f754968888807fe1eba237b"
+    assert list_jobs[0].job_state == jobs_pb2.JOB_STATE_RUNNING
+    assert list_jobs[0].date_created == datetime.datetime(2021, 3, 8, 18, 6, 31, tzinfo=datetime.timezone.utc)
+    assert list_jobs[0].date_stopped is None
+
+    assert list_jobs[1].name == "job_2"
+    assert list_jobs[1].payload_id.value == '532b274a8f754968888807fe1eba237b'
+    assert list_jobs[1].pipeline_id.value == '932b274a8f754968888807fe1eba237b'
+
+    # Each job is converted once, so changes to it are kept
+    list_jobs[1].name = "renamed"
+    assert list_jobs[1].name == "renamed"
+
+
+def test_job_list():
+    responses = [
+        jobs_pb2.JobsListResponse(
+            header=common_pb2.ResponseHeader(code=0, messages=[]),
+            job_details=jobs_pb2.JobsListResponse.JobDetails(
+                job_name=job_name,
+                job_id=common_pb2.Identifier(value=job_name + '32b274a8f754968888807fe1eba237b'),
+                payload_id=common_pb2.Identifier(value='532b274a8f754968888807fe1eba237b'),
+                pipeline_id=common_pb2.Identifier(value='932b274a8f754968888807fe1eba237b'),
+                stopped=common_pb2.Timestamp(value=63750823591)
+            )
+        ) for job_name in ['a', 'b', 'c']
+    ]
+
+    # Messages without job id are skipped
+    responses[2:2] = [
+        jobs_pb2.JobsListResponse(header=common_pb2.ResponseHeader(code=0, messages=[])),
+        jobs_pb2.JobsListResponse(
+            job_details=jobs_pb2.JobsListResponse.JobDetails(job_name='empty', state=jobs_pb2.JOB_STATE_RUNNING)
+        ),
+    ]
+
+    jobs = JobList(responses, JobsClient.check_response_header, JobsClient.get_job_info)
+
+    assert jobs[-1].name == 'c'
+    assert len(jobs) == 3
+    assert [job.job_id.value for job in jobs[:2]] == ['a32b274a8f754968888807fe1eba237b',
+                                                      'b32b274a8f754968888807fe1eba237b']
+    assert jobs[1].date_stopped == datetime.datetime(2021, 3, 8, 18, 6, 31, tzinfo=datetime.timezone.utc)
+    assert [job.name for job in jobs] == ['a', 'b', 'c']
+
+
+def test_list_jobs_table():
+    requests = [
+        jobs_pb2.JobsListRequest(
+            header=BaseClient.get_request_header()
+        )
+    ]
+
+    responses = [
+        jobs_pb2.JobsListResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            job_details=jobs_pb2.JobsListResponse.JobDetails(
+                job_name="job_1",
+                job_id=common_pb2.Identifier(value="432b274a8f754968888807fe1eba237b"),
+                pipeline_id=common_pb2.Identifier(value='932b274a8f754968888807fe1eba237b'),
+                state=jobs_pb2.JOB_STATE_STOPPED,
+                status=jobs_pb2.JOB_STATUS_HEALTHY,
+                priority=jobs_pb2.JOB_PRIORITY_HIGHER,
+                created=common_pb2.Timestamp(value=63750823591),
+                started=common_pb2.Timestamp(value=63750823601),
+                stopped=common_pb2.Timestamp(value=63750823661)
+            )
+        ),
+        jobs_pb2.JobsListResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            job_details=jobs_pb2.JobsListResponse.JobDetails(
+                job_name="job_2",
+                job_id=common_pb2.Identifier(value='212b274a8f754968888807fe1eba237b'),
+                pipeline_id=common_pb2.Identifier(value='322b274a8f754968888807fe1eba237b'),
+                state=jobs_pb2.JOB_STATE_PENDING,
+                priority=jobs_pb2.JOB_PRIORITY_NORMAL,
+                created=common_pb2.Timestamp(value=63750823591)
+            )
+        )
+    ]
+
+    stub_method_handlers = [(
+        'List',
+        'unary_stream',
+        (
+            requests,
+            responses
+        )
+    )]
+
+    MockClaraJobsServiceClient.stub_method_handlers = stub_method_handlers
+
+    with MockClaraJobsServiceClient('10.0.0.1:50051') as client:
+        table = client.list_jobs_table()
+
+        created = datetime.datetime(2021, 3, 8, 18, 6, 31, tzinfo=datetime.timezone.utc).timestamp()
+
+        assert len(table) == 2
+        assert list(table.job_ids) == ["432b274a8f754968888807fe1eba237b", '212b274a8f754968888807fe1eba237b']
+        assert list(table.pipeline_ids) == ['932b274a8f754968888807fe1eba237b', '322b274a8f754968888807fe1eba237b']
+        assert list(table.job_states) == [jobs_pb2.JOB_STATE_STOPPED, jobs_pb2.JOB_STATE_PENDING]
+        assert list(table.job_statuses) == [jobs_pb2.JOB_STATUS_HEALTHY, 0]
+        assert list(table.job_priorities) == [jobs_pb2.JOB_PRIORITY_HIGHER, jobs_pb2.JOB_PRIORITY_NORMAL]
+        assert list(table.created) == [created, created]
+        assert table.started[0] - table.created[0] == 10
+        assert table.stopped[0] - table.started[0] == 60
+        assert math.isnan(table.started[1]) and math.isnan(table.stopped[1])
+        assert list(table.to_dict().keys()) == job_types.JobTable.COLUMNS
+
+
+def test_job_table_to_pandas():
+    pandas = pytest.importorskip('pandas')
+
+    table = job_types.JobTable(job_ids=['432b274a8f754968888807fe1eba237b'], job_states=array.array('i', [3]),
+                               job_statuses=array.array('i', [1]), job_priorities=array.array('i', [2]),
+                               pipeline_ids=['932b274a8f754968888807fe1eba237b'], created=array.array('d', [10.0]),
+                               started=array.array('d', [20.0]), stopped=array.array('d', [float('nan')]))
+
+    frame = table.to_pandas()
+
+    assert isinstance(frame, pandas.DataFrame)
+    assert list(frame.columns) == job_types.JobTable.COLUMNS
+    assert (frame['started'] - frame['created']).tolist() == [10.0]
+
+
 def test_start_job():
     requests = [
         jobs_pb2.JobsStartRequest(
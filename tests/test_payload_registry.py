@@ -0,0 +1,130 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+
+import grpc
+import pytest
+
+import nvidia_clara.payload_types as payload_types
+from nvidia_clara.payload_registry import PayloadRegistry
+
+
+class FakeRpcError(grpc.RpcError):
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def code(self):
+        return self.status_code
+
+
+class FakePayloadsClient:
+
+    def __init__(self):
+        self.payloads = {}
+        self.created = 0
+        self.error = None
+        self.upload_error = None
+
+    def create_payload(self):
+        self.created += 1
+        payload_id = payload_types.PayloadId('payload' + str(self.created))
+        self.payloads[payload_id.value] = {}
+        return payload_types.PayloadDetails(payload_id=payload_id, file_details=[])
+
+    def upload_many(self, payload_id, files, parallel_streams=None):
+        if self.upload_error is not None:
+            raise self.upload_error
+        for blob_name, file_path in files.items():
+            with open(file_path, 'rb') as file_object:
+                self.payloads[payload_id.value][blob_name] = file_object.read()
+
+    def delete_payload(self, payload_id):
+        del self.payloads[payload_id.value]
+
+    def iter_details(self, payload_id):
+        # Errors are raised as the stream is received
+        if self.error is not None:
+            raise self.error
+        if payload_id.value not in self.payloads:
+            raise FakeRpcError(grpc.StatusCode.NOT_FOUND)
+        for blob_name, data in self.payloads[payload_id.value].items():
+            yield payload_types.PayloadFileDetails(name=blob_name, size=len(data))
+
+
+def write_dataset(path):
+    os.makedirs(os.path.join(path, 'series'))
+    for index in range(4):
+        with open(os.path.join(path, 'series', str(index) + '.dcm'), 'wb') as file_object:
+            file_object.write(os.urandom(1024 * (index + 1)))
+
+
+def test_hash_dataset(tmp_path):
+    dataset = str(tmp_path / 'dataset')
+    write_dataset(dataset)
+
+    with PayloadRegistry(str(tmp_path / 'registry.db')) as registry:
+        digest = registry.hash_dataset(dataset)
+        assert registry.hash_dataset(dataset) == digest
+
+        os.rename(os.path.join(dataset, 'series', '0.dcm'), os.path.join(dataset, 'series', '4.dcm'))
+        assert registry.hash_dataset(dataset) != digest
+
+
+def test_get_or_upload(tmp_path):
+    dataset = str(tmp_path / 'dataset')
+    write_dataset(dataset)
+    payloads_client = FakePayloadsClient()
+
+    with PayloadRegistry(str(tmp_path / 'registry.db')) as registry:
+        payload_id = registry.get_or_upload(payloads_client, dataset)
+        assert sorted(payloads_client.payloads[payload_id.value].keys()) == ['series/0.dcm', 'series/1.dcm',
+                                                                              'series/2.dcm', 'series/3.dcm']
+
+    # The registry persists across instances, so the dataset is not uploaded again
+    with PayloadRegistry(str(tmp_path / 'registry.db')) as registry:
+        assert registry.get_or_upload(payloads_client, dataset) == payload_id
+        assert payloads_client.created == 1
+
+        # Other errors are raised rather than taken for a deleted payload
+        payloads_client.error = FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+        with pytest.raises(grpc.RpcError):
+            registry.get_or_upload(payloads_client, dataset)
+
+        payloads_client.error = None
+        assert registry.get_or_upload(payloads_client, dataset) == payload_id
+        assert payloads_client.created == 1
+
+        # Payloads deleted from the server are uploaded again
+        del payloads_client.payloads[payload_id.value]
+        assert registry.get_or_upload(payloads_client, dataset) != payload_id
+
+
+def test_get_or_upload_failure(tmp_path):
+    dataset = str(tmp_path / 'dataset')
+    write_dataset(dataset)
+    payloads_client = FakePayloadsClient()
+    payloads_client.upload_error = Exception('Upload failed')
+
+    with PayloadRegistry(str(tmp_path / 'registry.db')) as registry:
+        with pytest.raises(Exception, match='Upload failed'):
+            registry.get_or_upload(payloads_client, dataset)
+
+        # The partially uploaded payload is deleted rather than left on the server, and nothing is registered
+        assert payloads_client.created == 1
+        assert payloads_client.payloads == {}
+        assert registry.lookup(registry.hash_dataset(dataset)) is None
+
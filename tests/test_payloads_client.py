@@ -12,14 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import os
 
+import grpc
+import pytest
+
 import nvidia_clara.grpc.common_pb2 as common_pb2
 import nvidia_clara.grpc.payloads_pb2 as payloads_pb2
 
 from nvidia_clara.base_client import BaseClient
 from nvidia_clara.payloads_client import PayloadsClient
+import nvidia_clara.constants as constants
 import nvidia_clara.payload_types as payload_types
+import nvidia_clara.transfer_tools as transfer_tools
 
 from tests.test_jobs_client import run_client_test
 
@@ -66,6 +72,30 @@ class MockClaraPayloadServiceClient:
             stub_method_handlers=MockClaraPayloadServiceClient.stub_method_handlers,
             *args, **kwargs)
 
+    def upload_directory(self, *args, **kwargs):
+        return run_client_test(
+            'Payloads',
+            'upload_directory',
+            run_payload_client,
+            stub_method_handlers=MockClaraPayloadServiceClient.stub_method_handlers,
+            *args, **kwargs)
+
+    def download_all(self, *args, **kwargs):
+        return run_client_test(
+            'Payloads',
+            'download_all',
+            run_payload_client,
+            stub_method_handlers=MockClaraPayloadServiceClient.stub_method_handlers,
+            *args, **kwargs)
+
+    def sync_directory(self, *args, **kwargs):
+        return run_client_test(
+            'Payloads',
+            'sync_directory',
+            run_payload_client,
+            stub_method_handlers=MockClaraPayloadServiceClient.stub_method_handlers,
+            *args, **kwargs)
+
     def close(self):
         pass
 
@@ -125,6 +155,59 @@ ElementDataFile = highResCT.raw
 '''
 
 
+def run_iter_details(stub, method_name, *args, **kwargs):
+    with PayloadsClient(target='10.0.0.1:50051', stub=stub) as client:
+        details = client.iter_details(*args, **kwargs)
+        # Payload level details are available before any file has been iterated over
+        payload_type = details.payload_type
+        file_names = [file_details.name for file_details in details]
+        return details, payload_type, file_names
+
+
+def test_iter_details():
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+
+    requests = [
+        payloads_pb2.PayloadsDetailsRequest(
+            header=BaseClient.get_request_header(),
+            payload_id=common_pb2.Identifier(value=fake_payload_id))
+    ]
+
+    responses = [
+        payloads_pb2.PayloadsDetailsResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            payload_id=common_pb2.Identifier(value=fake_payload_id),
+            file=payloads_pb2.PayloadFileDetails(mode=0, name='/input/' + str(index) + '.dcm', size=index),
+            type=payloads_pb2.PAYLOAD_TYPE_REUSABLE,
+            metadata={'patient': '1'}
+        )
+        for index in range(3)
+    ]
+
+    stub_method_handlers = [(
+        'Details',
+        'unary_stream',
+        (
+            requests,
+            responses
+        )
+    )]
+
+    details, payload_type, file_names = run_client_test(
+        'Payloads',
+        'iter_details',
+        run_iter_details,
+        stub_method_handlers=stub_method_handlers,
+        payload_id=payload_types.PayloadId(fake_payload_id))
+
+    assert payload_type == payloads_pb2.PAYLOAD_TYPE_REUSABLE
+    assert details.payload_id.value == fake_payload_id
+    assert details.metadata['patient'] == '1'
+    assert file_names == ['/input/0.dcm', '/input/1.dcm', '/input/2.dcm']
+
+
 def test_download_file():
     fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
     fake_request_file_name = '/input/highResCT.mhd'
@@ -183,6 +266,508 @@ def test_download_file():
         assert data == MHD_TEXT
 
 
+def run_iter_download(stub, method_name, *args, **kwargs):
+    with PayloadsClient(target='10.0.0.1:50051', stub=stub) as client:
+        chunks = list(client.iter_download(*args, **kwargs))
+        return [type(chunk) for chunk in chunks], b''.join(chunks)
+
+
+def get_download_handlers(payload_id, blob_name, chunks):
+    return [(
+        'Download',
+        'unary_stream',
+        (
+            [payloads_pb2.PayloadsDownloadRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=payload_id),
+                name=blob_name)],
+            [payloads_pb2.PayloadsDownloadResponse(
+                header=common_pb2.ResponseHeader(
+                    code=0,
+                    messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=blob_name, size=sum(len(c) for c in chunks)),
+                data=chunk
+            ) for chunk in chunks]
+        )
+    )]
+
+
+def test_iter_download():
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+
+    chunk_types, downloaded = run_client_test(
+        'Payloads',
+        'iter_download',
+        run_iter_download,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, [data[:64], data[64:]]),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name)
+
+    assert chunk_types == [memoryview, memoryview]
+    assert downloaded == data
+
+
+def test_download_into():
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    chunks = [data[:64], data[64:]]
+
+    buffer = bytearray(len(data) + 16)
+
+    view = run_client_test(
+        'Payloads',
+        'download_into',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, chunks),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        buffer=buffer)
+
+    assert view.obj is buffer
+    assert bytes(view) == data
+    assert buffer[:len(data)] == data
+
+    # Without a buffer, one of the size of the blob is allocated
+    view = run_client_test(
+        'Payloads',
+        'download_into',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, chunks),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name)
+
+    assert len(view.obj) == len(data)
+    assert bytes(view) == data
+
+    with pytest.raises(Exception, match='smaller than blob'):
+        run_client_test(
+            'Payloads',
+            'download_into',
+            run_payload_client,
+            stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, chunks),
+            payload_id=payload_types.PayloadId(fake_payload_id),
+            blob_name=fake_request_file_name,
+            buffer=bytearray(16))
+
+
+def test_download_memory_map(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    dest_path = tmp_path / 'highResCT.mhd'
+
+    file_details = run_client_test(
+        'Payloads',
+        'download_from',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, [data[:64], data[64:]]),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        dest_path=str(dest_path),
+        memory_map=True)
+
+    assert file_details.size == len(data)
+    assert dest_path.read_bytes() == data
+
+
+def test_download_memory_map_failure(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    dest_path = tmp_path / 'highResCT.mhd'
+
+    # Fewer bytes than announced by the first message must not pass for a complete download
+    truncated = get_download_handlers(fake_payload_id, fake_request_file_name, [data])
+    truncated[0][2][1][0].data = data[:64]
+
+    with pytest.raises(Exception, match='Received 64 of the'):
+        run_client_test(
+            'Payloads',
+            'download_from',
+            run_payload_client,
+            stub_method_handlers=truncated,
+            payload_id=payload_types.PayloadId(fake_payload_id),
+            blob_name=fake_request_file_name,
+            dest_path=str(dest_path),
+            memory_map=True)
+
+    # No zero filled file of the size of the blob is left behind
+    assert not dest_path.exists()
+
+
+def test_download_write_behind(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    chunks = [data[offset:offset + 32] for offset in range(0, len(data), 32)]
+    dest_path = tmp_path / 'highResCT.mhd'
+
+    file_details = run_client_test(
+        'Payloads',
+        'download_from',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, chunks),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        dest_path=str(dest_path),
+        write_behind=2)
+
+    assert file_details.size == len(data)
+    assert dest_path.read_bytes() == data
+
+
+def test_download_resumable(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    dest_path = tmp_path / 'highResCT.mhd'
+    checkpoint_path = str(tmp_path / 'download.json')
+
+    # An interrupted download left 64 confirmed bytes, followed by bytes written after the last confirmation
+    dest_path.write_bytes(data[:64] + b'unconfirmed')
+    transfer_tools.TransferCheckpoint(checkpoint_path, fake_payload_id).confirm(
+        fake_request_file_name, fake_request_file_name, len(data), 0, 64)
+
+    file_details = run_client_test(
+        'Payloads',
+        'download_from',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, [data[:48], data[48:]]),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        dest_path=str(dest_path),
+        checkpoint_path=checkpoint_path)
+
+    assert file_details.size == len(data)
+    assert dest_path.read_bytes() == data
+    assert transfer_tools.TransferCheckpoint(checkpoint_path, fake_payload_id).is_complete(
+        fake_request_file_name, len(data))
+
+    # A complete download is not requested again
+    file_details = run_client_test(
+        'Payloads',
+        'download_from',
+        run_payload_client,
+        stub_method_handlers=[],
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        dest_path=str(dest_path),
+        checkpoint_path=checkpoint_path,
+        _test_client_only=True)
+
+    assert file_details.name == fake_request_file_name
+    assert file_details.size == len(data)
+
+
+def test_download_resumable_size_changed(tmp_path, monkeypatch):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    dest_path = tmp_path / 'highResCT.mhd'
+    checkpoint_path = str(tmp_path / 'download.json')
+
+    # The checkpoint confirmed 64 bytes of a blob of another size, which is downloaded again from its start
+    dest_path.write_bytes(data[:64])
+    transfer_tools.TransferCheckpoint(checkpoint_path, fake_payload_id).confirm(
+        fake_request_file_name, fake_request_file_name, len(data) + 1, 0, 64)
+
+    confirmations = []
+    confirm = transfer_tools.TransferCheckpoint.confirm
+
+    def record_confirm(self, blob_name, name, size, mode, confirmed, save=True):
+        confirmations.append(confirmed)
+        confirm(self, blob_name, name, size, mode, confirmed, save=save)
+
+    monkeypatch.setattr(constants, 'TransferCheckpointBytesInterval', 16)
+    monkeypatch.setattr(transfer_tools.TransferCheckpoint, 'confirm', record_confirm)
+
+    run_client_test(
+        'Payloads',
+        'download_from',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name,
+                                                   [data[:16], data[16:32], data[32:]]),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        dest_path=str(dest_path),
+        checkpoint_path=checkpoint_path)
+
+    # Progress of the new download is confirmed from its start rather than past the stale confirmation
+    assert confirmations == [16, 32, len(data), len(data)]
+    assert dest_path.read_bytes() == data
+
+
+def test_upload_many_resumable(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    checkpoint_path = str(tmp_path / 'upload.json')
+
+    (tmp_path / 'a.txt').write_bytes(b'hello')
+    (tmp_path / 'b.txt').write_bytes(b'world')
+
+    files = {'a.txt': str(tmp_path / 'a.txt'), 'b.txt': str(tmp_path / 'b.txt')}
+
+    stub_method_handlers = [(
+        'Details',
+        'unary_stream',
+        (
+            [payloads_pb2.PayloadsDetailsRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id))],
+            [payloads_pb2.PayloadsDetailsResponse(
+                header=common_pb2.ResponseHeader(
+                    code=0,
+                    messages=[]),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                file=payloads_pb2.PayloadFileDetails(mode=0, name=name, size=size),
+                type=payloads_pb2.PAYLOAD_TYPE_REUSABLE
+            ) for name, size in [('/a.txt', 5), ('/b.txt', 2)]]
+        )
+    ), (
+        'Remove',
+        'unary_unary',
+        (
+            [payloads_pb2.PayloadsRemoveRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                name='./b.txt')],
+            [payloads_pb2.PayloadsRemoveResponse(header=common_pb2.ResponseHeader(code=0, messages=[]))]
+        )
+    ), (
+        'Upload',
+        'stream_unary',
+        (
+            [payloads_pb2.PayloadsUploadRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name='b.txt', size=5),
+                data=b'world'
+            )],
+            [payloads_pb2.PayloadsUploadResponse(
+                header=common_pb2.ResponseHeader(
+                    code=0,
+                    messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name='/b.txt', size=5)
+            )]
+        )
+    )]
+
+    stats = run_client_test(
+        'Payloads',
+        'upload_many',
+        run_payload_client,
+        stub_method_handlers=stub_method_handlers,
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        files=files,
+        parallel_streams=1,
+        checkpoint_path=checkpoint_path)
+
+    assert [details.name for details in stats.file_details] == ['/b.txt']
+
+    checkpoint = transfer_tools.TransferCheckpoint(checkpoint_path, fake_payload_id)
+
+    assert checkpoint.is_complete('a.txt', 5)
+    assert checkpoint.is_complete('b.txt', 5)
+
+    # Blobs recorded as complete are skipped without listing the payload again
+    stats = run_client_test(
+        'Payloads',
+        'upload_many',
+        run_payload_client,
+        stub_method_handlers=[],
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        files=files,
+        parallel_streams=1,
+        checkpoint_path=checkpoint_path)
+
+    assert stats.file_details == []
+
+
+def test_download_progress(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_request_file_name = '/input/highResCT.mhd'
+    data = MHD_TEXT.encode('utf-8')
+    reports = []
+
+    run_client_test(
+        'Payloads',
+        'download_from',
+        run_payload_client,
+        stub_method_handlers=get_download_handlers(fake_payload_id, fake_request_file_name, [data[:64], data[64:]]),
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_request_file_name,
+        dest_path=str(tmp_path / 'highResCT.mhd'),
+        progress=reports.append)
+
+    assert reports[-1].done
+    assert reports[-1].name == fake_request_file_name
+    assert reports[-1].total_bytes == len(data)
+    assert reports[-1].bytes_transferred == len(data)
+    assert reports[-1].chunks == 2
+
+
+def test_download_all(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    blobs = {
+        '/input/highResCT.mhd': b'input',
+        '/operators/dicom-reader/highResCT.mhd': MHD_TEXT.encode('utf-8'),
+        '/operators/dicom-writer/output.dcm': b'dicom',
+    }
+
+    details_responses = [
+        payloads_pb2.PayloadsDetailsResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            payload_id=common_pb2.Identifier(value=fake_payload_id),
+            file=payloads_pb2.PayloadFileDetails(mode=0, name=name, size=len(data)),
+            type=payloads_pb2.PAYLOAD_TYPE_PIPELINE
+        )
+        for name, data in blobs.items()
+    ]
+
+    stub_method_handlers = [(
+        'Details',
+        'unary_stream',
+        (
+            [payloads_pb2.PayloadsDetailsRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id))],
+            details_responses
+        )
+    )]
+
+    for name in ['/operators/dicom-reader/highResCT.mhd', '/operators/dicom-writer/output.dcm']:
+        stub_method_handlers.append((
+            'Download',
+            'unary_stream',
+            (
+                [payloads_pb2.PayloadsDownloadRequest(
+                    header=BaseClient.get_request_header(),
+                    payload_id=common_pb2.Identifier(value=fake_payload_id),
+                    name='.' + name)],
+                [payloads_pb2.PayloadsDownloadResponse(
+                    header=common_pb2.ResponseHeader(
+                        code=0,
+                        messages=[]),
+                    details=payloads_pb2.PayloadFileDetails(mode=0, name=name, size=len(blobs[name])),
+                    data=blobs[name]
+                )]
+            )
+        ))
+
+    MockClaraPayloadServiceClient.stub_method_handlers = stub_method_handlers
+
+    with MockClaraPayloadServiceClient('localhost:50051') as client:
+        stats = client.download_all(payload_id=payload_types.PayloadId(fake_payload_id), dest_dir=str(tmp_path),
+                                    include='operators/*', parallelism=1)
+
+    assert [details.name for details in stats.file_details] == ['/operators/dicom-reader/highResCT.mhd',
+                                                              '/operators/dicom-writer/output.dcm']
+    assert stats.total_bytes == len(MHD_TEXT) + len(b'dicom')
+    assert (tmp_path / 'operators' / 'dicom-reader' / 'highResCT.mhd').read_bytes() == MHD_TEXT.encode('utf-8')
+    assert (tmp_path / 'operators' / 'dicom-writer' / 'output.dcm').read_bytes() == b'dicom'
+    assert not (tmp_path / 'input').exists()
+
+
+def test_sync_directory(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    unchanged_key = PayloadsClient.get_sync_metadata_key('a.txt')
+    new_key = PayloadsClient.get_sync_metadata_key('b.txt')
+    deleted_key = PayloadsClient.get_sync_metadata_key('c.txt')
+
+    (tmp_path / 'a.txt').write_bytes(b'hello')
+    (tmp_path / 'b.txt').write_bytes(b'new')
+
+    details_responses = [
+        payloads_pb2.PayloadsDetailsResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            payload_id=common_pb2.Identifier(value=fake_payload_id),
+            file=payloads_pb2.PayloadFileDetails(mode=0, name=name, size=size),
+            type=payloads_pb2.PAYLOAD_TYPE_REUSABLE,
+            metadata={unchanged_key: hashlib.sha256(b'hello').hexdigest(), deleted_key: 'digest'}
+        )
+        for name, size in [('/a.txt', 5), ('/c.txt', 7)]
+    ]
+
+    stub_method_handlers = [(
+        'Details',
+        'unary_stream',
+        (
+            [payloads_pb2.PayloadsDetailsRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id))],
+            details_responses
+        )
+    ), (
+        'Remove',
+        'unary_unary',
+        (
+            [payloads_pb2.PayloadsRemoveRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                name='./c.txt')],
+            [payloads_pb2.PayloadsRemoveResponse(header=common_pb2.ResponseHeader(code=0, messages=[]))]
+        )
+    ), (
+        'Upload',
+        'stream_unary',
+        (
+            [payloads_pb2.PayloadsUploadRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name='b.txt', size=3),
+                data=b'new')],
+            [payloads_pb2.PayloadsUploadResponse(
+                header=common_pb2.ResponseHeader(code=0, messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name='b.txt', size=3))]
+        )
+    ), (
+        'RemoveMetadata',
+        'unary_unary',
+        (
+            [payloads_pb2.PayloadsRemoveMetadataRequest(
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                keys=[deleted_key])],
+            [payloads_pb2.PayloadsRemoveMetadataResponse(header=common_pb2.ResponseHeader(code=0, messages=[]))]
+        )
+    ), (
+        'AddMetadata',
+        'unary_unary',
+        (
+            [payloads_pb2.PayloadsAddMetadataRequest(
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                metadata={new_key: hashlib.sha256(b'new').hexdigest()})],
+            [payloads_pb2.PayloadsAddMetadataResponse(header=common_pb2.ResponseHeader(code=0, messages=[]))]
+        )
+    )]
+
+    MockClaraPayloadServiceClient.stub_method_handlers = stub_method_handlers
+
+    with MockClaraPayloadServiceClient('localhost:50051') as client:
+        result = client.sync_directory(payload_id=payload_types.PayloadId(fake_payload_id), local_dir=str(tmp_path),
+                                       content_hash=True, parallel_streams=1)
+
+    assert [details.name for details in result.uploaded.file_details] == ['b.txt']
+    assert result.removed == ['/c.txt']
+    assert result.unchanged == ['a.txt']
+    assert len(new_key) <= constants.MetadataKeySizeMaximum
+
+
+def test_get_relative_path():
+    assert PayloadsClient.get_relative_path('/operators/reader/image.raw') == 'operators/reader/image.raw'
+    assert PayloadsClient.get_relative_path('./input/image.mhd') == 'input/image.mhd'
+    # Blob names cannot escape the destination directory
+    assert PayloadsClient.get_relative_path('/../../etc/passwd') == 'etc/passwd'
+
+    with pytest.raises(Exception):
+        PayloadsClient.get_relative_path('/')
+
+
 def test_upload(tmp_path):
     fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
     fake_file_name = './image.mhd'
@@ -237,3 +822,220 @@ def test_upload(tmp_path):
         assert file_details.mode == 0
         assert file_details.name == fake_response_file_name
         assert file_details.size == len(MHD_TEXT)
+
+
+def test_upload_stream():
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_blob_name = './input/generated.dcm'
+    data = bytes(range(256)) * 10
+
+    stub_method_handlers = [(
+        'Upload',
+        'stream_unary',
+        (
+            [payloads_pb2.PayloadsUploadRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=fake_blob_name, size=len(chunk)),
+                data=chunk
+            ) for chunk in [data[:1024], data[1024:2048], data[2048:]]],
+            [payloads_pb2.PayloadsUploadResponse(
+                header=common_pb2.ResponseHeader(
+                    code=0,
+                    messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=fake_blob_name, size=len(data))
+            )]
+        )
+    )]
+
+    file_details = run_client_test(
+        'Payloads',
+        'upload_stream',
+        run_payload_client,
+        stub_method_handlers=stub_method_handlers,
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        blob_name=fake_blob_name,
+        chunks=(data[offset:offset + 700] for offset in range(0, len(data), 700)),
+        chunk_size=1024)
+
+    assert file_details.name == fake_blob_name
+    assert file_details.size == len(data)
+
+
+def test_upload_directory(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_blob_names = ['./input/a/image.mhd', './input/b/image.mhd']
+
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+    (tmp_path / 'a' / 'image.mhd').write_text(MHD_TEXT)
+    (tmp_path / 'b' / 'image.mhd').write_text(MHD_TEXT)
+
+    stub_method_handlers = []
+
+    for blob_name in fake_blob_names:
+        requests = [
+            payloads_pb2.PayloadsUploadRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=blob_name, size=len(MHD_TEXT)),
+                data=MHD_TEXT.encode('utf-8')
+            )
+        ]
+        responses = [
+            payloads_pb2.PayloadsUploadResponse(
+                header=common_pb2.ResponseHeader(
+                    code=0,
+                    messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=blob_name, size=len(MHD_TEXT))
+            )
+        ]
+        stub_method_handlers.append((
+            'Upload',
+            'stream_unary',
+            (
+                requests,
+                responses
+            )
+        ))
+
+    MockClaraPayloadServiceClient.stub_method_handlers = stub_method_handlers
+
+    with MockClaraPayloadServiceClient('localhost:50051') as client:
+        stats = client.upload_directory(payload_id=payload_types.PayloadId(fake_payload_id),
+                                        source_dir=str(tmp_path), blob_prefix='./input/', parallel_streams=1)
+
+        assert [details.name for details in stats.file_details] == fake_blob_names
+        assert stats.total_bytes == 2 * len(MHD_TEXT)
+        assert stats.parallel_streams == 1
+
+
+def test_upload_many_largest_first(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+
+    (tmp_path / 'small.txt').write_bytes(b'hi')
+    (tmp_path / 'large.txt').write_bytes(b'hello world')
+    (tmp_path / 'medium.txt').write_bytes(b'hello')
+
+    files = {name: str(tmp_path / name) for name in ['small.txt', 'large.txt', 'medium.txt']}
+
+    # Calls are expected largest first, whatever the order of "files"
+    stub_method_handlers = [(
+        'Upload',
+        'stream_unary',
+        (
+            [payloads_pb2.PayloadsUploadRequest(
+                header=BaseClient.get_request_header(),
+                payload_id=common_pb2.Identifier(value=fake_payload_id),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name=name, size=len(data)),
+                data=data
+            )],
+            [payloads_pb2.PayloadsUploadResponse(
+                header=common_pb2.ResponseHeader(
+                    code=0,
+                    messages=[]),
+                details=payloads_pb2.PayloadFileDetails(mode=0, name='/' + name, size=len(data))
+            )]
+        )
+    ) for name, data in [('large.txt', b'hello world'), ('medium.txt', b'hello'), ('small.txt', b'hi')]]
+
+    stats = run_client_test(
+        'Payloads',
+        'upload_many',
+        run_payload_client,
+        stub_method_handlers=stub_method_handlers,
+        payload_id=payload_types.PayloadId(fake_payload_id),
+        files=files,
+        parallel_streams=1)
+
+    # Results follow the order of "files"
+    assert [details.name for details in stats.file_details] == ['/small.txt', '/large.txt', '/medium.txt']
+    assert stats.total_bytes == 18
+    assert stats.parallel_streams == 1
+
+def test_get_parallel_streams(monkeypatch):
+    monkeypatch.delenv('GRPC_PARALLEL_STREAMS', raising=False)
+    assert BaseClient.get_parallel_streams() == 8
+    assert BaseClient.get_parallel_streams(4) == 4
+
+    monkeypatch.setenv('GRPC_PARALLEL_STREAMS', '16')
+    assert BaseClient.get_parallel_streams() == 16
+
+    with pytest.raises(Exception):
+        BaseClient.get_parallel_streams(65)
+
+
+def test_upload_chunk_size(tmp_path):
+    fake_payload_id = '7ac5c691e13d4f45894a3a70d9925936'
+    fake_response_file_name = './input/image.raw'
+    data = bytes(range(256)) * 10
+
+    requests = [
+        payloads_pb2.PayloadsUploadRequest(
+            header=BaseClient.get_request_header(),
+            payload_id=common_pb2.Identifier(value=fake_payload_id),
+            details=payloads_pb2.PayloadFileDetails(mode=0, name=fake_response_file_name,
+                                                    size=len(data[offset:offset + 1024])),
+            data=data[offset:offset + 1024]
+        )
+        for offset in range(0, len(data), 1024)
+    ]
+    responses = [
+        payloads_pb2.PayloadsUploadResponse(
+            header=common_pb2.ResponseHeader(
+                code=0,
+                messages=[]),
+            details=payloads_pb2.PayloadFileDetails(mode=0, name=fake_response_file_name, size=len(data))
+        )
+    ]
+
+    stub_method_handlers = [(
+        'Upload',
+        'stream_unary',
+        (
+            requests,
+            responses
+        )
+    )]
+
+    MockClaraPayloadServiceClient.stub_method_handlers = stub_method_handlers
+
+    source_path = tmp_path / 'image.raw'
+    source_path.write_bytes(data)
+
+    with MockClaraPayloadServiceClient('localhost:50051') as client:
+        file_details = client.upload(payload_id=payload_types.PayloadId(fake_payload_id),
+                                     blob_name=fake_response_file_name, file_path=str(source_path), chunk_size=1024,
+                                     read_ahead=2)
+
+        assert len(requests) == 3
+        assert file_details.size == len(data)
+
+
+def test_get_chunk_size(monkeypatch):
+    monkeypatch.delenv('GRPC_CHUNK_SIZE', raising=False)
+    assert BaseClient.get_chunk_size() == 1024 * 1024
+    assert BaseClient.get_chunk_size(64 * 1024) == 64 * 1024
+
+    monkeypatch.setenv('GRPC_CHUNK_SIZE', '2048')
+    assert BaseClient.get_chunk_size() == 2048
+
+    with pytest.raises(Exception):
+        BaseClient.get_chunk_size(512)
+
+    with pytest.raises(Exception):
+        BaseClient.get_chunk_size(4 * 1024 * 1024)
+
+
+def test_get_compression():
+    assert BaseClient.get_compression() is None
+    assert BaseClient.get_compression(None, size=10 * 1024 * 1024) is None
+    assert BaseClient.get_compression(grpc.Compression.Gzip, size=None) == grpc.Compression.Gzip
+    assert BaseClient.get_compression(grpc.Compression.Gzip, size=1024) == grpc.Compression.NoCompression
+    assert BaseClient.get_compression(grpc.Compression.Gzip, size=64 * 1024) == grpc.Compression.Gzip
+    assert BaseClient.get_compression(grpc.Compression.Deflate, size=1024, threshold=0) == grpc.Compression.Deflate
+
+
+def test_request_header_is_shared():
+    assert BaseClient.get_request_header() is BaseClient.get_request_header()
+    assert BaseClient.get_request_header() == BaseClient.create_request_header()
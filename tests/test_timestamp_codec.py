@@ -0,0 +1,99 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import array
+import datetime
+import math
+
+import nvidia_clara.constants as constants
+import nvidia_clara.grpc.common_pb2 as common_pb2
+import nvidia_clara.timestamp_codec as timestamp_codec
+from nvidia_clara.clara_client import ClaraClient
+from nvidia_clara.jobs_client import JobsClient
+
+EPOCH_SECONDS = 1615226791
+UTC_DATE = datetime.datetime(2021, 3, 8, 18, 6, 31, tzinfo=datetime.timezone.utc)
+
+
+def test_offsets():
+    # Jobs count seconds from year one, Clara from year zero, a leap year of 366 days
+    assert constants.TimestampOffsetYearOne == 62135596800
+    assert constants.TimestampOffsetYearZero == 62167219200
+    assert constants.TimestampOffsetYearZero - constants.TimestampOffsetYearOne == 366 * 24 * 60 * 60
+
+    assert timestamp_codec.JOBS.offset_seconds == constants.TimestampOffsetYearOne
+    assert timestamp_codec.CLARA.offset_seconds == constants.TimestampOffsetYearZero
+
+
+def test_jobs_timestamp():
+    timestamp = common_pb2.Timestamp(value=EPOCH_SECONDS + 62135596800)
+
+    assert JobsClient.get_timestamp(timestamp) == UTC_DATE
+    assert JobsClient.get_timestamp(timestamp).tzinfo == datetime.timezone.utc
+    assert timestamp_codec.JOBS.decode(EPOCH_SECONDS + 62135596800) == UTC_DATE
+    assert JobsClient.get_timestamp(common_pb2.Timestamp()) is None
+    assert JobsClient.get_timestamp(None) is None
+    assert JobsClient.get_timestamp("") is None
+
+
+def test_clara_timestamp():
+    timestamp = common_pb2.Timestamp(value=EPOCH_SECONDS + 62167219200)
+
+    assert ClaraClient.get_timestamp(timestamp) == datetime.datetime.fromtimestamp(EPOCH_SECONDS)
+    assert ClaraClient.get_timestamp(timestamp).tzinfo is None
+    assert ClaraClient.get_timestamp(common_pb2.Timestamp(value=62135596800)) is None
+
+
+def test_parse_timestamp():
+    timestamp_codec.parse_timestamp.cache_clear()
+
+    assert ClaraClient.get_timestamp("2021-03-08 18:06:31Z") == datetime.datetime(2021, 3, 8, 18, 6, 31)
+    assert JobsClient.get_timestamp("2021-03-08 18:06:31Z") == \
+        datetime.datetime(2021, 3, 8, 18, 6, 31).astimezone(datetime.timezone.utc)
+
+    first = JobsClient.get_timestamp("2021-03-08 18:06:31Z")
+    assert JobsClient.get_timestamp("2021-03-08 18:06:31Z") is first
+    assert timestamp_codec.parse_timestamp.cache_info().hits >= 2
+
+
+def test_decode_many():
+    codec = timestamp_codec.JOBS
+    values = [common_pb2.Timestamp(value=EPOCH_SECONDS + 62135596800), EPOCH_SECONDS + 62135596801,
+              common_pb2.Timestamp(), None, "2021-03-08 18:06:31Z"]
+
+    assert codec.decode_many(values) == [codec.decode(value) for value in values]
+    assert codec.decode_many(values)[:2] == [UTC_DATE, UTC_DATE + datetime.timedelta(seconds=1)]
+
+
+def test_to_epoch_seconds():
+    codec = timestamp_codec.JOBS
+
+    assert codec.to_epoch_seconds(common_pb2.Timestamp(value=EPOCH_SECONDS + 62135596800)) == EPOCH_SECONDS
+    assert codec.to_epoch_seconds("2021-03-08 18:06:31Z") == \
+        datetime.datetime(2021, 3, 8, 18, 6, 31).timestamp()
+    assert math.isnan(codec.to_epoch_seconds(common_pb2.Timestamp()))
+
+    seconds = codec.to_epoch_seconds_many(array.array('q', [EPOCH_SECONDS + 62135596800, 0]))
+
+    assert seconds[0] == EPOCH_SECONDS
+    assert math.isnan(seconds[1])
+    assert list(codec.to_epoch_seconds_many([EPOCH_SECONDS + 62135596800])) == [EPOCH_SECONDS]
+
+
+def test_encode():
+    assert timestamp_codec.JOBS.encode(UTC_DATE) == EPOCH_SECONDS + 62135596800
+    assert timestamp_codec.JOBS.encode(datetime.datetime(2021, 3, 8, 18, 6, 31)) == EPOCH_SECONDS + 62135596800
+    assert timestamp_codec.CLARA.encode(UTC_DATE) == EPOCH_SECONDS + 62167219200
+    assert timestamp_codec.JOBS.decode(timestamp_codec.JOBS.encode(UTC_DATE)) == UTC_DATE
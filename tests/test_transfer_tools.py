@@ -0,0 +1,226 @@
+# Copyright (c) 2020, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import threading
+import time
+
+import pytest
+
+import nvidia_clara.transfer_tools as transfer_tools
+
+
+def test_read_chunks():
+    source = io.BytesIO(b'x' * 2500)
+
+    chunks = list(transfer_tools.read_chunks(source, chunk_size=1024))
+
+    assert [len(chunk) for chunk in chunks] == [1024, 1024, 452]
+
+
+def test_rechunk():
+    pieces = [b'a' * 700, bytearray(b'b' * 700), memoryview(b'c' * 1100), b'', b'd' * 1024]
+
+    chunks = list(transfer_tools.rechunk(pieces, chunk_size=1024))
+
+    assert [len(chunk) for chunk in chunks] == [1024, 1024, 1024, 452]
+    assert all(type(chunk) is bytes for chunk in chunks)
+    assert b''.join(chunks) == b''.join(bytes(piece) for piece in pieces)
+
+    # Chunks of the right size are passed through without a copy
+    chunk = b'x' * 1024
+    assert next(transfer_tools.rechunk([chunk], chunk_size=1024)) is chunk
+
+
+def test_adaptive_chunk_size_grows_while_throughput_improves():
+    adaptive = transfer_tools.AdaptiveChunkSize(initial_size=64 * 1024, maximum_size=512 * 1024, window=2)
+
+    # Fixed per-chunk cost: larger chunks give better throughput
+    while not adaptive.settled:
+        adaptive.record(adaptive.size, 0.001)
+
+    assert adaptive.size == 512 * 1024
+
+
+def test_adaptive_chunk_size_settles_on_best_size():
+    adaptive = transfer_tools.AdaptiveChunkSize(initial_size=64 * 1024, maximum_size=1024 * 1024, window=2)
+
+    # Fixed bandwidth: doubling the chunk size does not improve throughput
+    while not adaptive.settled:
+        adaptive.record(adaptive.size, adaptive.size / 1e8)
+
+    assert adaptive.size == 64 * 1024
+
+
+def test_mapped_file_writer(tmp_path):
+    data = bytes(range(256)) * 1024
+    file_path = tmp_path / 'volume.raw'
+
+    # A window smaller than the file, and chunks straddling windows, force the map to slide mid-chunk
+    with transfer_tools.MappedFileWriter(str(file_path), len(data), window_size=64 * 1024) as writer:
+        assert file_path.stat().st_size == len(data)
+
+        for offset in range(0, len(data), 48 * 1024):
+            writer.write(data[offset:offset + 48 * 1024])
+
+        assert writer.position == len(data)
+
+        with pytest.raises(Exception, match='exceeds the size'):
+            writer.write(b'x')
+
+    assert file_path.read_bytes() == data
+
+
+def test_mapped_file_writer_empty_file(tmp_path):
+    file_path = tmp_path / 'empty.raw'
+    file_path.write_bytes(b'stale')
+
+    with transfer_tools.MappedFileWriter(str(file_path), 0) as writer:
+        writer.write(b'')
+
+    assert file_path.read_bytes() == b''
+
+
+def test_read_ahead_reader():
+    data = bytes(range(256)) * 100
+    source = io.BytesIO(data)
+
+    with transfer_tools.ReadAheadReader(source, depth=2, max_bytes=4096) as reader:
+        chunks = list(transfer_tools.read_chunks(reader, chunk_size=1024))
+
+    assert b''.join(chunks) == data
+
+
+def test_read_ahead_reader_bounds_buffering():
+    source = io.BytesIO(b'x' * 1024 * 1024)
+
+    reader = transfer_tools.ReadAheadReader(source, depth=64, max_bytes=4096)
+    reader.read(1024)
+
+    # Give the producer time to fill the buffer, it must stop at "max_bytes"
+    time.sleep(0.2)
+    assert source.tell() <= 1024 + 4096 + 1024
+
+    reader.close()
+
+
+def test_read_ahead_reader_propagates_errors():
+    class FailingSource:
+        def read(self, size):
+            raise IOError("disk failure")
+
+    with transfer_tools.ReadAheadReader(FailingSource()) as reader:
+        with pytest.raises(IOError):
+            reader.read(1024)
+
+
+def test_write_behind_writer():
+    data = bytes(range(256)) * 100
+    dest = io.BytesIO()
+
+    with transfer_tools.WriteBehindWriter(dest, depth=2, max_bytes=4096) as writer:
+        for chunk in transfer_tools.read_chunks(io.BytesIO(data), chunk_size=1024):
+            writer.write(chunk)
+
+    assert dest.getvalue() == data
+
+
+def test_write_behind_writer_bounds_buffering():
+    release = threading.Event()
+
+    class SlowDestination:
+        def __init__(self):
+            self.written = 0
+
+        def write(self, data):
+            release.wait()
+            self.written += len(data)
+
+    writer = transfer_tools.WriteBehindWriter(SlowDestination(), depth=64, max_bytes=4096)
+    queued = []
+
+    def produce():
+        for _ in range(16):
+            writer.write(b'x' * 1024)
+            queued.append(1024)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+
+    # The destination is stalled, so writes must block once "max_bytes" are queued
+    time.sleep(0.2)
+    assert sum(queued) <= 4096 + 1024
+
+    release.set()
+    producer.join()
+    writer.close()
+
+    assert sum(queued) == 16 * 1024
+
+
+def test_write_behind_writer_propagates_errors():
+    class FailingDestination:
+        def write(self, data):
+            raise IOError("disk full")
+
+    writer = transfer_tools.WriteBehindWriter(FailingDestination())
+    writer.write(b'x')
+
+    with pytest.raises(IOError):
+        writer.close()
+
+
+def test_transfer_checkpoint(tmp_path):
+    checkpoint_path = str(tmp_path / 'transfer.json')
+
+    checkpoint = transfer_tools.TransferCheckpoint(checkpoint_path, 'payload-1')
+    checkpoint.confirm('./a.raw', '/a.raw', 100, 0, 40)
+    checkpoint.confirm('./b.raw', '/b.raw', 10, 0, 10)
+
+    # Progress survives the process, for the same payload only
+    checkpoint = transfer_tools.TransferCheckpoint(checkpoint_path, 'payload-1')
+
+    assert checkpoint.get('./a.raw') == {'name': '/a.raw', 'size': 100, 'mode': 0, 'confirmed': 40}
+    assert not checkpoint.is_complete('./a.raw', 100)
+    assert checkpoint.is_complete('./b.raw', 10)
+    assert not checkpoint.is_complete('./b.raw', 11)
+
+    assert transfer_tools.TransferCheckpoint(checkpoint_path, 'payload-2').get('./a.raw') is None
+
+
+def test_progress_monitor():
+    reports = []
+
+    # With no interval every chunk is reported
+    monitor = transfer_tools.ProgressMonitor(reports.append, 'volume.raw', total_bytes=2500, interval_seconds=0)
+    chunks = list(monitor.track(transfer_tools.read_chunks(io.BytesIO(b'x' * 2500), chunk_size=1024)))
+    monitor.finish()
+
+    assert len(chunks) == 3
+    assert [report.bytes_transferred for report in reports] == [1024, 2048, 2500, 2500]
+    assert [report.chunks for report in reports] == [1, 2, 3, 3]
+    assert [report.done for report in reports] == [False, False, False, True]
+    assert all(report.name == 'volume.raw' and report.total_bytes == 2500 for report in reports)
+    assert reports[-1].elapsed_seconds >= reports[0].elapsed_seconds
+
+    # Within the interval only the completion is reported
+    reports.clear()
+    monitor = transfer_tools.ProgressMonitor(reports.append, 'volume.raw', interval_seconds=60)
+    for _ in range(100):
+        monitor.update(1024)
+    monitor.finish()
+
+    assert len(reports) == 1
+    assert reports[0].done
+    assert reports[0].bytes_transferred == 100 * 1024